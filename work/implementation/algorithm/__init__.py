@@ -1,8 +1,14 @@
+from .box_catalog import BoxCatalog
 from .box_definition import BoxDefinition
 from .box_input_reader import BoxInputReader
 from .box_result import BoxResult
+from .coordinate_store import CoordinateStore
+from .extreme_point_layer_result import ExtremePointLayerResult
 from .fragment import Fragment
+from .fragment_index import FragmentIndex
 from .layer_result import LayerResult
+from .maximal_space_layer_result import MaximalSpaceLayerResult
+from .order_builder import OrderBuilder
 from .order_input_reader import OrderInputReader
 from .order_manager import OrderManager
 from .order_result import OrderResult
@@ -10,10 +16,15 @@ from .order import Order
 from .hello_world import HelloWorld
 from .packer import Packer
 from .position import Position
+from .product_catalog import ProductCatalog
 from .product_input_reader import ProductInputReader
-from .product import Product
+from .product import Product, ProductDefinition
 from .rotation_type import RotationType
+from .skyline_layer_result import SkylineLayerResult
+from .snapshot_cache import SnapshotCache
+from .spatial_index import SpatialGrid
 from .system import System
+from .tracing import Tracer
 
 # Package-level variable
 __version__ = '1.0.0'
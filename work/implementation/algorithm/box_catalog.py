@@ -0,0 +1,187 @@
+from bisect import bisect_left, bisect_right
+
+
+class BoxCatalog:
+    """
+    A compiled, read-only view of the available boxes for fast box selection.
+    This class replaces sorting the boxes and recomputing their metrics for every
+    order and every box upgrade.
+
+    The catalog is built once from the box definitions and stores:
+    - The boxes in ascending order of maximum fill volume
+    - The minimum and maximum fill volume of every box
+    - The weight every box can carry (max_weight minus the box weight)
+    - The box dimensions sorted from large to small
+    - Whether a box may be selected for a single order at all
+    - Per product, a bitmask of the boxes that can physically hold it
+
+    Selecting a box starts with a binary search over the cached volumes, so only
+    boxes that can hold the order volume and are larger than the previous box
+    are checked. Boxes that cannot hold one of the products of the order in any
+    rotation are skipped through the intersection of the product bitmasks.
+
+    Attributes:
+        boxes (List[BoxDefinition]): Boxes sorted by maximum fill volume
+        source (tuple): Boxes the catalog was built from, in their original order
+        max_volumes (List[float]): Maximum fill volume per box
+        min_volumes (List[float]): Minimum fill volume per box
+        weight_limits (List[float]): Content weight each box can carry in grams
+        dimensions (List[tuple]): Box dimensions sorted in descending order
+        eligible (List[bool]): False for undersized and multi-order boxes
+        fallback_box (BoxDefinition): Box returned when no box fits, the largest eligible box
+        indices (Dict[int, int]): Catalog index per box, keyed by id(box)
+        masks (Dict[ProductDefinition, int]): Feasible box bitmask per product, filled on first use
+
+    Key Features:
+        - Box metrics computed once per catalog instead of once per comparison
+        - Binary search for the first candidate box
+        - Bitmask filtering of boxes too small for a product, where bit i stands
+          for boxes[i]
+        - Selection results identical to the original linear scan
+
+    Usage:
+        catalog = BoxCatalog(boxes)
+        box = catalog.select(order.get_total_volume(), order.get_total_weight(), order.get_dimensions())
+    """
+
+    def __init__(self, boxes):
+        """
+        Builds the catalog.
+
+        Args:
+            boxes (List[BoxDefinition]): Available boxes, in any order
+
+        Note:
+            - Boxes with the same maximum fill volume keep their original order
+        """
+        self.source = tuple(boxes)
+        self.boxes = sorted(self.source, key=lambda box: box.max_volume())
+        self.max_volumes = [box.max_volume() for box in self.boxes]
+        self.min_volumes = [box.min_volume() for box in self.boxes]
+        self.weight_limits = [box.max_weight - box.weight for box in self.boxes]
+        self.dimensions = [tuple(sorted(box.get_box_dimensions(), reverse=True)) for box in self.boxes]
+        self.eligible = [
+            "Undersized" not in box.description and "Multi" not in box.description
+            for box in self.boxes
+        ]
+        self.indices = {id(box): index for index, box in enumerate(self.boxes)}
+        self.masks = {}
+
+        eligible_boxes = [box for box, eligible in zip(self.boxes, self.eligible) if eligible]
+        self.fallback_box = eligible_boxes[-1] if eligible_boxes else None
+
+    def select(self, total_volume, total_weight, dimensions, last_box=None, feasible_mask=None):
+        """
+        Selects the smallest box that can hold an order.
+
+        Args:
+            total_volume (float): Total product volume of the order
+            total_weight (float): Total product weight of the order
+            dimensions (List[float]): Maximum product dimensions of the order
+            last_box (BoxDefinition, optional): Previously tried box; only larger
+                boxes are considered
+            feasible_mask (int, optional): Bitmask of the boxes that can hold every
+                product of the order, as returned by order_mask
+
+        Returns:
+            BoxDefinition: Selected box, or None if no box fits and the caller
+            should use fallback_box
+
+        Note:
+            - A box is selected if it is eligible, holds the volume and weight
+              within its fill limits and fits the product dimensions
+            - If the second box cannot be used because the order is below its
+              minimum fill volume, the first box is returned
+            - The feasible mask only rules out boxes that would fail the
+              dimension check anyway, so it never changes the selected box
+        """
+        start = bisect_left(self.max_volumes, total_volume)
+
+        if last_box is not None:
+            start = max(start, bisect_right(self.max_volumes, last_box.max_volume()))
+
+        if feasible_mask is None:
+            feasible_mask = (1 << len(self.boxes)) - 1
+        elif start > 1 and feasible_mask >> start == 0:
+            # No box left that can hold every product
+            return None
+
+        order_dimensions = sorted(dimensions, reverse=True)
+
+        for index in range(start, len(self.boxes)):
+            if not self.eligible[index] or self.max_volumes[index] <= 1:
+                continue
+
+            if self.min_volumes[index] <= total_volume <= self.max_volumes[index] and total_weight <= self.weight_limits[index]:
+                if feasible_mask >> index & 1 and all(dim <= max_dim for dim, max_dim in zip(order_dimensions, self.dimensions[index])):
+                    return self.boxes[index]
+            elif index == 1 and total_volume < self.min_volumes[index]:
+                return self.boxes[0]
+
+        return None
+
+    def feasible_mask(self, definition):
+        """
+        Returns the bitmask of the boxes that can hold a product in some rotation.
+
+        Args:
+            definition (ProductDefinition): Product to check
+
+        Returns:
+            int: Bitmask with bit i set if boxes[i] can hold the product
+
+        Note:
+            - Computed once per product and catalog
+        """
+        mask = self.masks.get(definition)
+
+        if mask is None:
+            product_dimensions = sorted((definition.width, definition.height, definition.length), reverse=True)
+            mask = 0
+
+            for index, box_dimensions in enumerate(self.dimensions):
+                if all(dim <= max_dim for dim, max_dim in zip(product_dimensions, box_dimensions)):
+                    mask |= 1 << index
+
+            self.masks[definition] = mask
+
+        return mask
+
+    def order_mask(self, definitions):
+        """
+        Returns the bitmask of the boxes that can hold every product of an order.
+
+        Args:
+            definitions (Iterable[ProductDefinition]): Distinct product definitions
+                of the order, such as the keys of Order.pending_counts
+
+        Returns:
+            int: Intersection of the feasible box bitmasks of all definitions
+
+        Note:
+            - Only a necessary condition: the order dimensions checked by select
+              can still rule out a box that holds each product on its own
+            - Takes one step per distinct product, not per unit
+        """
+        mask = (1 << len(self.boxes)) - 1
+
+        for definition in definitions:
+            mask &= self.feasible_mask(definition)
+
+        return mask
+
+    def can_hold(self, definition, box):
+        """
+        Checks if a box can hold a product in some rotation.
+
+        Args:
+            definition (ProductDefinition): Product to check
+            box (BoxDefinition): Box of this catalog
+
+        Returns:
+            bool: True if the product fits in the box
+        """
+        return bool(self.feasible_mask(definition) >> self.indices[id(box)] & 1)
+
+    def __len__(self):
+        return len(self.boxes)
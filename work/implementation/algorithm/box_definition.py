@@ -1,3 +1,5 @@
+from .rotation_type import RotationType
+
 class BoxDefinition:
     """
     Represents a box with dimensions, weight, and additional attributes for packaging calculations.
@@ -35,6 +37,8 @@ class BoxDefinition:
             Retrieves the container classification.
         get_box_dimensions() -> tuple:
             Returns the standardized dimensions (width, height, length).
+        grid_capacity(product_dimensions) -> tuple:
+            Calculates how many units of one product fit in the box as a regular grid.
     """
 
     def __init__(self, length: float, height: float, width: float, weight: float, 
@@ -162,4 +166,44 @@ class BoxDefinition:
             tuple: The dimensions of the box (width, height, length)
         """
         return self.width, self.height, self.length
-        
\ No newline at end of file
+        
+
+    def grid_capacity(self, product_dimensions: tuple):
+        """
+        Calculates how many units of one product fit in the box when they are
+        stacked as a regular grid in a single rotation.
+        For every rotation, the number of units per axis is the floor division of
+        the box dimension by the rotated product dimension.
+
+        Args:
+            product_dimensions (tuple): The dimensions (width, height, length) of the product in cm
+
+        Returns:
+            tuple: (capacity, rotation, (units along width, units along height, units along length))
+                for the rotation holding the most units
+
+        Note:
+            - Rotations are tried from the product's initial rotation onwards, so
+              ties are resolved the same way as in the layer-based packing
+            - The capacity is 0 if the product does not fit in any rotation
+            - Only the distinct orientations of the product are tried
+        """
+        width, height, length = product_dimensions
+        rotation = RotationType.initial_rotation(width, height, length)
+        best = (0, rotation, (0, 0, 0))
+
+        if min(product_dimensions) <= 0:
+            return best
+
+        for rotation, (rotated_width, rotated_height, rotated_length) in RotationType.rotation_table(width, height, length):
+            counts = (
+                int(self.width // rotated_width),
+                int(self.height // rotated_height),
+                int(self.length // rotated_length)
+            )
+            capacity = counts[0] * counts[1] * counts[2]
+
+            if capacity > best[0]:
+                best = (capacity, rotation, counts)
+
+        return best
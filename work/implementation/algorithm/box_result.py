@@ -1,10 +1,19 @@
 import logging
+from itertools import product as grid_product
 
 from .order import Order
 from .rotation_type import RotationType
 from .box_definition import BoxDefinition
 from .layer_result import LayerResult
+from .maximal_space_layer_result import MaximalSpaceLayerResult
+from .extreme_point_layer_result import ExtremePointLayerResult
+from .skyline_layer_result import SkylineLayerResult
 from .position import Position
+from .kernels import get_kernel
+from .coordinate_store import CoordinateStore
+from .tracing import get_tracer
+
+tracer = get_tracer('box')
 
 class BoxResult:
     """
@@ -26,6 +35,18 @@ class BoxResult:
         box_id (int): Unique identifier for this box instance
         order (Order): Associated order being packed
         packed_items (List[Product]): Successfully packed products
+        box_catalog (BoxCatalog): Optional catalog used for precomputed fit checks
+        coordinate_store (CoordinateStore): Extents of the placed products, appended per placement
+        kernel (str): Name of the kernel for the geometric tests, 'python' or 'numpy'
+        engine (str): Name of the layer engine of this box, a key of layer_engines
+        layer_engines (Dict[str, type]): Layer class per engine name:
+            'layers' stacks LayerResult layers, 'maximal_space' tracks the free space
+            of the box as maximal empty spaces in a single MaximalSpaceLayerResult,
+            'extreme_point' places products on the extreme points of a single
+            ExtremePointLayerResult, 'skyline' places products on the heightmap
+            of a single SkylineLayerResult
+        spatial_index (SpatialGrid | ExtentArray): Placed products indexed for collision
+            checks, in the structure of the kernel
 
     Key Features:
         - Layer-based packing strategy
@@ -33,14 +54,34 @@ class BoxResult:
         - Space optimization
         - Position tracking
         - Pack validation
+        - Append-only store of placed extents, read by collision checks and exporters
+        - Spatial index of placed products for collision checks
+        - Can take over the layout of a smaller box of the same order
     """
 
-    def __init__(self, box: BoxDefinition):
+    layer_engines = {
+        'layers': LayerResult,
+        'maximal_space': MaximalSpaceLayerResult,
+        'extreme_point': ExtremePointLayerResult,
+        'skyline': SkylineLayerResult,
+    }
+
+    def __init__(self, box: BoxDefinition, box_catalog=None, kernel='python', engine='layers'):
         """
         Initializes a new box packing result.
 
         Args:
             box (BoxDefinition): The box definition to use for packing
+            box_catalog (BoxCatalog, optional): Catalog containing the box, whose
+                per-product bitmasks replace the dimension comparison of the
+                oversize check
+            kernel (str): Name of the kernel for the collision and fit tests,
+                'python' or 'numpy'; both give the same placements
+            engine (str | Dict[str, str]): Name of the layer engine, a key of
+                layer_engines, or the engine name per box type, see select_engine
+
+        Raises:
+            ValueError: If no layer engine is registered under the engine name
 
         Note:
             - Generates a unique box ID using Python's id() function
@@ -52,6 +93,37 @@ class BoxResult:
         self.oversized_products = []  # Products too large to fit in the box
         self.leftover_products = []  # Products that couldn't fit despite trying
         self.box_id = id(self)  # Generate a unique ID for the box instance
+        self.box_catalog = box_catalog
+        self.coordinate_store = CoordinateStore()
+        self.kernel = kernel
+        self.engine = self.select_engine(engine, box)
+
+        if self.engine not in self.layer_engines:
+            raise ValueError(f"Unknown layer engine '{self.engine}', expected one of: {', '.join(self.layer_engines)}.")
+        self.layer_class = self.layer_engines[self.engine]
+        self.spatial_index = get_kernel(kernel).collision_index(box)
+
+    @staticmethod
+    def select_engine(engine, box):
+        """
+        Returns the name of the layer engine for a box.
+
+        Args:
+            engine (str | Dict[str, str]): Engine name for all boxes, or engine name
+                per box type (container_type); the 'default' entry is used for box
+                types without an entry, 'layers' if there is no 'default' entry
+            box (BoxDefinition): The box being packed
+
+        Returns:
+            str: Name of the layer engine
+
+        Usage:
+            BoxResult.select_engine({'S': 'skyline', 'default': 'layers'}, box)
+        """
+        if isinstance(engine, dict):
+            return engine.get(box.container_type, engine.get('default', 'layers'))
+
+        return engine
 
 
 
@@ -61,15 +133,16 @@ class BoxResult:
         
         The packing process:
         1. Orders items for optimal packing
-        2. Attempts to place each product
-        3. Tracks rejected items
-        4. Manages layer creation and utilization
+        2. Takes the items as runs of identical units
+        3. Attempts to place each run as a batch
+        4. Tracks rejected items
+        5. Manages layer creation and utilization
 
         Args:
             order (Order): The order containing products to pack
 
         Note:
-            - Products are packed sequentially
+            - Runs are packed sequentially
             - Failed placements are tracked as rejected items
             - Logging is used to track packing progress
         """
@@ -77,14 +150,76 @@ class BoxResult:
         self.order.order_items()
 
         while True:
-            product = self.order.take_item()
+            products = self.order.take_run()
 
-            if not product:
+            if not products:
                 break
 
-            if not self.add_product_to_box(product):
-                logging.warning(f"Product {product.get_product_name()} could not be packed into the box.")
-                self.order.add_rejected_item(product)
+            placed_count = self.add_products_to_box(products)
+
+            if placed_count < len(products):
+                logging.warning(
+                    f"{len(products) - placed_count} unit(s) of product {products[0].get_product_name()} "
+                    f"could not be packed into the box."
+                )
+                self.order.add_rejected_items(products[placed_count:])
+
+    def pack_products_in_grid(self, order: Order, rotation, counts):
+        """
+        Packs all products of a single-product order as a regular grid.
+        Used when the grid capacity of the box covers every unit of the order,
+        so no fragment search is needed.
+
+        Args:
+            order (Order): Order whose pending items are all units of one product
+            rotation (RotationType): Rotation applied to every unit
+            counts (tuple): Grid size as (units along width, units along height,
+                units along length), as returned by BoxDefinition.grid_capacity
+
+        Note:
+            - Units are placed row by row along the width, then the length, then upwards
+            - All positions are stored in a single layer without remaining spaces,
+              since the box is not used for any other product
+            - The caller must make sure the grid holds all units
+        """
+        self.order = order
+        products = self.order.get_items()
+
+        if not products:
+            return
+
+        width, height, length = rotation.adjust_dimensions(*products[0].get_dimensions())
+        offsets_x = self.grid_offsets(width, counts[0])
+        offsets_y = self.grid_offsets(height, counts[1])
+        offsets_z = self.grid_offsets(length, counts[2])
+
+        layer = self.layer_class(self.box, kernel=self.kernel)
+        layer.remaining_spaces = []
+
+        for product, (y, z, x) in zip(products, grid_product(offsets_y, offsets_z, offsets_x)):
+            position = Position(product, x, y, z, rotation)
+            layer.positions.append(position)
+            self.record_position(position, len(self.layers))
+
+        self.layers.append(layer)
+
+    @staticmethod
+    def grid_offsets(size, count):
+        """
+        Returns the offsets of the grid cells along one axis.
+
+        Args:
+            size (float): Cell size along the axis
+            count (int): Number of cells
+
+        Returns:
+            List[float]: Offsets, each one the previous offset plus the cell size
+        """
+        offsets = [0]
+        for _ in range(count - 1):
+            offsets.append(offsets[-1] + size)
+
+        return offsets
 
     def product_is_oversized(self, product):
         """
@@ -100,9 +235,13 @@ class BoxResult:
             bool: True if product is too large for the box, False otherwise
 
         Note:
-            Products marked as oversized are tracked separately and won't
-            be attempted for packing
+            - Products marked as oversized are tracked separately and won't
+              be attempted for packing
+            - Uses the precomputed bitmask of the box catalog when available
         """
+        if self.box_catalog is not None:
+            return not self.box_catalog.can_hold(product.definition, self.box)
+
         return any(dim > max_dim for dim, max_dim in zip(sorted(product.get_dimensions()), sorted(self.box.get_box_dimensions())))
 
     def add_product_to_box(self, product):
@@ -126,35 +265,164 @@ class BoxResult:
             - Optimizes for space utilization
             - Maintains stability through proper support
         """
+        return self.add_products_to_box([product]) == 1
+
+    def add_products_to_box(self, products):
+        """
+        Attempts to add a run of identical units to the box.
+        Placing a run as a batch avoids repeating work that cannot change
+        between units of the same product.
+
+        The placement algorithm:
+        1. Checks once if the product is oversized
+        2. Checks collisions against the spatial index, extended per placement
+        3. Places each unit, starting at the layer that took the previous unit
+        4. Stops at the first unit that cannot be placed
+
+        Args:
+            products (List[Product]): Units of one product, in packing order
+
+        Returns:
+            int: Number of units placed, from the front of the run
+
+        Note:
+            - A layer that could not take a unit cannot take the next unit of the
+              same product either, since placements only reduce the free space;
+              for the same reason the units after the first failure are leftovers
+            - Within a layer, the spaces the previous unit could not use are
+              skipped by the next unit, see LayerResult.add_product
+            - The result is identical to placing the units one by one
+        """
+        product = products[0]
+
         if self.product_is_oversized(product):
-            self.oversized_products.append(product)
+            self.oversized_products.extend(products)
             logging.warning(f"Product {product.item} is too large to fit in the box.")
+            return 0
+
+        layer_index = 0
+
+        for placed_count, product in enumerate(products):
+            layer_index = self.place_product(product, self.spatial_index, layer_index)
+
+            if layer_index is None:
+                # Mark the product and the rest of the run as leftover if no fit
+                self.leftover_products.extend(products[placed_count:])
+                logging.warning(f"Product {product.item} could not be placed in any layer.")
+                return placed_count
+
+            self.record_position(self.layers[layer_index].get_positions()[-1], layer_index)
+
+        return len(products)
+
+    def record_position(self, position, layer_index):
+        """
+        Records a placed product in the coordinate store and the spatial index.
+
+        Args:
+            position (Position): Position of the placed product
+            layer_index (int): Index of the layer holding the product
+
+        Note:
+            - Called once per successful placement, so neither the store nor the
+              index is ever rebuilt from the layers
+        """
+        self.spatial_index.append(self.coordinate_store.append(position, layer_index))
+
+    def can_seed(self, previous):
+        """
+        Checks if the layout of another box can be taken over by this box.
+
+        Args:
+            previous (BoxResult): Packed box, usually a smaller box of the same order
+
+        Returns:
+            bool: True if both boxes use the same layer engine and every placed
+            product of the other box lies inside this box
+
+        Note:
+            - XXS boxes are never seeded, their layers do not hold coordinates
+        """
+        if self.box.container_type == "XXS" or previous.box.container_type == "XXS":
             return False
 
-        existing_coordinates = self.collect_existing_coordinates()
+        if previous.layer_class is not self.layer_class or self.layers:
+            return False
 
+        return all(
+            x + width <= self.box.width and y + height <= self.box.height and z + length <= self.box.length
+            for _, x, y, z, width, height, length in previous.coordinate_store
+        )
+
+    def seed_layout(self, previous):
+        """
+        Takes over the layout of another box, so only the remaining products need
+        to be placed.
+
+        Args:
+            previous (BoxResult): Packed box whose layout fits this box, see can_seed
+
+        Returns:
+            List[Product]: Products placed by the layout, in placement order
+
+        Note:
+            - Every layer is replayed into a new layer at the same base height,
+              in the order its products were placed, so the free space of each
+              layer is built as if the products were placed in this box
+            - The positions keep their coordinates: both boxes share the origin
+        """
+        products = []
+
+        for layer in previous.layers:
+            new_layer = self.layer_class(self.box, base_height=layer.base_height, kernel=self.kernel)
+            self.layers.append(new_layer)
+
+            for position in layer.get_positions():
+                new_layer.seed_position(position)
+                self.record_position(position, len(self.layers) - 1)
+                products.append(position.get_product())
+
+        return products
+
+    def place_product(self, product, existing_coordinates, start_layer=0):
+        """
+        Places a single product in the first layer that can take it.
+
+        Args:
+            product (Product): Product to place
+            existing_coordinates (List[tuple] | SpatialGrid | ExtentArray): Coordinates of already placed products
+            start_layer (int): Index of the first layer to try
+
+        Returns:
+            int: Index of the layer the product was placed in, or None if it did not fit
+        """
         # Wrap product in a Position object
         rotation = RotationType.initial_rotation(product.width, product.height, product.length)
         position = Position(product, 0, 0, 0, rotation)
 
-        logging.debug(f"Position for product {product.item}: {position}, Coordinates: {position.get_coordinates()}")
+        if tracer.active:
+            tracer.log(f"Position for product {product.item}: {position}, Coordinates: {position.get_coordinates()}")
 
         # Try to place the product in existing layers
-        for idx, layer in enumerate(self.layers):
-            logging.debug(f"Attempting to place product {position.get_product().item} in Layer {idx + 1}.")
-            if layer.add_product(position, existing_coordinates):
-                logging.debug(f"Product {product.item} successfully placed in Layer {idx + 1}.")
-                return True
+        for idx in range(start_layer, len(self.layers)):
+            if tracer.active:
+                tracer.log(f"Attempting to place product {position.get_product().item} in Layer {idx + 1}.")
+            if self.layers[idx].add_product(position, existing_coordinates):
+                if tracer.active:
+                    tracer.log(f"Product {product.item} successfully placed in Layer {idx + 1}.")
+                return idx
+
+        if self.layers and not self.layer_class.stacks_layers:
+            # The existing layer already covers all free space of the box
+            return None
 
         # If no existing layer fits, create a new layer
         if self.add_new_layer(position, existing_coordinates):
-            logging.debug(f"Product {product.item} successfully added to a new layer.")
-            return True
+            if tracer.active:
+                tracer.log(f"Product {product.item} successfully added to a new layer.")
+            return len(self.layers) - 1
 
-        # Mark the product as leftover if no fit
-        self.leftover_products.append(product)
-        logging.warning(f"Product {product.item} could not be placed in any layer.")
-        return False
+        return None
 
     def add_new_layer(self, position, existing_coordinates):
         """
@@ -162,7 +430,7 @@ class BoxResult:
         
         Args:
             position (Position): Initial product position for the layer
-            existing_coordinates (List[tuple]): Coordinates of already placed products
+            existing_coordinates (List[tuple] | SpatialGrid | ExtentArray): Coordinates of already placed products
 
         Returns:
             bool: True if layer was created and product placed, False otherwise
@@ -181,13 +449,15 @@ class BoxResult:
         remaining_height = self.box.height - new_layer_base_height
 
         if remaining_height >= min(position.product.get_dimensions()):
-            new_layer = LayerResult(self.box, base_height=new_layer_base_height)
-            logging.debug(f"Attempting to add new layer for product {position.get_product().item}.")
-            logging.debug(f"Position details: {position}, Coordinates: {position.get_coordinates()}")
+            new_layer = self.layer_class(self.box, base_height=new_layer_base_height, kernel=self.kernel)
+            if tracer.active:
+                tracer.log(f"Attempting to add new layer for product {position.get_product().item}.")
+                tracer.log(f"Position details: {position}, Coordinates: {position.get_coordinates()}")
 
             if new_layer.add_product(position, existing_coordinates):
                 self.layers.append(new_layer)
-                logging.debug(f"Product {position.get_product().item} packed into a new layer.")
+                if tracer.active:
+                    tracer.log(f"Product {position.get_product().item} packed into a new layer.")
                 return True
 
         logging.warning(
@@ -206,13 +476,10 @@ class BoxResult:
                         for each placed product
 
         Note:
-            Coordinates are collected from all layers for complete
-            collision detection
+            - Read from the coordinate store, which holds every product placed
+              through add_products_to_box or pack_products_in_grid
         """
-        existing_coordinates = []
-        for layer in self.layers:
-            existing_coordinates.extend(layer.get_product_coordinates())
-        return existing_coordinates
+        return list(self.coordinate_store)
 
     def get_all_coordinates(self):
         """Get all product coordinates for tracking."""
@@ -256,11 +523,13 @@ class BoxResult:
         """
         products_positions = []
         try:
-            logging.debug(f"Starting to retrieve product positions...")
-            logging.debug(f"Processing {len(self.layers)} layers.")
+            if tracer.active:
+                tracer.log(f"Starting to retrieve product positions...")
+                tracer.log(f"Processing {len(self.layers)} layers.")
 
             for layer_index, layer in enumerate(self.layers):
-                logging.debug(f"Processing Layer {layer_index + 1} with {len(layer.get_positions())} products.")
+                if tracer.active:
+                    tracer.log(f"Processing Layer {layer_index + 1} with {len(layer.get_positions())} products.")
                 for position in layer.get_positions():  # Ensure `get_products` returns Position objects
                     start_x, start_y, start_z = position.get_coordinates()
                     end_x, end_y, end_z = position.calculate_extending_point()
@@ -275,7 +544,8 @@ class BoxResult:
                         'rotation': position.get_rotation().name,
                     })
 
-            logging.debug(f"Successfully retrieved product positions.")
+            if tracer.active:
+                tracer.log(f"Successfully retrieved product positions.")
             return products_positions
 
         except Exception as e:
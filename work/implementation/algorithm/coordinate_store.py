@@ -0,0 +1,127 @@
+class CoordinateStore:
+    """
+    An append-only store of the products placed in a box.
+    This class keeps the extent of every placed product in flat columns, so
+    collision checks and exporters can read the placements without walking the
+    layers and rebuilding a coordinate tuple per product.
+
+    Every placement adds one row to each column. Rows are never changed or
+    removed, since a placed product stays where it is.
+
+    The columns are Python lists rather than NumPy arrays. The rows are read
+    one at a time by the scalar collision checks and the exporters, and a list
+    keeps the placed values as they are; the numpy kernel keeps its own
+    ExtentArray for the vectorized checks.
+
+    Attributes:
+        product_ids (List[str]): Product ID per row
+        xs (List[float]): X coordinate per row in cm
+        ys (List[float]): Y coordinate per row in cm
+        zs (List[float]): Z coordinate per row in cm
+        widths (List[float]): Width after rotation per row in cm
+        heights (List[float]): Height after rotation per row in cm
+        lengths (List[float]): Length after rotation per row in cm
+        layer_indices (List[int]): Index of the layer holding the product per row
+        positions (List[Position]): Placed position per row
+
+    Key Features:
+        - Constant-time append per placement
+        - Rows in the (product_id, x, y, z, width, height, length) format of
+          LayerResult.get_product_coordinates
+        - Iteration in insertion order, as the placements were made
+        - Rows in layer order for exporters through layer_order() and
+          get_positions(), matching a walk over the layers
+        - Columns keep the values as placed, so exported numbers are formatted
+          exactly like the coordinates of the positions
+
+    Usage:
+        store = CoordinateStore()
+        row = store.append(position, layer_index)
+        for product_id, x, y, z, width, height, length in store:
+            ...
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty store.
+        """
+        self.product_ids = []
+        self.xs = []
+        self.ys = []
+        self.zs = []
+        self.widths = []
+        self.heights = []
+        self.lengths = []
+        self.layer_indices = []
+        self.positions = []
+
+    def append(self, position, layer_index=0):
+        """
+        Adds a placed product to the store.
+
+        Args:
+            position (Position): Position of the placed product
+            layer_index (int): Index of the layer holding the product
+
+        Returns:
+            tuple: The new row as (product_id, x, y, z, width, height, length)
+        """
+        product_id = position.get_product().get_product_name()
+        x, y, z = position.get_coordinates()
+        width, height, length = position.get_dimensions()
+
+        self.product_ids.append(product_id)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.zs.append(z)
+        self.widths.append(width)
+        self.heights.append(height)
+        self.lengths.append(length)
+        self.layer_indices.append(layer_index)
+        self.positions.append(position)
+
+        return (product_id, x, y, z, width, height, length)
+
+    def row(self, index):
+        """
+        Returns one row of the store.
+
+        Args:
+            index (int): Row index, in insertion order
+
+        Returns:
+            tuple: (product_id, x, y, z, width, height, length)
+        """
+        return (
+            self.product_ids[index], self.xs[index], self.ys[index], self.zs[index],
+            self.widths[index], self.heights[index], self.lengths[index]
+        )
+
+    def layer_order(self):
+        """
+        Returns the row indices sorted by layer.
+
+        Returns:
+            List[int]: Row indices by layer, in insertion order within a layer
+
+        Note:
+            - Products of one run can go to different layers, so the insertion
+              order can differ from the order of a walk over the layers
+        """
+        return sorted(range(len(self.positions)), key=self.layer_indices.__getitem__)
+
+    def get_positions(self):
+        """
+        Returns the placed positions in layer order.
+
+        Returns:
+            List[Position]: Placed positions, as returned by BoxResult.get_all_coordinates
+        """
+        return [self.positions[index] for index in self.layer_order()]
+
+    def __iter__(self):
+        # Insertion order; use layer_order() for the order of a walk over the layers
+        return zip(self.product_ids, self.xs, self.ys, self.zs, self.widths, self.heights, self.lengths)
+
+    def __len__(self):
+        return len(self.positions)
@@ -0,0 +1,212 @@
+from .fragment import Fragment
+from .layer_result import LayerResult
+from .tracing import get_tracer
+
+tracer = get_tracer('layer')
+
+class ExtremePointLayerResult(LayerResult):
+    """
+    A layer that places products on extreme points instead of split fragments.
+    This class replaces the fragment splitting of LayerResult, which creates up to
+    six fragments for every fragment a product touches.
+
+    An extreme point is a corner where a product can be placed: the front-left-bottom
+    corner of the box, and the corners next to every placed product projected back
+    onto the nearest product or wall. Placing a product at (x, y, z) with extent
+    (w, h, l) adds the points
+    1. (x + w, y, z), projected down and to the front
+    2. (x, y + h, z), projected to the left and to the front
+    3. (x, y, z + l), projected to the left and down
+
+    Every extreme point keeps its residual space: the box from the point to the
+    walls, shortened along an axis where a placed product lies in front of the
+    point. The residual spaces are the remaining spaces of the layer, so the
+    placement search, the fragment index and the kernels of LayerResult are used
+    as they are.
+
+    Attributes:
+        stacks_layers (bool): False, since the extreme points of one layer cover
+            the whole box
+        extents (List[tuple]): (start, end) coordinates of the placed products
+
+    Key Features:
+        - At most six new candidates per placement, whatever the fragment count
+        - Candidates never overlap the placed product they were projected from,
+          other overlaps are found by the collision check
+        - Same placement priority as LayerResult: lowest y, then z and x
+    """
+
+    stacks_layers = False
+
+    def __init__(self, box, base_height=0, kernel='python'):
+        """
+        Initializes the layer with one extreme point at its base.
+
+        Args:
+            box (BoxDefinition): The box containing this layer
+            base_height (float): Starting height of this layer from box bottom in cm
+            kernel (str): Name of the kernel for the fit tests, 'python' or 'numpy'
+        """
+        super().__init__(box, base_height, kernel)
+        self.extents = []
+
+    def update_remaining_spaces(self, position):
+        """
+        Replaces the used extreme point by the points of a newly placed product.
+
+        Args:
+            position (Position): The position of the newly placed product
+
+        Note:
+            - Points inside the product are dropped
+            - Residual spaces that reach into the product are shortened; points
+              left without residual space are dropped
+            - New points are marked as new fragments, duplicates are skipped
+        """
+        start = position.get_coordinates()
+        end = position.calculate_extending_point()
+        self.extents.append((start, end))
+
+        updated_spaces = []
+        points = set()
+
+        for space in self.remaining_spaces:
+            point = (space.x, space.y, space.z)
+
+            if all(start[axis] <= point[axis] < end[axis] for axis in range(3)):
+                continue
+
+            space = self.shorten_space(space, start, end)
+            if space is not None:
+                updated_spaces.append(space)
+                points.add(point)
+
+        for point in self.projected_points(start, end):
+            if point in points:
+                continue
+
+            space = self.residual_space(point)
+            if space is not None:
+                updated_spaces.append(space)
+                points.add(point)
+
+        self.remaining_spaces = updated_spaces
+
+        if tracer.active:
+            tracer.log(
+                f"Updated extreme points after placing product {position.get_product().item}: {self.remaining_spaces}"
+            )
+
+    def projected_points(self, start, end):
+        """
+        Returns the extreme points next to a placed product.
+
+        Args:
+            start (tuple): (x, y, z) of the product
+            end (tuple): Extending point of the product
+
+        Returns:
+            List[tuple]: Up to six (x, y, z) points; each corner of the product
+            projected along the two axes it does not extend
+        """
+        x, y, z = start
+        corners = (
+            ((end[0], y, z), (1, 2)),
+            ((x, end[1], z), (0, 2)),
+            ((x, y, end[2]), (0, 1)),
+        )
+
+        return [self.project(corner, axis) for corner, axes in corners for axis in axes]
+
+    def project(self, point, axis):
+        """
+        Moves a point back along one axis until it touches a product or a wall.
+
+        Args:
+            point (tuple): (x, y, z) point to project
+            axis (int): 0 for x, 1 for y, 2 for z
+
+        Returns:
+            tuple: The projected point
+        """
+        others = [other for other in range(3) if other != axis]
+        limit = self.base_height if axis == 1 else 0
+
+        for start, end in self.extents:
+            if (limit < end[axis] <= point[axis] and
+                    all(start[other] <= point[other] < end[other] for other in others)):
+                limit = end[axis]
+
+        projected = list(point)
+        projected[axis] = limit
+        return tuple(projected)
+
+    def residual_space(self, point):
+        """
+        Returns the residual space of a new extreme point.
+
+        Args:
+            point (tuple): (x, y, z) of the point
+
+        Returns:
+            Fragment | None: Space from the point to the walls, shortened by the
+            placed products in front of it; None if the point is inside a product
+            or has no space left
+        """
+        x, y, z = point
+
+        if x >= self.box.width or y >= self.box.height or z >= self.box.length:
+            return None
+
+        space = Fragment(x, y, z, self.box.width - x, self.box.height - y, self.box.length - z)
+
+        for start, end in self.extents:
+            if all(start[axis] <= point[axis] < end[axis] for axis in range(3)):
+                return None
+
+            space = self.shorten_space(space, start, end)
+            if space is None:
+                return None
+
+        return space
+
+    @staticmethod
+    def shorten_space(space, start, end):
+        """
+        Shortens the residual space of an extreme point in front of a product.
+
+        Args:
+            space (Fragment): Residual space of the point
+            start (tuple): (x, y, z) of the product
+            end (tuple): Extending point of the product
+
+        Returns:
+            Fragment | None: The space, shortened along every axis where the
+            product lies ahead of the point in line with it; None if a side
+            becomes zero
+
+        Note:
+            - Returns the given fragment if it is not shortened, so its new flag
+              is kept
+        """
+        point = (space.x, space.y, space.z)
+        sizes = [space.width, space.height, space.length]
+        shortened = False
+
+        for axis in range(3):
+            if not point[axis] <= start[axis] < point[axis] + sizes[axis]:
+                continue
+
+            if all(start[other] <= point[other] < end[other] for other in range(3) if other != axis):
+                sizes[axis] = start[axis] - point[axis]
+                shortened = True
+
+        if not shortened:
+            return space
+
+        if min(sizes) <= 0:
+            return None
+
+        shortened_space = Fragment(*point, *sizes)
+        shortened_space.new = space.new
+        return shortened_space
@@ -27,6 +27,8 @@ class Fragment:
         - Fragments track their creation status for optimization
     """
 
+    __slots__ = ('x', 'y', 'z', 'width', 'height', 'length', 'new')
+
     def __init__(self, x, y, z, width, height, length):
         """
         Creates a new space fragment with specified dimensions and position.
@@ -68,6 +70,59 @@ class Fragment:
         """
         return self.width * self.height * self.length
 
+    def contains(self, other):
+        """
+        Checks if another fragment lies completely inside this fragment.
+
+        Args:
+            other (Fragment): Fragment to check
+
+        Returns:
+            bool: True if every point of the other fragment is inside this one
+
+        Note:
+            - A fragment contains itself
+            - Used to drop redundant fragments from maximal-space layers
+        """
+        return (self.x <= other.x and other.x + other.width <= self.x + self.width and
+                self.y <= other.y and other.y + other.height <= self.y + self.height and
+                self.z <= other.z and other.z + other.length <= self.z + self.length)
+
+    def merge(self, other):
+        """
+        Combines this fragment with another into one box, if their union is a box.
+
+        Args:
+            other (Fragment): Fragment to merge with
+
+        Returns:
+            Fragment: Fragment covering both fragments, or None if the union of the
+            two is not a box
+
+        Note:
+            - The union is a box if the fragments are identical along two axes and
+              touch or overlap along the third
+            - The merged fragment is new if either fragment is new
+        """
+        same_x = self.x == other.x and self.width == other.width
+        same_y = self.y == other.y and self.height == other.height
+        same_z = self.z == other.z and self.length == other.length
+
+        if same_y and same_z and self.x <= other.x + other.width and other.x <= self.x + self.width:
+            x = min(self.x, other.x)
+            merged = Fragment(x, self.y, self.z, max(self.x + self.width, other.x + other.width) - x, self.height, self.length)
+        elif same_x and same_z and self.y <= other.y + other.height and other.y <= self.y + self.height:
+            y = min(self.y, other.y)
+            merged = Fragment(self.x, y, self.z, self.width, max(self.y + self.height, other.y + other.height) - y, self.length)
+        elif same_x and same_y and self.z <= other.z + other.length and other.z <= self.z + self.length:
+            z = min(self.z, other.z)
+            merged = Fragment(self.x, self.y, z, self.width, self.height, max(self.z + self.length, other.z + other.length) - z)
+        else:
+            return None
+
+        merged.new = self.new or other.new
+        return merged
+
     def __repr__(self):
         """
         Provides a string representation of the fragment.
@@ -0,0 +1,83 @@
+class FragmentIndex:
+    """
+    Indexes the free fragments of a layer by their sorted dimensions.
+    This class lets a layer find the fragments that can hold a product in some
+    rotation, without sorting the fragments or recomputing their volumes for
+    every product.
+
+    A fragment can only hold a product if its dimensions, sorted from large to
+    small, are each at least the sorted product dimensions (3D dominance). The
+    index stores the sorted dimensions and the volume of every fragment once,
+    when the fragment list of the layer is replaced.
+
+    Attributes:
+        fragments (List[Fragment]): Indexed fragments, in layer order
+        dimensions (List[tuple]): Fragment dimensions sorted in descending order
+        volumes (List[float]): Fragment volumes
+
+    Key Features:
+        - Dominance filter over cached sorted dimensions
+        - Volume filter over cached volumes
+        - Candidates returned in layer order, for the placement priority sort
+
+    Usage:
+        index = FragmentIndex(layer.remaining_spaces)
+        candidates = index.dominating((30, 20, 10))
+    """
+
+    def __init__(self, fragments):
+        """
+        Builds the index.
+
+        Args:
+            fragments (List[Fragment]): Fragments to index
+        """
+        self.fragments = fragments
+        self.dimensions = [tuple(sorted((fragment.width, fragment.height, fragment.length), reverse=True)) for fragment in fragments]
+        self.volumes = [fragment.volume() for fragment in fragments]
+
+    def dominating(self, product_dimensions, indices=None):
+        """
+        Returns the fragments whose sorted dimensions dominate a product.
+
+        Args:
+            product_dimensions (tuple): Product dimensions sorted in descending order
+            indices (Iterable[int], optional): Fragment indices to filter; all
+                fragments if not given
+
+        Returns:
+            List[int]: Indices of the fragments that can hold the product in some
+            rotation, in the order of indices
+
+        Note:
+            - A necessary condition only: the fragment may still be too small for
+              the rotations that are tried
+        """
+        first, second, third = product_dimensions
+        dimensions = self.dimensions
+
+        if indices is None:
+            indices = range(len(self.fragments))
+
+        return [
+            index for index in indices
+            if dimensions[index][0] >= first and dimensions[index][1] >= second and dimensions[index][2] >= third
+        ]
+
+    def with_volume(self, volume):
+        """
+        Returns the fragments with at least a given volume.
+
+        Args:
+            volume (float): Minimum fragment volume
+
+        Returns:
+            List[int]: Fragment indices, in layer order
+        """
+        return [index for index, fragment_volume in enumerate(self.volumes) if fragment_volume >= volume]
+
+    def __iter__(self):
+        return iter(self.fragments)
+
+    def __len__(self):
+        return len(self.fragments)
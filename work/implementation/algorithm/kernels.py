@@ -0,0 +1,216 @@
+import numpy as np
+
+from .spatial_index import SpatialGrid
+
+
+class ExtentArray:
+    """
+    Stores the extents of the placed products of a box in a NumPy array.
+    This class lets a collision check test a candidate against all placed
+    products with a few array comparisons, instead of a Python loop.
+
+    Attributes:
+        entries (List[tuple]): Stored coordinates as (product_id, x, y, z, width, height, length)
+        extents (numpy.ndarray): Array of shape (capacity, 6) holding x, y, z, width,
+            height and length per entry; only the first len(entries) rows are used
+
+    Key Features:
+        - Same overlap semantics as check_collision on a coordinate list
+        - Capacity doubles when full, so appending is amortized constant time
+        - Can be iterated and appended to like a coordinate list
+
+    Usage:
+        extents = ExtentArray()
+        extents.append(('5234', 0, 0, 0, 10, 20, 30))
+        coordinate = extents.find_collision(5, 5, 5, 10, 10, 10)
+    """
+
+    initial_capacity = 16
+
+    def __init__(self, coordinates=()):
+        """
+        Initializes an empty array.
+
+        Args:
+            coordinates (Iterable[tuple], optional): Coordinates to store right away
+        """
+        self.entries = []
+        self.extents = np.empty((self.initial_capacity, 6))
+
+        for coordinate in coordinates:
+            self.append(coordinate)
+
+    def append(self, coordinate):
+        """
+        Adds a placed product.
+
+        Args:
+            coordinate (tuple): (product_id, x, y, z, width, height, length)
+        """
+        index = len(self.entries)
+
+        if index == len(self.extents):
+            self.extents = np.concatenate((self.extents, np.empty_like(self.extents)))
+
+        self.extents[index] = coordinate[1:]
+        self.entries.append(coordinate)
+
+    def find_collision(self, x, y, z, width, height, length):
+        """
+        Finds a placed product that overlaps a candidate position.
+
+        Args:
+            x (float): Candidate x coordinate
+            y (float): Candidate y coordinate
+            z (float): Candidate z coordinate
+            width (float): Candidate width
+            height (float): Candidate height
+            length (float): Candidate length
+
+        Returns:
+            tuple: Coordinates of the first overlapping product, or None if there is none
+
+        Note:
+            - Products that only touch the candidate do not overlap it
+        """
+        if not self.entries:
+            return None
+
+        extents = self.extents[:len(self.entries)]
+        overlaps = (
+            (x < extents[:, 0] + extents[:, 3]) & (x + width > extents[:, 0]) &
+            (y < extents[:, 1] + extents[:, 4]) & (y + height > extents[:, 1]) &
+            (z < extents[:, 2] + extents[:, 5]) & (z + length > extents[:, 2])
+        )
+        index = int(overlaps.argmax())
+
+        return self.entries[index] if overlaps[index] else None
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class PythonKernel:
+    """
+    Scalar implementation of the geometric tests of the packing algorithm.
+
+    Key Features:
+        - Collision checks through a SpatialGrid
+        - Fit tests evaluated lazily, one fragment at a time, so fragments after
+          the first usable one are never tested
+    """
+
+    name = 'python'
+
+    def collision_index(self, box):
+        """
+        Creates the structure holding the placed products of a box.
+
+        Args:
+            box (BoxDefinition): Box being packed
+
+        Returns:
+            SpatialGrid: Empty collision index
+        """
+        return SpatialGrid(box)
+
+    def fitting_rotations(self, spaces, rotations, box):
+        """
+        Finds the rotations of a product that fit in each fragment.
+
+        Args:
+            spaces (List[Fragment]): Fragments to test
+            rotations (List[tuple]): (RotationType, (width, height, length)) per rotation to test
+            box (BoxDefinition): Box containing the fragments
+
+        Returns:
+            Iterable[List[int]]: Per fragment, the indices of the rotations that fit
+            in the fragment and stay inside the box
+        """
+        box_width, box_height, box_length = box.get_box_dimensions()
+
+        for space in spaces:
+            yield [
+                index for index, (_, (width, height, length)) in enumerate(rotations)
+                if width <= space.width and length <= space.length and height <= space.height
+                and space.x + width <= box_width and space.y + height <= box_height and space.z + length <= box_length
+            ]
+
+
+class NumpyKernel(PythonKernel):
+    """
+    Vectorized implementation of the geometric tests of the packing algorithm.
+
+    Key Features:
+        - Collision checks test a candidate against all placed products at once
+          through an ExtentArray
+        - Fit tests of all rotations against all fragments in one broadcast
+          comparison
+        - Results identical to the scalar kernel
+    """
+
+    name = 'numpy'
+
+    def collision_index(self, box):
+        """
+        Creates the structure holding the placed products of a box.
+
+        Args:
+            box (BoxDefinition): Box being packed
+
+        Returns:
+            ExtentArray: Empty collision index
+        """
+        return ExtentArray()
+
+    def fitting_rotations(self, spaces, rotations, box):
+        """
+        Finds the rotations of a product that fit in each fragment.
+
+        Args:
+            spaces (List[Fragment]): Fragments to test
+            rotations (List[tuple]): (RotationType, (width, height, length)) per rotation to test
+            box (BoxDefinition): Box containing the fragments
+
+        Returns:
+            List[List[int]]: Per fragment, the indices of the rotations that fit
+            in the fragment and stay inside the box
+        """
+        if not spaces or not rotations:
+            return [[] for _ in spaces]
+
+        fragments = np.array([(space.x, space.y, space.z, space.width, space.height, space.length) for space in spaces], dtype=float)
+        dimensions = np.array([rotated for _, rotated in rotations], dtype=float)
+        box_dimensions = np.array(box.get_box_dimensions(), dtype=float)
+
+        fits = (
+            np.all(dimensions[None, :, :] <= fragments[:, None, 3:], axis=2) &
+            np.all(fragments[:, None, :3] + dimensions[None, :, :] <= box_dimensions, axis=2)
+        )
+
+        return [np.flatnonzero(row).tolist() for row in fits]
+
+
+KERNELS = {kernel.name: kernel for kernel in (PythonKernel(), NumpyKernel())}
+
+
+def get_kernel(name):
+    """
+    Returns the kernel registered under a name.
+
+    Args:
+        name (str): 'python' or 'numpy'
+
+    Returns:
+        PythonKernel: The kernel
+
+    Raises:
+        ValueError: If no kernel is registered under the name
+    """
+    try:
+        return KERNELS[name]
+    except KeyError:
+        raise ValueError(f"Unknown kernel '{name}', expected one of: {', '.join(KERNELS)}.")
@@ -1,12 +1,60 @@
-import logging
+from bisect import insort
 
 from .fragment import Fragment
 from .position import Position
 from .rotation_type import RotationType
+from .fragment_index import FragmentIndex
+from .kernels import get_kernel
+from .tracing import get_tracer
+
+tracer = get_tracer('layer')
+collision_tracer = get_tracer('collision')
 
 def check_collision(new_position, existing_coordinates):
-    new_x, new_y, new_z = new_position.get_coordinates()
-    new_width, new_height, new_length = new_position.get_dimensions()
+    """
+    Checks if a position overlaps any placed product.
+
+    Args:
+        new_position (Position): Candidate position
+        existing_coordinates (List[tuple] | SpatialGrid | ExtentArray): Coordinates of
+            the placed products; a SpatialGrid only checks the products near the
+            candidate, an ExtentArray checks all products in one array operation
+
+    Returns:
+        bool: True if the candidate overlaps a placed product
+    """
+    return check_extent_collision(new_position.get_product(), *new_position.get_coordinates(), *new_position.get_dimensions(), existing_coordinates)
+
+def check_extent_collision(product, new_x, new_y, new_z, new_width, new_height, new_length, existing_coordinates):
+    """
+    Checks if a candidate extent overlaps any placed product.
+    Same check as check_collision, for a candidate given as plain numbers
+    instead of a Position.
+
+    Args:
+        product (Product): Candidate product, used for logging
+        new_x (float): Candidate x coordinate
+        new_y (float): Candidate y coordinate
+        new_z (float): Candidate z coordinate
+        new_width (float): Candidate width after rotation
+        new_height (float): Candidate height after rotation
+        new_length (float): Candidate length after rotation
+        existing_coordinates (List[tuple] | SpatialGrid | ExtentArray): Coordinates of the placed products
+
+    Returns:
+        bool: True if the candidate overlaps a placed product
+    """
+    if hasattr(existing_coordinates, 'find_collision'):
+        coord = existing_coordinates.find_collision(new_x, new_y, new_z, new_width, new_height, new_length)
+        if coord:
+            if collision_tracer.active:
+                collision_tracer.log(f"Collision detected between new product {product.item} "
+                                     f"and product {coord[0]} at coordinates {coord[1:4]}.")
+            return True
+
+        if collision_tracer.active:
+            collision_tracer.log(f"No collision detected for product {product.item}.")
+        return False
 
     for coord in existing_coordinates:
         product_id, x, y, z, width, height, length = coord
@@ -15,11 +63,13 @@ def check_collision(new_position, existing_coordinates):
             new_y < y + height and new_y + new_height > y and
             new_z < z + length and new_z + new_length > z
         ):
-            logging.debug(f"Collision detected between new product {new_position.get_product().item} "
-                          f"and product {product_id} at coordinates {x, y, z}.")
+            if collision_tracer.active:
+                collision_tracer.log(f"Collision detected between new product {product.item} "
+                                     f"and product {product_id} at coordinates {x, y, z}.")
             return True
 
-    logging.debug(f"No collision detected for product {new_position.get_product().item}.")
+    if collision_tracer.active:
+        collision_tracer.log(f"No collision detected for product {product.item}.")
     return False
 
 class LayerResult:
@@ -44,21 +94,36 @@ class LayerResult:
         positions (List[Position]): List of placed products with their positions
         last_product (str): ID of the last product placed (for optimization)
         last_space (Fragment): Last space used (for optimization)
+        rejected_dimensions (tuple): Dimensions of the product the rejected spaces belong to
+        rejected_spaces (Dict[int, Fragment]): Spaces that could not take the last
+            product, by id
+        kernel (PythonKernel): Implementation of the fit tests, scalar or vectorized
+        fragment_index (FragmentIndex): Sorted dimensions and volumes of the remaining
+            spaces; rebuilt whenever remaining_spaces is assigned
+        stacks_layers (bool): Whether the box may open a new layer when this layer is
+            full; a new layer starts with a fragment spanning the rest of the box
+        merge_threshold (int): Fragment count above which adjacent fragments are merged
 
     Key Algorithms:
         - Space Splitting: When a product is placed, the surrounding space is split into
           up to 6 new fragments (front, back, left, right, top, bottom)
         - Best Fit Selection: Products are placed in spaces that minimize fragmentation
         - Collision Detection: Ensures products don't overlap with existing placements
+        - Fragment Merging: Once the layer holds more than merge_threshold fragments,
+          fragments whose union is a box are merged into one
     """
 
-    def __init__(self, box, base_height=0):
+    stacks_layers = True
+    merge_threshold = 24
+
+    def __init__(self, box, base_height=0, kernel='python'):
         """
         Initializes a new layer within a box.
 
         Args:
             box (BoxDefinition): The box containing this layer
             base_height (float): Starting height of this layer from box bottom in cm
+            kernel (str): Name of the kernel for the fit tests, 'python' or 'numpy'
 
         Note:
             The layer initially creates one large fragment representing all available space.
@@ -75,6 +140,9 @@ class LayerResult:
 
         self.last_product = None
         self.last_space = None
+        self.rejected_dimensions = None
+        self.rejected_spaces = {}
+        self.kernel = get_kernel(kernel)
 
     def add_product(self, position, existing_coordinates, use_reverse_y = False):
         """
@@ -88,7 +156,7 @@ class LayerResult:
 
         Args:
             position (Position): Product and its initial position/rotation
-            existing_coordinates (List[tuple]): Coordinates of already placed products
+            existing_coordinates (List[tuple] | SpatialGrid): Coordinates of already placed products
             use_reverse_y (bool): Whether to try placements from top to bottom
 
         Returns:
@@ -99,83 +167,68 @@ class LayerResult:
             - Minimizing fragmentation of remaining space
             - Maintaining stability through proper support
             - Efficient space utilization
+
+            The kernel of the layer decides which rotations fit in which space;
+            the scalar and vectorized kernels give the same placements.
+
+            Candidates are compared as plain numbers and a Position is only
+            created for the selected placement; the given position is not changed.
+
+            Spaces tried without success are remembered while units with the same
+            dimensions follow each other. Such a space stays rejected as long as it
+            is not split or merged, since placements only add collisions, so the
+            next unit skips it and gets the placement of the full search.
         """
-        logging.debug(f"Adding product {position.get_product().get_product_name()} {self.box.container_type} to layer")
+        if tracer.active:
+            tracer.log(f"Adding product {position.get_product().get_product_name()} {self.box.container_type} to layer")
         if self.box.container_type == "XXS":
             self.positions.append(position)
             return True
 
         best_fit = None
         best_fit_score = float('inf')
-        best_position = None
         selected_space = None
 
         product = position.get_product()
 
-        found_space = not self.last_space or not self.last_product or product.item != self.last_product
-        list_of_spaces = sorted(self.remaining_spaces, key=lambda individual: not individual.new)
+        if product.get_dimensions() != self.rejected_dimensions:
+            self.rejected_dimensions = product.get_dimensions()
+            self.rejected_spaces = {}
 
-        if found_space:
-            temp_spaces = []
+        # Spaces that could not take the previous unit of this product cannot take this one
+        list_of_spaces = [space for space in self.candidate_spaces(product, use_reverse_y) if self.rejected_spaces.get(id(space)) is not space]
+        rotations = self.candidate_rotations(product.get_dimensions())
+        min_dimension = min(product.get_dimensions())
 
-            for space in list_of_spaces:
-                if space.new:
-                    space.new = False
-                if space.volume() >= product.volume() and found_space:
-                    temp_spaces.append(space)
-
-                if not found_space:
-                    found_space = space == self.last_space
-
-            list_of_spaces = sorted(temp_spaces, key=lambda individual: (individual.z, individual.x), reverse=False)
-
-        if self.last_space and self.last_product and product.item != self.last_product:
-            if list_of_spaces.count(self.last_space) > 0:
-                list_of_spaces.remove(self.last_space)
-                self.last_space = None
-
-        for space in sorted(list_of_spaces, key=lambda individual: individual.y, reverse=use_reverse_y):
-            rotation = RotationType.initial_rotation(*(product.get_dimensions()))
-            current_rotation = None
-
-            if (best_position):
+        # Candidates are kept as the selected space and rotation index while searching
+        for space, fitting_rotations in zip(list_of_spaces, self.kernel.fitting_rotations(list_of_spaces, rotations, self.box)):
+            if selected_space is not None:
                 break
 
-            for _ in range(rotation.min_value(), rotation.max_value()):
-                if not current_rotation:
-                    current_rotation = rotation
-                else:
-                    current_rotation = current_rotation.next_rotation()
-
-                rotated_width, rotated_height, rotated_length = current_rotation.adjust_dimensions(*(product.get_dimensions()))
+            # Rejected unless a rotation is selected below
+            self.rejected_spaces[id(space)] = space
 
-                if (
-                        rotated_width <= space.width and
-                        rotated_length <= space.length and
-                        rotated_height <= space.height
-                ):
-                    position.set_orientation(current_rotation)
-                    position.set_coordinates(space.x, space.y, space.z)
+            # Not even the smallest side of the product fits above this space
+            if (space.y + min_dimension > self.box.height):
+                continue
 
-                    # if True:
-                    if not any(position.calculate_extending_point()[i] > self.box.get_box_dimensions()[i] for i in range(3)):
-                        if (space.y + min(product.get_dimensions()) > self.box.height):
-                            break
+            for index in fitting_rotations:
+                rotated_width, rotated_height, rotated_length = rotations[index][1]
 
-                        if check_collision(position, existing_coordinates):
-                            continue
+                if self.collides(product, space.x, space.y, space.z, rotated_width, rotated_height, rotated_length, existing_coordinates):
+                    continue
 
-                        fragmentation = (space.width - rotated_width) * (space.length - rotated_length)
-                        if fragmentation < best_fit_score:
-                            best_position = position.copy()
-                            best_fit_score = fragmentation
-                            best_fit = current_rotation
-                            selected_space = space
+                fragmentation = (space.width - rotated_width) * (space.length - rotated_length)
+                if fragmentation < best_fit_score:
+                    best_fit_score = fragmentation
+                    best_fit = index
+                    selected_space = space
 
-        if best_position and best_fit and selected_space:
+        if selected_space is not None:
+            del self.rejected_spaces[id(selected_space)]
             self.last_space = selected_space
             self.last_product = product.item
-            best_position.set_orientation(best_fit)
+            best_position = Position(product, selected_space.x, selected_space.y, selected_space.z, rotations[best_fit][0])
             self.positions.append(best_position)
             self.update_remaining_spaces(best_position)
             return True
@@ -183,6 +236,128 @@ class LayerResult:
         return False
 
 
+    def seed_position(self, position):
+        """
+        Adds a product at a known position, taken over from the layout of another box.
+
+        Args:
+            position (Position): Position of the product, placed before in a box
+                with the same origin that is not larger along any axis
+
+        Note:
+            - The free space is updated as for a placement found by add_product
+            - The caller must make sure the position is inside this box and does
+              not overlap the products of this layer
+        """
+        self.positions.append(position)
+        self.update_remaining_spaces(position)
+
+    def candidate_spaces(self, product, use_reverse_y=False):
+        """
+        Returns the spaces to try for a product, in placement priority order.
+
+        The priority is:
+        1. Lowest y first (highest first with use_reverse_y)
+        2. For a product other than the last placed one, lowest z, then lowest x;
+           only spaces with at least the effective product volume are used and
+           the space of the last placement is skipped
+        3. Spaces created by the last placement first
+        4. Order in remaining_spaces
+
+        Args:
+            product (Product): Product to place
+            use_reverse_y (bool): Whether to try spaces from top to bottom
+
+        Returns:
+            List[Fragment]: Spaces whose sorted dimensions dominate the product
+
+        Note:
+            - The priority is one combined sort key over the candidates, instead of
+              a sort of all spaces per criterion
+            - Spaces that cannot hold the product in any rotation are dropped
+              through the fragment index before sorting
+            - For a product other than the last placed one, the new flags of all
+              spaces are cleared
+        """
+        spaces = self.fragment_index.fragments
+        direction = -1 if use_reverse_y else 1
+
+        if self.last_space and self.last_product and product.item == self.last_product:
+            # Same product as the last placement: all spaces, new ones first
+            candidates = range(len(spaces))
+            keys = {index: (direction * spaces[index].y, not spaces[index].new, index) for index in candidates}
+        else:
+            candidates = self.fragment_index.with_volume(product.volume())
+            keys = {index: (spaces[index].z, spaces[index].x, not spaces[index].new, index) for index in candidates}
+
+            for space in spaces:
+                space.new = False
+
+            if self.last_space and self.last_product:
+                # Skip the first occurrence of the last used space
+                for index in sorted(candidates, key=keys.__getitem__):
+                    if spaces[index] == self.last_space:
+                        candidates.remove(index)
+                        self.last_space = None
+                        break
+
+            keys = {index: (direction * spaces[index].y, *key) for index, key in keys.items()}
+
+        product_dimensions = tuple(sorted(product.get_dimensions(), reverse=True))
+        candidates = sorted(self.fragment_index.dominating(product_dimensions, candidates), key=keys.__getitem__)
+
+        return [spaces[index] for index in candidates]
+
+    def collides(self, product, x, y, z, width, height, length, existing_coordinates):
+        """
+        Checks if a candidate placement overlaps a placed product.
+
+        Args:
+            product (Product): Candidate product
+            x (float): Candidate x coordinate
+            y (float): Candidate y coordinate
+            z (float): Candidate z coordinate
+            width (float): Candidate width after rotation
+            height (float): Candidate height after rotation
+            length (float): Candidate length after rotation
+            existing_coordinates (List[tuple] | SpatialGrid | ExtentArray): Coordinates of the placed products
+
+        Returns:
+            bool: True if the candidate overlaps a placed product
+
+        Note:
+            - Fragments of this layer can overlap products placed in other layers
+              or inside the fragment, so every candidate is checked
+        """
+        return check_extent_collision(product, x, y, z, width, height, length, existing_coordinates)
+
+    @staticmethod
+    def candidate_rotations(dimensions):
+        """
+        Returns the rotations tried for a product, in the order they are tried.
+
+        Args:
+            dimensions (tuple): Product dimensions as (width, height, length)
+
+        Returns:
+            tuple: (RotationType, (width, height, length)) per distinct orientation,
+            starting at the initial rotation of the product
+
+        Note:
+            - The search tries five rotations, cycling from the initial one
+            - Rotations that repeat an earlier orientation are left out, since
+              they cannot give a better placement
+        """
+        return RotationType.rotation_table(*dimensions, count=RotationType.max_value() - RotationType.min_value())
+
+    @property
+    def remaining_spaces(self):
+        return self.fragment_index.fragments
+
+    @remaining_spaces.setter
+    def remaining_spaces(self, spaces):
+        self.fragment_index = FragmentIndex(spaces)
+
     def update_remaining_spaces(self, position):
         """
         Updates the available spaces after placing a product by splitting existing spaces.
@@ -216,10 +391,112 @@ class LayerResult:
                 updated_spaces.append(space)
 
         self.remaining_spaces = updated_spaces
-        logging.debug(
-            f"Updated remaining spaces after placing product {position.get_product().item}: {self.remaining_spaces}"
+
+        if len(self.remaining_spaces) > self.merge_threshold:
+            self.remaining_spaces = self.merge_fragments(self.remaining_spaces)
+
+        if tracer.active:
+            tracer.log(
+                f"Updated remaining spaces after placing product {position.get_product().item}: {self.remaining_spaces}"
+            )
+
+    @staticmethod
+    def merge_fragments(spaces):
+        """
+        Merges fragments whose union is a box until no such pair is left.
+
+        Args:
+            spaces (List[Fragment]): Fragments to merge
+
+        Returns:
+            List[Fragment]: Merged fragments; a merged fragment takes the place of
+            the first of its parts
+
+        Note:
+            - Thin slivers next to each other are often only usable together
+            - Only unions that are a box are merged, so no space is added
+            - Each fragment is merged into the first earlier fragment it can merge
+              with, found through the fragments grouped by their extents instead
+              of a scan over all earlier fragments
+        """
+        changed = True
+
+        while changed:
+            changed = False
+            merged_spaces = []
+            # Per axis, indices of the merged fragments by their extent along the other two axes
+            groups = ({}, {}, {})
+
+            for space in spaces:
+                target = None
+
+                for axis, key in enumerate(LayerResult.merge_keys(space)):
+                    start, end = LayerResult.axis_extent(space, axis)
+
+                    for index in groups[axis].get(key, ()):
+                        if target is not None and index >= target:
+                            break
+
+                        other_start, other_end = LayerResult.axis_extent(merged_spaces[index], axis)
+                        if other_start <= end and start <= other_end:
+                            target = index
+                            break
+
+                if target is None:
+                    for axis, key in enumerate(LayerResult.merge_keys(space)):
+                        groups[axis].setdefault(key, []).append(len(merged_spaces))
+                    merged_spaces.append(space)
+                    continue
+
+                other = merged_spaces[target]
+                for axis, key in enumerate(LayerResult.merge_keys(other)):
+                    groups[axis][key].remove(target)
+
+                merged_spaces[target] = other.merge(space)
+                for axis, key in enumerate(LayerResult.merge_keys(merged_spaces[target])):
+                    insort(groups[axis].setdefault(key, []), target)
+
+                changed = True
+
+            spaces = merged_spaces
+
+        return spaces
+
+    @staticmethod
+    def merge_keys(space):
+        """
+        Returns the extents a fragment must share with another to merge along each axis.
+
+        Args:
+            space (Fragment): Fragment
+
+        Returns:
+            tuple: Extent along y and z, along x and z, and along x and y
+        """
+        return (
+            (space.y, space.height, space.z, space.length),
+            (space.x, space.width, space.z, space.length),
+            (space.x, space.width, space.y, space.height),
         )
 
+    @staticmethod
+    def axis_extent(space, axis):
+        """
+        Returns the start and end of a fragment along one axis.
+
+        Args:
+            space (Fragment): Fragment
+            axis (int): 0 for x, 1 for y, 2 for z
+
+        Returns:
+            tuple: (start, end)
+        """
+        if axis == 0:
+            return space.x, space.x + space.width
+        if axis == 1:
+            return space.y, space.y + space.height
+        return space.z, space.z + space.length
+
     def split_space_around_product(self, space, position):
         fragments = []
         start_x, start_y, start_z = position.get_coordinates()
@@ -229,7 +506,8 @@ class LayerResult:
             and (space.y <= start_y < space.y + space.height and space.y < end_y <= space.y + space.height) \
             and (space.z <= start_z < space.z + space.length and space.z < end_z <= space.z + space.length):
 
-            logging.debug("Splitting space")
+            if tracer.active:
+                tracer.log("Splitting space")
             if space.x <= start_x < space.x + space.width:
                 fragments.append(Fragment(space.x, space.y, space.z, start_x - space.x, space.height, space.length))
             if space.x < end_x <= space.x + space.width:
@@ -245,18 +523,19 @@ class LayerResult:
             if space.z < end_z <= space.z + space.length:
                 fragments.append(Fragment(space.x, space.y, end_z, space.width, space.height, space.z + space.length - end_z))
         else:
-            logging.debug("Not splitting space")
+            if tracer.active:
+                tracer.log("Not splitting space")
             fragments.append(space)
 
-        logging.debug(f"Split space {space} around product {position.get_product().item}. Fragments: {fragments}")
+        if tracer.active:
+            tracer.log(f"Split space {space} around product {position.get_product().item}. Fragments: {fragments}")
         return fragments
 
     def find_fit_in_remaining_spaces(self, product, existing_coordinates):
+        rotations = RotationType.rotation_table(product.width, product.height, product.length, RotationType.RT1)
+
         for space in self.remaining_spaces:
-            for rotation in RotationType:
-                width, height, length = rotation.adjust_dimensions(
-                    product.width, product.height, product.length
-                )
+            for rotation, (width, height, length) in rotations:
                 if (
                         width <= space.width and
                         height <= space.height and
@@ -267,10 +546,11 @@ class LayerResult:
                     if not check_collision(position, existing_coordinates):
                         self.update_remaining_spaces(position)
                         self.positions.append(position)
-                        logging.debug(
-                            f"Product {product.get_product_name()} placed in fragmented space. "
-                            f"Coordinates: {position.get_coordinates()}."
-                        )
+                        if tracer.active:
+                            tracer.log(
+                                f"Product {product.get_product_name()} placed in fragmented space. "
+                                f"Coordinates: {position.get_coordinates()}."
+                            )
                         return True
         return False
 
@@ -281,4 +561,17 @@ class LayerResult:
         """
               Return a list of all products with their coordinates and dimensions.
         """
-        return [(p.get_product().get_product_name(), *p.get_coordinates(), *p.get_dimensions()) for p in self.positions]
+        return [self.get_position_coordinates(p) for p in self.positions]
+
+    @staticmethod
+    def get_position_coordinates(position):
+        """
+        Return the coordinates and dimensions of a single placed product.
+
+        Args:
+            position (Position): Placed product
+
+        Returns:
+            tuple: (product_id, x, y, z, width, height, length)
+        """
+        return (position.get_product().get_product_name(), *position.get_coordinates(), *position.get_dimensions())
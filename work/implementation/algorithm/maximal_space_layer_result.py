@@ -0,0 +1,161 @@
+from .fragment import Fragment
+from .layer_result import LayerResult
+from .tracing import get_tracer
+
+tracer = get_tracer('layer')
+
+class MaximalSpaceLayerResult(LayerResult):
+    """
+    A layer that tracks the free space of the box as maximal empty spaces.
+    This class replaces the split of LayerResult, which only splits a fragment
+    when the product lies fully inside it and otherwise keeps the fragment as is.
+
+    After a product is placed, every fragment that intersects it is clipped to
+    the parts left, right, below, above, in front of and behind the product, each
+    part spanning the full fragment along the other two axes. Fragments that lie
+    inside another fragment are dropped.
+
+    As a result:
+    1. Every fragment is free of placed products
+    2. Every free spot of the box lies in at least one fragment
+    3. The fragment list only holds fragments that are not redundant
+
+    Attributes:
+        stacks_layers (bool): False, since the fragments of one layer already
+            cover all free space of the box
+
+    Key Features:
+        - Placements need no collision check
+        - A box uses a single layer
+        - Same placement priority as LayerResult
+    """
+
+    stacks_layers = False
+
+    def collides(self, product, x, y, z, width, height, length, existing_coordinates):
+        """
+        Checks if a candidate placement overlaps a placed product.
+
+        Args:
+            product (Product): Candidate product
+            x (float): Candidate x coordinate
+            y (float): Candidate y coordinate
+            z (float): Candidate z coordinate
+            width (float): Candidate width after rotation
+            height (float): Candidate height after rotation
+            length (float): Candidate length after rotation
+            existing_coordinates (List[tuple] | SpatialGrid | ExtentArray): Coordinates of the placed products
+
+        Returns:
+            bool: Always False, a candidate that fits in a fragment is free
+        """
+        return False
+
+    def update_remaining_spaces(self, position):
+        """
+        Clips all fragments that intersect a newly placed product.
+
+        Args:
+            position (Position): The position of the newly placed product
+
+        Note:
+            - Fragments that do not intersect the product are kept unchanged
+            - Clipped parts are marked as new fragments
+            - Fragments contained in another fragment are removed afterwards
+            - Above merge_threshold fragments, fragments whose union is a box are
+              merged; the union of two free fragments is free as well
+        """
+        updated_spaces = []
+        start = position.get_coordinates()
+        end = position.calculate_extending_point()
+
+        for space in self.remaining_spaces:
+            if self.intersects(space, start, end):
+                updated_spaces += self.clip_space(space, start, end)
+            else:
+                updated_spaces.append(space)
+
+        self.remaining_spaces = self.remove_contained_spaces(updated_spaces)
+
+        if len(self.remaining_spaces) > self.merge_threshold:
+            self.remaining_spaces = self.remove_contained_spaces(self.merge_fragments(self.remaining_spaces))
+
+        if tracer.active:
+            tracer.log(
+                f"Updated maximal spaces after placing product {position.get_product().item}: {self.remaining_spaces}"
+            )
+
+    @staticmethod
+    def intersects(space, start, end):
+        """
+        Checks if a fragment and a product extent overlap.
+
+        Args:
+            space (Fragment): Fragment to check
+            start (tuple): (x, y, z) of the product
+            end (tuple): Extending point of the product
+
+        Returns:
+            bool: True if they share a volume; touching is not overlapping
+        """
+        return (start[0] < space.x + space.width and end[0] > space.x and
+                start[1] < space.y + space.height and end[1] > space.y and
+                start[2] < space.z + space.length and end[2] > space.z)
+
+    @staticmethod
+    def clip_space(space, start, end):
+        """
+        Returns the maximal parts of a fragment outside a product extent.
+
+        Args:
+            space (Fragment): Fragment intersecting the product
+            start (tuple): (x, y, z) of the product
+            end (tuple): Extending point of the product
+
+        Returns:
+            List[Fragment]: Up to six fragments, in the order left, right, below,
+            above, front and back of the product
+        """
+        fragments = []
+
+        if start[0] > space.x:
+            fragments.append(Fragment(space.x, space.y, space.z, start[0] - space.x, space.height, space.length))
+        if end[0] < space.x + space.width:
+            fragments.append(Fragment(end[0], space.y, space.z, space.x + space.width - end[0], space.height, space.length))
+
+        if start[1] > space.y:
+            fragments.append(Fragment(space.x, space.y, space.z, space.width, start[1] - space.y, space.length))
+        if end[1] < space.y + space.height:
+            fragments.append(Fragment(space.x, end[1], space.z, space.width, space.y + space.height - end[1], space.length))
+
+        if start[2] > space.z:
+            fragments.append(Fragment(space.x, space.y, space.z, space.width, space.height, start[2] - space.z))
+        if end[2] < space.z + space.length:
+            fragments.append(Fragment(space.x, space.y, end[2], space.width, space.height, space.z + space.length - end[2]))
+
+        return fragments
+
+    @staticmethod
+    def remove_contained_spaces(spaces):
+        """
+        Drops fragments that lie inside another fragment.
+
+        Args:
+            spaces (List[Fragment]): Fragments to prune
+
+        Returns:
+            List[Fragment]: Remaining fragments in their original order
+
+        Note:
+            - Of several identical fragments, only the first one is kept
+        """
+        kept = []
+
+        for index, space in enumerate(spaces):
+            if not any(
+                other.contains(space) and (index > other_index or not space.contains(other))
+                for other_index, other in enumerate(spaces) if other_index != index
+            ):
+                kept.append(space)
+
+        return kept
@@ -1,3 +1,5 @@
+from operator import attrgetter
+
 from .product import Product
 
 class Order:
@@ -10,6 +12,7 @@ class Order:
     - Order metadata (number, date)
     - Product sorting and prioritization
     - Order state tracking
+    - Quantity-aware order lines (product definition, unit count)
 
     Attributes:
         rejected_items (List[Product]): Products that couldn't be packed
@@ -18,6 +21,19 @@ class Order:
         packed_items (List[Product]): Successfully packed products
         order_number (str): Unique identifier for the order
         date_time (str): Order timestamp
+        units (List[Product]): All products of the order, in packing order once sorted
+        states (List[int]): State per unit: PENDING, TAKEN, REJECTED or PACKED
+        positions (Dict[int, int]): Index in units per product id
+        cursor (int): Index of the first unit that may still be pending
+        taken (Dict[int, Product]): Taken products by id, in the order they were taken
+        rejected (Dict[int, Product]): Rejected products by id, in the order they were rejected
+        packed (Dict[int, Product]): Packed products by id, in the order they were packed
+        is_sorted (bool): Whether units is in packing order
+        pending_volume (float): Total effective volume of the pending products
+        pending_weight (float): Total weight of the pending products
+        pending_counts (Dict[ProductDefinition, int]): Pending units per product definition
+        max_dimensions (List[float]): Maximum width, height and length of the pending
+            products, or None until it is read after a maximum product left
 
     Key Features:
         - Product state management
@@ -26,8 +42,23 @@ class Order:
         - Product sorting optimization
         - Order reset capabilities
         - Item tracking through packing process
+        - Runs of identical units that can be taken and rejected as a batch
+        - Units are sorted once; taking, rejecting and resetting a unit only
+          changes its state flag, so the packing order is kept without resorting
+        - Totals and maxima of the pending products are kept up to date with the
+          states, so box selection reads them without a pass over the items
+
+    Note:
+        - items, taken_items, rejected_items and packed_items are built from the
+          states when read; the packing code moves units through the states
+        - Every product is expected in the order at most once
     """
-    
+
+    PENDING = 0
+    TAKEN = 1
+    REJECTED = 2
+    PACKED = 3
+
     def __init__(self, order_number, date_time, items = []):
         """
         Initializes a new order with metadata and optional initial items.
@@ -41,29 +72,97 @@ class Order:
             - Initializes all product tracking lists
             - Sets order metadata
             - Prepares for product management
+            - The given list is copied, so it is not changed by the order
         """
         self.order_number = order_number
         self.date_time = date_time
-        self.rejected_items = []
-        self.items = items
-        self.taken_items = []
-        self.packed_items = []
-    
-    def add_item(self, item):
+        self.units = []
+        self.states = []
+        self.positions = {}
+        self.cursor = 0
+        self.taken = {}
+        self.rejected = {}
+        self.packed = {}
+        self.is_sorted = True
+        self.pending_volume = 0
+        self.pending_weight = 0
+        self.pending_counts = {}
+        self.max_dimensions = None
+
+        for item in items:
+            self.add_item(item)
+
+    def __getstate__(self):
+        """
+        Returns the state to pickle, with the id-keyed maps stored as unit indices.
+
+        Returns:
+            dict: Attributes of the order
+
+        Note:
+            - Product ids change when an order is sent to a worker process, so
+              positions is left out and taken, rejected and packed are stored as
+              lists of indices in units, in the order they were added
+        """
+        state = self.__dict__.copy()
+        del state['positions']
+
+        for name in ('taken', 'rejected', 'packed'):
+            state[name] = [self.positions[key] for key in state[name]]
+
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores a pickled order and rebuilds the id-keyed maps for the new products.
+
+        Args:
+            state (dict): State returned by __getstate__
+        """
+        self.__dict__.update(state)
+        self.positions = {id(item): index for index, item in enumerate(self.units)}
+
+        for name in ('taken', 'rejected', 'packed'):
+            setattr(self, name, {id(self.units[index]): self.units[index] for index in state[name]})
+
+    @property
+    def items(self):
+        return [self.units[index] for index in range(self.cursor, len(self.units)) if self.states[index] == Order.PENDING]
+
+    @property
+    def taken_items(self):
+        return list(self.taken.values())
+
+    @property
+    def rejected_items(self):
+        return list(self.rejected.values())
+
+    @property
+    def packed_items(self):
+        return list(self.packed.values())
+
+    def add_item(self, item, state=PENDING):
         """
         Adds a single product to the order.
         Used for individual product additions.
 
         Args:
             item (Product): Product to add to the order
+            state (int): Initial state of the product, PENDING by default
 
         Note:
             - Adds to pending items list
             - Used during order building
             - Maintains product state
         """
-        self.items.append(item)
-    
+        self.positions[id(item)] = len(self.units)
+        self.units.append(item)
+        self.states.append(state)
+
+        if state == Order.PENDING:
+            self.is_sorted = False
+            self.add_pending(item)
+
     def add_items(self, items):
         """
         Adds multiple products to the order at once.
@@ -77,10 +176,123 @@ class Order:
             - Triggers product sorting
             - Prepares for packing
         """
-        self.items.extend(items)
+        for item in items:
+            self.add_item(item)
 
         self.order_items()
-    
+
+    def set_state(self, item, state):
+        """
+        Moves a product of the order to another state.
+
+        Args:
+            item (Product): Product of the order
+            state (int): New state
+
+        Returns:
+            bool: False if the product is not part of the order
+
+        Note:
+            - Constant time: the state flag and the ordered state maps are updated,
+              no list is searched or resorted
+            - The cursor moves back when a product becomes pending again
+        """
+        index = self.positions.get(id(item))
+
+        if index is None:
+            return False
+
+        self.set_index_state(index, state)
+        return True
+
+    def set_index_state(self, index, state):
+        """
+        Moves the product at an index of units to another state.
+
+        Args:
+            index (int): Index in units
+            state (int): New state
+        """
+        item = self.units[index]
+        key = id(item)
+        previous = self.states[index]
+
+        if previous == Order.TAKEN:
+            del self.taken[key]
+        elif previous == Order.REJECTED:
+            del self.rejected[key]
+        elif previous == Order.PACKED:
+            del self.packed[key]
+
+        if state == Order.TAKEN:
+            self.taken[key] = item
+        elif state == Order.REJECTED:
+            self.rejected[key] = item
+        elif state == Order.PACKED:
+            self.packed[key] = item
+        elif index < self.cursor:
+            self.cursor = index
+
+        if previous == Order.PENDING and state != Order.PENDING:
+            self.remove_pending(item)
+        elif previous != Order.PENDING and state == Order.PENDING:
+            self.add_pending(item)
+
+        self.states[index] = state
+
+    def add_pending(self, item):
+        """
+        Adds a product that became pending to the pending totals and maxima.
+
+        Args:
+            item (Product): Pending product
+        """
+        definition = item.definition
+        self.pending_volume += item.volume()
+        self.pending_weight += definition.weight
+        self.pending_counts[definition] = self.pending_counts.get(definition, 0) + 1
+
+        if self.max_dimensions is not None:
+            self.max_dimensions = [
+                max(self.max_dimensions[0], definition.width),
+                max(self.max_dimensions[1], definition.height),
+                max(self.max_dimensions[2], definition.length),
+            ]
+
+    def remove_pending(self, item):
+        """
+        Removes a product that is no longer pending from the pending totals and maxima.
+
+        Args:
+            item (Product): Product that was pending
+
+        Note:
+            - The maxima are dropped when the last pending unit of a product with
+              a maximum dimension leaves, and recomputed when they are read
+            - The totals are reset to zero once no product is pending, so
+              rounding errors do not build up
+        """
+        definition = item.definition
+        count = self.pending_counts[definition] - 1
+
+        if count:
+            self.pending_counts[definition] = count
+        else:
+            del self.pending_counts[definition]
+
+            if self.max_dimensions is not None and (
+                    definition.width == self.max_dimensions[0] or
+                    definition.height == self.max_dimensions[1] or
+                    definition.length == self.max_dimensions[2]):
+                self.max_dimensions = None
+
+        if self.pending_counts:
+            self.pending_volume -= item.volume()
+            self.pending_weight -= definition.weight
+        else:
+            self.pending_volume = 0
+            self.pending_weight = 0
+
     def add_rejected_item(self, item):
         """
         Marks a product as rejected from packing.
@@ -93,16 +305,27 @@ class Order:
             - Moves product to rejected list
             - Removes from pending/taken lists
             - Tracks packing failures
+            - A product that is not part of the order is added as rejected
         """
-        self.rejected_items.append(item)
+        if not self.set_state(item, Order.REJECTED):
+            self.add_item(item, Order.REJECTED)
+            self.rejected[id(item)] = item
 
-        if item in self.items:
-            self.items.remove(item)
-        
-        if item in self.taken_items:
-            self.taken_items.remove(item)
+    def add_rejected_items(self, items):
+        """
+        Marks several products as rejected from packing at once.
+        Batch version of add_rejected_item for runs of identical units.
+
+        Args:
+            items (List[Product]): Products that couldn't be packed
+
+        Note:
+            - Moves products to rejected list
+            - Constant time per product
+        """
+        for item in items:
+            self.add_rejected_item(item)
 
-    
     def reset_rejected_items(self):
         """
         Returns rejected items to pending status.
@@ -111,14 +334,11 @@ class Order:
         Note:
             - Moves items back to pending list
             - Clears rejected items list
-            - Triggers product resorting
             - Enables packing retries
+            - Pending items stay in packing order without resorting
         """
-        self.items.extend(self.rejected_items)
-        self.rejected_items = []
-        
-        self.order_items()
-    
+        self.reset_state(self.rejected)
+
     def reset_all_items(self):
         """
         Resets all items to pending status.
@@ -128,15 +348,21 @@ class Order:
             - Consolidates all items to pending list
             - Clears other product lists
             - Resets packing progress
-            - Triggers product resorting
+            - Pending items stay in packing order without resorting
         """
-        self.items.extend(self.rejected_items)
-        self.rejected_items = []
-        self.items.extend(self.taken_items)
-        self.taken_items = []
+        self.reset_state(self.rejected)
+        self.reset_state(self.taken)
+
+    def reset_state(self, products):
+        """
+        Returns the products of one state map to pending status.
+
+        Args:
+            products (Dict[int, Product]): The taken or rejected map
+        """
+        for key in list(products):
+            self.set_index_state(self.positions[key], Order.PENDING)
 
-        self.order_items()
-    
     def order_items(self):
         """
         Sorts products for optimal packing sequence.
@@ -144,12 +370,25 @@ class Order:
 
         Note:
             - Sorts by volume and dimensions
+            - Sorts on the sort key of the product definitions, computed once per SKU
             - Optimizes packing efficiency
             - Considers product stability
             - Affects packing success rate
+            - Only sorts if pending products were added since the last sort;
+              the states of the products are kept
         """
-        self.items = sorted(self.items, key=lambda item: item, reverse=True)
-    
+        if self.is_sorted:
+            return
+
+        pending = sorted(self.items, key=attrgetter('definition.sort_key'), reverse=True)
+        others = [(item, state) for item, state in zip(self.units, self.states) if state != Order.PENDING]
+
+        self.units = [item for item, _ in others] + pending
+        self.states = [state for _, state in others] + [Order.PENDING] * len(pending)
+        self.positions = {id(item): index for index, item in enumerate(self.units)}
+        self.cursor = len(others)
+        self.is_sorted = True
+
     def get_items(self):
         """
         Returns the list of items in the order.
@@ -158,11 +397,12 @@ class Order:
             (list): The list of items in the order.
         """
         templist = self.items
-        self.taken_items.extend(templist)
-        self.items = []
+
+        for item in templist:
+            self.set_state(item, Order.TAKEN)
 
         return templist
-    
+
     def get_total_volume(self):
         """
         Calculates total volume of all pending products.
@@ -175,8 +415,9 @@ class Order:
             - Considers product fit ratios
             - Used in box selection
             - Helps optimize packing
+            - Read from the running total, kept up to date with the item states
         """
-        return sum([item.volume() for item in self.items])
+        return self.pending_volume
 
     def get_total_weight(self):
         """
@@ -190,8 +431,9 @@ class Order:
             - Critical for box selection
             - Ensures weight limits
             - Considers all pending items
+            - Read from the running total, kept up to date with the item states
         """
-        return sum([item.weight for item in self.items])
+        return self.pending_weight
     
     def get_dimensions(self):
         """
@@ -205,17 +447,18 @@ class Order:
             - Considers all orientations
             - Used in box selection
             - Ensures product fit
+            - Computed over the pending product definitions only when a maximum
+              product left since the last call; a copy is returned
         """
-        sorted_dimensions = sorted(
-            [(item.width, item.height, item.length) for item in self.items],
-            key=lambda dims: sorted(dims, reverse=True),
-            reverse=True
-        )
-        return [
-            max([dims[0] for dims in sorted_dimensions]),
-            max([dims[1] for dims in sorted_dimensions]),
-            max([dims[2] for dims in sorted_dimensions])
-        ]
+        if self.max_dimensions is None:
+            definitions = self.pending_counts
+            self.max_dimensions = [
+                max([definition.width for definition in definitions]),
+                max([definition.height for definition in definitions]),
+                max([definition.length for definition in definitions])
+            ]
+
+        return list(self.max_dimensions)
     
     def take_item(self):
         """
@@ -230,13 +473,78 @@ class Order:
             - Maintains packing order
             - Tracks taken items
         """
-        if len(self.items) > 0:
-            item = self.items.pop(0)
-            self.taken_items.append(item)
+        index = self.next_pending()
+
+        if index is None:
+            return None
 
-            return item
-        
-        return None
+        self.set_index_state(index, Order.TAKEN)
+        return self.units[index]
+
+    def next_pending(self):
+        """
+        Advances the cursor to the first pending product.
+
+        Returns:
+            int: Index of the first pending product in units, or None if no
+            product is pending
+        """
+        while self.cursor < len(self.units) and self.states[self.cursor] != Order.PENDING:
+            self.cursor += 1
+
+        return self.cursor if self.cursor < len(self.units) else None
+
+    def take_run(self):
+        """
+        Removes and returns the next run of identical units for packing.
+        A run is the sequence of pending units, from the front of the list,
+        that share the same product definition.
+
+        Returns:
+            List[Product]: Units of the next run, or an empty list if no items are pending
+
+        Note:
+            - Moves the whole run to the taken items
+            - Maintains packing order
+            - Units built without a shared definition form runs of one
+        """
+        index = self.next_pending()
+
+        if index is None:
+            return []
+
+        definition = self.units[index].definition
+        run = []
+
+        while index < len(self.units):
+            if self.states[index] == Order.PENDING:
+                if self.units[index].definition is not definition:
+                    break
+
+                self.set_index_state(index, Order.TAKEN)
+                run.append(self.units[index])
+
+            index += 1
+
+        return run
+
+    def get_lines(self):
+        """
+        Summarizes the pending items as quantity-aware order lines.
+
+        Returns:
+            List[tuple]: (ProductDefinition, unit count) per product, in packing order
+
+        Note:
+            - Units of one product are counted together even if they are not adjacent
+            - Used to detect single-product orders
+        """
+        counts = {}
+        for item in self.items:
+            definition = item.definition
+            counts[definition] = counts.get(definition, 0) + 1
+
+        return list(counts.items())
 
     def take_specific_item(self, item):
         """
@@ -245,12 +553,13 @@ class Order:
         Args:
             item (Product): The item to be removed from the order.
         """
-        if (item in self.items):
-            self.items.remove(item)
-            self.taken_items.append(item)
-            return item
-        
-        return None
+        index = self.positions.get(id(item))
+
+        if index is None or self.states[index] != Order.PENDING:
+            return None
+
+        self.set_index_state(index, Order.TAKEN)
+        return item
 
     def secure_packed_items(self):
         """
@@ -263,8 +572,8 @@ class Order:
             - Tracks packing success
             - Final state for products
         """
-        self.packed_items.extend(self.taken_items)
-        self.taken_items = []
+        for key in list(self.taken):
+            self.set_index_state(self.positions[key], Order.PACKED)
 
     def get_order_number(self):
         """
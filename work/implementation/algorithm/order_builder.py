@@ -0,0 +1,123 @@
+import numpy as np
+
+from .order import Order
+from .product import Product
+
+class OrderBuilder:
+    """
+    Builds Order objects from a columnar order line table in a single pass.
+    This class replaces mapping create_order over grouped order lines in a
+    process pool, where pickling and per-order product loading cost more than
+    the work itself.
+
+    The build works on whole columns at once:
+    1. Order numbers and product IDs are factorized into integer codes
+    2. Product IDs are joined against the catalog once per distinct ID
+       (all units of a product share its ProductDefinition)
+    3. Order lines are grouped with a stable sort on the order code
+    4. Picked quantities are expanded into one entry per unit with np.repeat
+    5. Orders are created from contiguous slices of the expanded units
+
+    Attributes:
+        catalog (ProductCatalog): Product lookup used for the join
+
+    Key Features:
+        - No per-line dictionary access or string-to-number parsing
+        - Orders keep the order of first appearance in the file
+        - Order lines keep their file order within an order
+        - Unknown products and invalid quantities are reported and skipped
+
+    Usage:
+        builder = OrderBuilder(catalog)
+        orders = builder.build_orders(order_input_reader.get_columns())
+    """
+
+    def __init__(self, catalog):
+        """
+        Initializes the builder.
+
+        Args:
+            catalog (ProductCatalog): Product lookup used to resolve order lines
+        """
+        self.catalog = catalog
+
+    def build_orders(self, columns):
+        """
+        Creates all orders of an order line table.
+
+        Args:
+            columns (Dict[str, np.ndarray]): Order line columns with at least
+                'Ordernr', 'Date', 'ID', 'Picked' and 'Location'
+
+        Returns:
+            List[Order]: Orders with sorted products, in order of first appearance
+        """
+        order_numbers = np.asarray(columns['Ordernr'])
+        if len(order_numbers) == 0:
+            return []
+
+        # Factorize order numbers, numbering orders by first appearance
+        unique_orders, first_lines, order_codes = np.unique(order_numbers, return_index=True, return_inverse=True)
+        appearance = np.argsort(first_lines, kind='stable')
+        ranks = np.empty_like(appearance)
+        ranks[appearance] = np.arange(len(appearance))
+        order_codes = ranks[order_codes.reshape(-1)]
+
+        # Factorize product IDs and join each distinct ID against the catalog once
+        unique_ids, id_codes = np.unique(np.asarray(columns['ID']), return_inverse=True)
+        id_codes = id_codes.reshape(-1)
+        unique_ids = unique_ids.tolist()
+        definitions = [self.catalog.get_definition(product_id) for product_id in unique_ids]
+        known_ids = np.array([definition is not None for definition in definitions], dtype=bool)
+
+        picked = np.asarray(columns['Picked'], dtype=np.int64)
+        valid_lines = known_ids[id_codes] & (picked >= 0)
+        self.report_invalid_lines(columns, np.flatnonzero(~valid_lines), known_ids[id_codes])
+
+        # Group the valid lines by order, keeping file order within an order
+        line_numbers = np.flatnonzero(valid_lines)
+        line_numbers = line_numbers[np.argsort(order_codes[line_numbers], kind='stable')]
+
+        # Expand picked quantities into one entry per unit
+        units = np.repeat(line_numbers, picked[line_numbers])
+        unit_bounds = np.searchsorted(order_codes[units], np.arange(len(unique_orders) + 1))
+
+        unit_lines = units.tolist()
+        unit_bounds = unit_bounds.tolist()
+        id_codes = id_codes.tolist()
+        locations = np.asarray(columns['Location']).tolist()
+        dates = np.asarray(columns['Date'])[first_lines[appearance]].tolist()
+        order_ids = unique_orders[appearance].tolist()
+
+        orders = []
+        for code, order_number in enumerate(order_ids):
+            items = []
+
+            for line in unit_lines[unit_bounds[code]:unit_bounds[code + 1]]:
+                items.append(Product.from_definition(definitions[id_codes[line]], locations[line]))
+
+            order = Order(order_number, dates[code], items)
+            order.order_items()
+            orders.append(order)
+
+        return orders
+
+    @staticmethod
+    def report_invalid_lines(columns, invalid_lines, known_lines):
+        """
+        Reports order lines that are skipped, in the same format as OrderManager.create_order.
+
+        Args:
+            columns (Dict[str, np.ndarray]): Order line columns
+            invalid_lines (np.ndarray): Indices of the skipped lines
+            known_lines (np.ndarray): Per line, whether its product exists in the catalog
+        """
+        for line in invalid_lines.tolist():
+            item = {name: column[line].item() for name, column in columns.items()}
+
+            if not known_lines[line]:
+                error = f"Product ID {item['ID']} not found in product data."
+            else:
+                error = f"Invalid picked quantity {item['Picked']}."
+
+            print(f"Error creating product for item {item}: {error}")
@@ -1,5 +1,11 @@
 import csv
+import hashlib
 import os
+from math import ceil
+import shutil
+import tempfile
+
+from .snapshot_cache import SnapshotCache
 
 class OrderInputReader:
     """
@@ -17,8 +23,12 @@ class OrderInputReader:
         - Singleton pattern implementation
         - File modification tracking
         - Cached data management
+        - Persistent binary snapshot of the parsed, typed table
         - CSV parsing with headers
         - UTF-8 encoding support
+        - Streaming mode yielding one complete order at a time
+        - Out-of-core grouping of unsorted files through on-disk partitions
+        - Grouping detected with a fixed-size filter of seen order numbers
 
     Example CSV format:
     Date,Ordernr,Boxnr,Picked,Location,Box Name,Weight,ID
@@ -28,13 +38,34 @@ class OrderInputReader:
 
     Attributes:
         _instance (OrderInputReader): Singleton instance
-        loaded_orders (list): Cached order data
+        loaded_orders (list): Rows of the loaded data, or None until get_data builds them
         last_loaded_time (float): Last file modification timestamp
+        loaded_columns (dict): Cached typed columns of the loaded data
+        column_types (dict): Columns parsed as numbers, all others are text
+        snapshot_cache (SnapshotCache): Persistent cache of parsed tables
+        partition_memory_budget (int): Bytes of parsed order lines one partition may
+            hold in memory; sizes the partition count
+        partition_row_overhead (int): Ratio between the memory of parsed order lines
+            and their size in the CSV file
+        max_partition_count (int): Maximum number of partition files open at once
+        max_partition_depth (int): Maximum number of times an oversized partition
+            is split again
+        seen_filter_bits (int): Size in bits of the filter of seen order numbers
+        seen_filter_hashes (int): Bits set per order number in the filter
     """
 
     _instance = None
     loaded_orders = []
+    loaded_columns = {}
     last_loaded_time = None
+    column_types = {'Picked': int, 'Weight': float}
+    partition_memory_budget = 64 * 1024 * 1024
+    partition_row_overhead = 8
+    max_partition_count = 256
+    max_partition_depth = 3
+    seen_filter_bits = 1 << 23
+    seen_filter_hashes = 3
+    snapshot_cache = SnapshotCache()
 
     def __new__(cls, *args, **kwargs):
         """
@@ -52,13 +83,15 @@ class OrderInputReader:
             cls._instance = super(OrderInputReader, cls).__new__(cls, *args, **kwargs)
         return cls._instance
     
-    def read_csv(self, file_path):
+    def read_csv(self, file_path, snapshot_cache=None):
         """
         Reads and parses order data from a CSV file.
         Only reloads if file has been modified since last read.
 
         Args:
             file_path (str): Path to the CSV file containing order data
+            snapshot_cache (SnapshotCache, optional): Cache for the parsed table,
+                the shared snapshot_cache by default
 
         Returns:
             bool: True if new data was loaded, False if using cached data
@@ -66,25 +99,24 @@ class OrderInputReader:
         Note:
             - Checks file modification time
             - Uses UTF-8 with BOM support
-            - Caches loaded data
+            - Reads the binary snapshot instead of the CSV when it is up to date
+            - Numeric columns are typed (see column_types)
+            - Caches the typed columns only; the rows are built by get_data
             - Maintains last loaded timestamp
             - Skips reload if file unchanged
         """
         last_loaded_time = os.path.getmtime(file_path)
 
-        if self.loaded_orders:
+        if self.loaded_columns:
             if hasattr(self, 'last_loaded_time') and self.last_loaded_time == last_loaded_time:
                 return False
             
         self.last_loaded_time = last_loaded_time
-        data = []
+        if snapshot_cache is None:
+            snapshot_cache = self.snapshot_cache
 
-        with open(file_path, mode='r', newline='', encoding='utf-8-sig') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                data.append(row)
-
-        self.loaded_orders = data
+        self.loaded_columns = snapshot_cache.read_csv(file_path, self.column_types)
+        self.loaded_orders = None
 
         return True
 
@@ -100,5 +132,319 @@ class OrderInputReader:
             - Each dictionary represents one order line
             - No file reading in this method
             - Used by OrderManager for order processing
+            - Rows are built from the columns on the first call after a read
         """
+        if self.loaded_orders is None:
+            self.loaded_orders = SnapshotCache.to_rows(self.loaded_columns)
+
         return self.loaded_orders
+
+    def get_columns(self):
+        """
+        Retrieves the cached order data as typed columns.
+
+        Returns:
+            Dict[str, np.ndarray]: One read-only array per CSV column
+
+        Note:
+            - Returns the columns loaded by the last read_csv call
+            - Arrays are memory-mapped when they come from a snapshot
+        """
+        return self.loaded_columns
+
+    def iter_order_lines(self, file_path):
+        """
+        Streams order lines from a CSV file one row at a time.
+        Unlike read_csv, nothing is cached, so memory use does not grow with the file.
+
+        Args:
+            file_path (str): Path to the CSV file containing order data
+
+        Yields:
+            dict: One order line per row
+
+        Note:
+            - Uses UTF-8 with BOM support
+            - Does not touch the cached data of read_csv
+        """
+        with open(file_path, mode='r', newline='', encoding='utf-8-sig') as file:
+            yield from csv.DictReader(file)
+
+    def iter_orders(self, file_path, check_grouped=False):
+        """
+        Streams complete orders from a CSV file whose lines are grouped by order number.
+        Each contiguous run of rows with the same 'Ordernr' is yielded as soon as it ends,
+        so only one order is held in memory at a time.
+
+        Args:
+            file_path (str): Path to the CSV file containing order data
+            check_grouped (bool): Remember every order number to detect orders
+                that are not contiguous; memory then grows with the number of orders
+
+        Yields:
+            List[dict]: All order lines of one order
+
+        Raises:
+            ValueError: If check_grouped is set and an order number appears again
+                after its run has ended, meaning the file is not grouped by order number
+
+        Note:
+            - Requires all lines of an order to be adjacent in the file
+            - Without check_grouped, a run ends when the order number differs from
+              the previous row, so an order that is not contiguous is yielded once per run
+        """
+        seen_orders = set() if check_grouped else None
+        current_order = []
+
+        for row in self.iter_order_lines(file_path):
+            order_id = row['Ordernr']
+
+            if current_order and current_order[0]['Ordernr'] != order_id:
+                yield current_order
+                current_order = []
+
+            if not current_order and seen_orders is not None:
+                if order_id in seen_orders:
+                    raise ValueError(f"Order {order_id} is not contiguous in {file_path}, the file is not grouped by order number.")
+                seen_orders.add(order_id)
+
+            current_order.append(row)
+
+        if current_order:
+            yield current_order
+
+    def iter_orders_auto(self, file_path, partition_count=None, temp_dir=None):
+        """
+        Streams complete orders from a CSV file, whether or not it is grouped by order number.
+        Grouping is checked before the first order is yielded: grouped files are
+        read with iter_orders, all other files through on-disk partitions.
+
+        Args:
+            file_path (str): Path to the CSV file containing order data
+            partition_count (int, optional): Number of partition files, sized from
+                the file by default
+            temp_dir (str, optional): Directory for the temporary partition files
+
+        Yields:
+            List[dict]: All order lines of one order, every order exactly once
+
+        Note:
+            - The grouping check only reads the order numbers, see is_grouped
+        """
+        if self.is_grouped(file_path):
+            yield from self.iter_orders(file_path)
+        else:
+            yield from self.iter_orders_partitioned(file_path, partition_count, temp_dir)
+
+    def is_grouped(self, file_path):
+        """
+        Checks whether all lines of each order are adjacent in a CSV file.
+
+        Args:
+            file_path (str): Path to the CSV file containing order data
+
+        Returns:
+            bool: True if no order number starts a second run, False otherwise
+
+        Note:
+            - Seen order numbers are kept in a fixed-size bit filter, so memory does
+              not grow with the number of orders; a false match only makes a
+              grouped file go through partitions
+            - Stops at the first order number that starts a second run
+        """
+        seen_filter = bytearray(self.seen_filter_bits // 8)
+        last_order_id = None
+
+        with open(file_path, mode='r', newline='', encoding='utf-8-sig') as file:
+            reader = csv.reader(file)
+            column = next(reader, []).index('Ordernr')
+
+            for row in reader:
+                if not row or row[column] == last_order_id:
+                    continue
+
+                last_order_id = row[column]
+                bits = self.filter_bits(last_order_id)
+                if all(seen_filter[bit >> 3] & (1 << (bit & 7)) for bit in bits):
+                    return False
+                for bit in bits:
+                    seen_filter[bit >> 3] |= 1 << (bit & 7)
+
+        return True
+
+    def filter_bits(self, order_id):
+        """
+        Returns the bits of an order number in the filter of seen order numbers.
+
+        Args:
+            order_id (str): Order number
+
+        Returns:
+            List[int]: seen_filter_hashes bit positions below seen_filter_bits
+        """
+        digest = hashlib.blake2b(order_id.encode('utf-8'), digest_size=4 * self.seen_filter_hashes).digest()
+        return [int.from_bytes(digest[index:index + 4], 'little') % self.seen_filter_bits
+                for index in range(0, len(digest), 4)]
+
+    def get_partition_count(self, file_path):
+        """
+        Returns the number of partitions that keeps each partition within the memory budget.
+
+        Args:
+            file_path (str): Path to the CSV file to partition
+
+        Returns:
+            int: Partition count between 1 and max_partition_count
+
+        Note:
+            - Assumes order numbers spread evenly over the partitions; partitions
+              that still exceed the budget are split again when they are read
+        """
+        file_size = os.path.getsize(file_path)
+        partition_count = ceil(file_size * self.partition_row_overhead / self.partition_memory_budget)
+        return min(max(1, partition_count), self.max_partition_count)
+
+    def fits_in_memory(self, partition_path):
+        """
+        Checks whether a partition file can be grouped within the memory budget.
+
+        Args:
+            partition_path (str): Path to a partition file
+
+        Returns:
+            bool: True if the parsed lines of the file fit in partition_memory_budget
+        """
+        return os.path.getsize(partition_path) * self.partition_row_overhead <= self.partition_memory_budget
+
+    @staticmethod
+    def partition_of(order_id, partition_count, level=0):
+        """
+        Returns the partition of an order number.
+
+        Args:
+            order_id (str): Order number
+            partition_count (int): Number of partitions
+            level (int): Number of times the lines were partitioned before; each
+                level uses a differently salted hash, so a partition is split again
+
+        Returns:
+            int: Partition index below partition_count
+        """
+        digest = hashlib.blake2b(order_id.encode('utf-8'), digest_size=4, salt=level.to_bytes(16, 'little')).digest()
+        return int.from_bytes(digest, 'little') % partition_count
+
+    def partition_order_lines(self, file_path, partition_count=None, temp_dir=None, level=0):
+        """
+        Spills the order lines of a CSV file into partition files on disk.
+        Lines are assigned to a partition by a hash of their order number, so
+        every order ends up complete in exactly one partition.
+
+        Args:
+            file_path (str): Path to the CSV file containing order data
+            partition_count (int, optional): Number of partition files to create,
+                sized from the file and the memory budget by default
+            temp_dir (str, optional): Directory in which the partition directory is created
+            level (int): Number of times the lines were partitioned before
+
+        Returns:
+            List[str]: Paths of the partition files, all inside one temporary directory
+
+        Raises:
+            ValueError: If partition_count is below 1
+
+        Note:
+            - Uses a salted BLAKE2 hash so the assignment is the same in every
+              process and differs per level, see partition_of
+            - The caller owns the files, see iter_orders_partitioned for cleanup
+            - Partitions can be grouped independently, e.g. by worker processes
+        """
+        if partition_count is None:
+            partition_count = self.get_partition_count(file_path)
+
+        if partition_count < 1:
+            raise ValueError(f"Partition count must be at least 1, got {partition_count}.")
+
+        partition_dir = tempfile.mkdtemp(prefix='order_partitions_', dir=temp_dir)
+        partition_paths = [os.path.join(partition_dir, f'partition_{index}.csv') for index in range(partition_count)]
+        files = []
+
+        try:
+            with open(file_path, mode='r', newline='', encoding='utf-8-sig') as file:
+                reader = csv.DictReader(file)
+                writers = []
+
+                for partition_path in partition_paths:
+                    partition_file = open(partition_path, mode='w', newline='', encoding='utf-8')
+                    files.append(partition_file)
+                    writer = csv.DictWriter(partition_file, fieldnames=reader.fieldnames)
+                    writer.writeheader()
+                    writers.append(writer)
+
+                for row in reader:
+                    writers[self.partition_of(row['Ordernr'], partition_count, level)].writerow(row)
+        except BaseException:
+            shutil.rmtree(partition_dir, ignore_errors=True)
+            raise
+        finally:
+            for partition_file in files:
+                partition_file.close()
+
+        return partition_paths
+
+    @staticmethod
+    def read_partition(partition_path):
+        """
+        Groups the order lines of a single partition file by order number.
+
+        Args:
+            partition_path (str): Path to a partition created by partition_order_lines
+
+        Returns:
+            Dict[str, List[dict]]: Order lines per order number, in order of first appearance
+        """
+        grouped_data = {}
+
+        with open(partition_path, mode='r', newline='', encoding='utf-8') as file:
+            for row in csv.DictReader(file):
+                grouped_data.setdefault(row['Ordernr'], []).append(row)
+
+        return grouped_data
+
+    def iter_orders_partitioned(self, file_path, partition_count=None, temp_dir=None, level=0):
+        """
+        Streams complete orders from a CSV file that is not grouped by order number.
+        The file is first spilled into hashed partitions on disk, after which each
+        partition is grouped in memory on its own. Partitions that exceed the memory
+        budget are partitioned again, so peak memory stays within the budget
+        whatever the file size.
+
+        Args:
+            file_path (str): Path to the CSV file containing order data
+            partition_count (int, optional): Number of partition files to create,
+                sized from the file and the memory budget by default
+            temp_dir (str, optional): Directory for the temporary partition files
+            level (int): Number of times the lines were partitioned before
+
+        Yields:
+            List[dict]: All order lines of one order
+
+        Raises:
+            ValueError: If partition_count is below 1
+
+        Note:
+            - Orders are yielded partition by partition, not in file order
+            - An oversized partition is split at most max_partition_depth times;
+              a single order larger than the budget is still read as a whole
+            - Partition files are removed once the generator finishes or is closed
+        """
+        partition_paths = self.partition_order_lines(file_path, partition_count, temp_dir, level)
+        partition_dir = os.path.dirname(partition_paths[0])
+
+        try:
+            for partition_path in partition_paths:
+                if level < self.max_partition_depth and not self.fits_in_memory(partition_path):
+                    yield from self.iter_orders_partitioned(partition_path, temp_dir=partition_dir, level=level + 1)
+                else:
+                    yield from self.read_partition(partition_path).values()
+        finally:
+            shutil.rmtree(partition_dir, ignore_errors=True)
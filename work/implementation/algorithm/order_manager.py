@@ -1,12 +1,10 @@
-from multiprocessing import Pool
-import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from queue import Queue
-import threading
 from .order_input_reader import OrderInputReader
 from .product_input_reader import ProductInputReader
+from .product_catalog import ProductCatalog
+from .order_builder import OrderBuilder
 from .order import Order
 from .product import Product
+from .snapshot_cache import SnapshotCache
 
 class OrderManager:
     """
@@ -19,17 +17,20 @@ class OrderManager:
     2. Loads product definitions
     3. Groups orders by order number
     4. Creates Order objects with associated products
-    5. Manages parallel processing of orders
+    5. Builds all orders of a file in a single vectorized pass
 
     Attributes:
         orderline_file_path (str): Path to the order lines CSV file
         product_file_path (str): Path to the product definitions CSV file
         order_input_reader (OrderInputReader): Singleton reader for orders
         product_input_reader (ProductInputReader): Singleton reader for products
+        catalog (ProductCatalog): Product lookup shared by all orders, built on first use
+        snapshot_cache (SnapshotCache): Cache for the parsed input tables, or None for
+            the shared cache of the readers
         orders (List[Order]): List of processed orders
 
     Key Features:
-        - Multi-processing support for order processing
+        - Vectorized order construction without worker processes
         - Automatic file path resolution
         - Error handling for missing products
         - Order grouping and organization
@@ -37,24 +38,29 @@ class OrderManager:
     """
 
     def __init__(self, orderline_file_path='./data/orderline_definitions.csv', 
-                 product_file_path='./data/product_definitions.csv'):
+                 product_file_path='./data/product_definitions.csv', snapshot_dir=None):
         """
         Initializes the OrderManager with file paths for data sources.
 
         Args:
             orderline_file_path (str): Path to order lines CSV file
             product_file_path (str): Path to product definitions CSV file
+            snapshot_dir (str, optional): Directory for the snapshots of the parsed
+                input tables, by default the directory of the shared SnapshotCache
 
         Note:
             - Paths are relative to the module location
             - Creates singleton reader instances
             - Initializes empty order list
+            - The product catalog is built lazily
         """
         self.orderline_file_path = orderline_file_path
         self.product_file_path = product_file_path
         self.order_input_reader = OrderInputReader()
         self.product_input_reader = ProductInputReader()
+        self.catalog = None
         self.orders = []
+        self.snapshot_cache = SnapshotCache(snapshot_dir) if snapshot_dir else None
     
     def reset(self, orderline_file_path, product_file_path):
         """
@@ -68,49 +74,42 @@ class OrderManager:
         Note:
             - Clears existing orders
             - Updates file paths
+            - Drops the product catalog so it is rebuilt for the new files
             - Prepares for new processing cycle
         """
         self.orderline_file_path = orderline_file_path
         self.product_file_path = product_file_path
+        self.catalog = None
         self.orders = []
 
     def process_orders(self):
         """
-        Processes all orders using parallel processing for efficiency.
+        Processes all orders in a single vectorized pass.
         
         The processing workflow:
         1. Reset manager state
-        2. Load order data
-        3. Group orders by order number
-        4. Process orders in parallel
+        2. Build the product catalog
+        3. Load the order line columns
+        4. Build all orders with the OrderBuilder
         5. Collect and return results
 
         Returns:
             List[Order]: List of processed orders
 
         Note:
-            - Uses multiprocessing for performance
-            - Preserves one CPU core for system
-            - Handles order grouping automatically
+            - Runs in-process, without pickling the manager or its catalog
+            - Order numbers and product IDs are factorized into integer codes
+            - Picked quantities are expanded with array operations
+            - Orders keep the order of first appearance in the file
             - Returns fully processed orders
         """
         self.reset(self.orderline_file_path, self.product_file_path)
+        catalog = self.load_catalog()
 
-        loaded_orders = self.load_orders()
-        grouped_orders = self.group_by_order(loaded_orders)
+        self.order_input_reader.read_csv(self.orderline_file_path, self.snapshot_cache)
+        columns = self.order_input_reader.get_columns()
 
-        # Determine number of processes
-        num_cores = os.cpu_count()
-        num_processes = max(1, num_cores - 1)  # Leave one core free
-
-        # Prepare data for multiprocessing
-        grouped_orders_list = list(grouped_orders.values())
-
-        # Use multiprocessing to process orders in parallel
-        with Pool(processes=num_processes) as pool:
-            results = pool.map(self.create_order, grouped_orders_list)
-
-        self.orders = results
+        self.orders = OrderBuilder(catalog).build_orders(columns)
         return self.orders
 
     def load_products(self):
@@ -126,10 +125,26 @@ class OrderManager:
             - Required for order processing
             - Contains complete product specifications
         """
-        self.product_input_reader.read_csv(self.product_file_path)
+        self.product_input_reader.read_csv(self.product_file_path, self.snapshot_cache)
         products = self.product_input_reader.get_data()
 
         return products
+
+    def load_catalog(self):
+        """
+        Returns the product catalog, building it from the product file on first use.
+
+        Returns:
+            ProductCatalog: Products indexed by product ID
+
+        Note:
+            - Built once per manager and reused for every order
+            - Cleared by reset() when new files are configured
+        """
+        if self.catalog is None:
+            self.catalog = ProductCatalog(self.load_products())
+
+        return self.catalog
     
     def load_orders(self):
         """
@@ -144,11 +159,49 @@ class OrderManager:
             - Contains raw order information
             - Prepared for grouping and processing
         """
-        self.order_input_reader.read_csv(self.orderline_file_path)
+        self.order_input_reader.read_csv(self.orderline_file_path, self.snapshot_cache)
         orders = self.order_input_reader.get_data()
 
         return orders
 
+    def iter_orders(self, grouped=None, partition_count=None):
+        """
+        Streams Order objects from the order lines file, one order at a time.
+        Avoids holding the raw order lines and the grouped copy in memory,
+        and lets callers start packing before the file is fully parsed.
+
+        Args:
+            grouped (bool, optional): Whether the lines of each order are adjacent
+                in the file. Checked before the first order when not given.
+            partition_count (int, optional): Number of on-disk partitions used for
+                lines that are not grouped, sized from the file by default
+
+        Yields:
+            Order: Fully initialized order with products
+
+        Raises:
+            ValueError: If partition_count is below 1
+
+        Note:
+            - Grouped files are read in a single pass, in file order
+            - Other files are spilled to hashed partitions on disk and grouped
+              partition by partition, so memory stays bounded for any file size
+            - The grouping check reads the order numbers once, in constant memory,
+              see OrderInputReader.iter_orders_auto
+            - Uses the shared product catalog
+        """
+        self.load_catalog()
+
+        if grouped is None:
+            orders = self.order_input_reader.iter_orders_auto(self.orderline_file_path, partition_count)
+        elif grouped:
+            orders = self.order_input_reader.iter_orders(self.orderline_file_path)
+        else:
+            orders = self.order_input_reader.iter_orders_partitioned(self.orderline_file_path, partition_count)
+
+        for order_lines in orders:
+            yield self.create_order(order_lines)
+
     def group_by_order(self, data):
         """
         Groups order lines by order number for efficient processing.
@@ -186,14 +239,15 @@ class OrderManager:
             Order: Fully initialized order with products
 
         Note:
-            - Loads required product data
+            - Resolves products through the shared catalog
+            - All units of a line share one ProductDefinition
             - Handles quantity multiplication
             - Validates product existence
             - Creates Product instances
             - Sets order metadata
             - Manages error cases
         """
-        products_data = self.load_products()
+        catalog = self.load_catalog()
 
         order_number = order[0]['Ordernr']
         date_time = order[0]['Date']
@@ -201,22 +255,14 @@ class OrderManager:
 
         for item in order:
             try:
-                product_data = next((product for product in products_data if product['ID'] == item['ID']), None)
                 product_id = item['ID']
+                definition = catalog.get_definition(product_id)
 
-                if not product_data:
+                if not definition:
                     raise ValueError(f"Product ID {product_id} not found in product data.")
                 picked_quantity = int(item.get('Picked'))
                 for _ in range(picked_quantity):
-                    product = Product(
-                        width=float(product_data['Width']),
-                        height=float(product_data['Height']),
-                        length=float(product_data['Length']),
-                        weight=float(product_data['Weight']),
-                        fit_ratio=float(product_data['Fit ratio']),
-                        item=product_id,
-                        location=item['Location']
-                    )
+                    product = Product.from_definition(definition, item['Location'])
                     items.append(product)
 
             except ValueError as e:
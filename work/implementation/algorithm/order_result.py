@@ -13,6 +13,7 @@ class OrderResult:
     Attributes:
         order (Order): The original order being packed
         boxes (List[BoxResult]): List of boxes used to pack the order's products
+        csv_cache (tuple): Last CSV result with the box and product counts it was built for
         
     Key Features:
         - Maintains order-box relationships
@@ -41,6 +42,7 @@ class OrderResult:
         """
         self.order = order
         self.boxes = []
+        self.csv_cache = None
 
     def add_box(self, box):
         """
@@ -100,30 +102,32 @@ class OrderResult:
             - Shows exact coordinates
             - Includes rotation data
             - Used for output and visualization
+            - Reads the coordinate store of every box, in layer order
+            - The result is cached until a box or a placement is added
         """
+        counts = (len(self.boxes), sum(len(boxResult.coordinate_store) for boxResult in self.boxes))
+        if self.csv_cache is not None and self.csv_cache[0] == counts:
+            return self.csv_cache[1]
+
         csvResult = []
         orderId = self.order.get_order_number()
 
         for boxResult in self.boxes:
             boxResultId = boxResult.get_box_id()
             boxDefinition = boxResult.get_box_definition()
-
-            for itemPosition in boxResult.get_all_coordinates():
-                coordinates = itemPosition.get_coordinates()
-                product = itemPosition.get_product()
-                rotation = itemPosition.get_rotation()
-
-                dimensions = product.get_dimensions()
-                adjustedDimensions = rotation.adjust_dimensions(*dimensions)
-
-                csvResult.append(f"{orderId},{boxResultId},"
-                               f"{boxDefinition.get_box_type()},"
-                               f"{','.join(map(str, boxDefinition.get_box_dimensions()))},"
-                               f"{product.get_product_name()},"
-                               f"{','.join(map(str, adjustedDimensions))},"
-                               f"{','.join(map(str, coordinates))}")
-
-        return "\n".join(csvResult)
+            boxPrefix = (f"{orderId},{boxResultId},"
+                         f"{boxDefinition.get_box_type()},"
+                         f"{','.join(map(str, boxDefinition.get_box_dimensions()))}")
+            store = boxResult.coordinate_store
+
+            for index in store.layer_order():
+                csvResult.append(f"{boxPrefix},"
+                               f"{store.product_ids[index]},"
+                               f"{store.widths[index]},{store.heights[index]},{store.lengths[index]},"
+                               f"{store.xs[index]},{store.ys[index]},{store.zs[index]}")
+
+        self.csv_cache = (counts, "\n".join(csvResult))
+        return self.csv_cache[1]
 
 
     
\ No newline at end of file
@@ -1,6 +1,11 @@
-import logging
+import time
+
+from .box_catalog import BoxCatalog
 from .box_result import BoxResult
 from .order_result import OrderResult
+from .tracing import Tracer, get_tracer
+
+tracer = get_tracer('packer')
 
 class Packer:
     """
@@ -17,25 +22,63 @@ class Packer:
         order (Order): Current order being packed
         orderResults (List[OrderResult]): Results of all packed orders
         available_boxes (List[BoxDefinition]): Available box types for packing
+        box_catalog (BoxCatalog): Compiled box metrics, reused while the available boxes stay the same
+        sorted_boxes (List[BoxDefinition]): Available boxes sorted by volume; assigning
+            a list rebuilds the box catalog
         coordinates_products (List[Dict]): Tracking of product positions
         box_position (BoxResult): Current box being packed
+        grid_capacities (Dict[tuple, tuple]): Grid capacity per (product definition, box),
+            filled on first use
+        kernel (str): Name of the kernel for the collision and fit tests, 'python' or 'numpy'
+        engine (str | Dict[str, str]): Name of the layer engine of the boxes, or the
+            engine name per box type, see BoxResult.select_engine
+        engine_report (Dict[str, Dict[str, float]]): Per engine name, the number of
+            packed boxes ('boxes') and the time spent packing them ('seconds')
+        reuse_layouts (bool): Whether a larger box tried after a box with leftover
+            products takes over the layout of that box
 
     Key Algorithms:
         - Initial Box Selection: Chooses optimal starting box size
         - Layer-based Packing: Organizes products in horizontal layers
         - Box Upgrading: Switches to larger box when needed
         - Volume Optimization: Maximizes space utilization
+        - Single-Product Fast Path: Places orders of one product as a regular grid
+          when the grid capacity of the box covers the whole order
+        - Incremental Box Upgrade: A larger box starts from the layout of the box
+          that could not hold the order, so only the leftover products are placed
     """
 
-    def __init__(self):
+    reuse_layouts = True
+
+    def __init__(self, kernel='python', engine='layers'):
         """
         Initializes a new Packer instance with empty state.
+
+        Args:
+            kernel (str): Name of the kernel for the collision and fit tests,
+                'python' for the scalar loops or 'numpy' for the vectorized ones
+            engine (str | Dict[str, str]): Name of the layer engine, 'layers',
+                'maximal_space', 'extreme_point' or 'skyline', or the engine name
+                per box type
         """
         self.order = None
         self.orderResults = []
         self.available_boxes = []
         self.coordinates_products = []
         self.box_position = None
+        self.box_catalog = None
+        self.grid_capacities = {}
+        self.kernel = kernel
+        self.engine = engine
+        self.engine_report = {}
+
+    @property
+    def sorted_boxes(self):
+        return self.box_catalog.boxes
+
+    @sorted_boxes.setter
+    def sorted_boxes(self, boxes):
+        self.box_catalog = BoxCatalog(boxes)
 
     def initial_box_selection(self, lastBox=None):
         """
@@ -57,6 +100,12 @@ class Packer:
             - Skips undersized boxes and multi-order boxes
             - Considers minimum fill requirements
             - Falls back to smallest box if no suitable box found
+            - Uses the cached metrics and binary search of the box catalog
+            - Skips boxes that cannot hold one of the products in any rotation
+            - Reads the running totals, maxima and pending product definitions of
+              the order, so no pass over its items is needed
+            - Orders of a single product skip the boxes that cannot hold them, see
+              grid_box_selection
         """
         total_volume = self.order.get_total_volume()
         total_weight = self.order.get_total_weight()
@@ -64,34 +113,55 @@ class Packer:
         if lastBox == self.sorted_boxes[-1]:
             return lastBox
 
-        ignore = 2
-        toReturn = None
         dimensions = self.order.get_dimensions()
+        feasible_mask = self.box_catalog.order_mask(self.order.pending_counts.keys())
+        box = self.box_catalog.select(total_volume, total_weight, dimensions, lastBox, feasible_mask)
+
+        if len(self.order.pending_counts) == 1:
+            box = self.grid_box_selection(box, total_volume, total_weight, dimensions, feasible_mask)
+
+        if box is None:
+            box = self.box_catalog.fallback_box
+            self.box_position = BoxResult(box, kernel=self.kernel, engine=self.engine)
+
+        return box
+
+
+    def grid_box_selection(self, box, total_volume, total_weight, dimensions, feasible_mask):
+        """
+        Moves the box selection of a single-product order past the boxes that cannot hold it.
+
+        Starting at the box chosen by volume, a box is skipped when its grid capacity
+        does not cover the pending units and the units exceed its volume, so the
+        layer-based packing could not place them either.
 
-        for box in self.sorted_boxes:
-            ignore = ignore - 1
+        Args:
+            box (BoxDefinition): Box selected by volume, or None
+            total_volume (float): Total product volume of the order
+            total_weight (float): Total product weight of the order
+            dimensions (List[float]): Maximum product dimensions of the order
+            feasible_mask (int): Bitmask of the boxes that can hold the product
 
-            if "Undersized" in box.description or "Multi" in box.description:
-                continue
+        Returns:
+            BoxDefinition: Smallest box from the selected one on whose grid holds all
+            units or that the layer-based packing can try, or None if no box is left
 
-            toReturn = box
+        Note:
+            - Grid capacities come from the per-(product, box) table, see get_grid_capacity
+            - XXS boxes and the largest box are never skipped
+        """
+        definition, units = next(iter(self.order.pending_counts.items()))
+        product_volume = definition.width * definition.height * definition.length
 
-            if lastBox != None:
-                if box.max_volume() <= lastBox.max_volume():
-                    continue
+        while box is not None and box is not self.sorted_boxes[-1] and box.container_type != "XXS":
+            capacity = self.get_grid_capacity(definition, box)[0]
 
-            if (box.max_volume() > 1):
-                if box.fits_within(total_volume, total_weight):
-                    if box.fits_with_dimensions(dimensions):
-                        return box
-                else:
-                    if ignore == 0 and total_volume < box.min_volume():
-                        return self.sorted_boxes[0]
-                
-        self.box_position = BoxResult(toReturn)
+            if capacity >= units or capacity == 0 or units * product_volume <= box.width * box.height * box.length:
+                break
 
-        return toReturn
+            box = self.box_catalog.select(total_volume, total_weight, dimensions, box, feasible_mask)
 
+        return box
 
     def pack_order(self, order, available_boxes=[]):
         """
@@ -99,7 +169,7 @@ class Packer:
         
         The algorithm follows these steps:
         1. Initialize order and available boxes
-        2. Sort boxes by volume for efficient selection
+        2. Build the box catalog, unless the boxes did not change since the last order
         3. Attempt to pack order into smallest suitable box
         4. If packing fails, try next larger box
         5. Continue until all products are packed or largest box is reached
@@ -118,19 +188,30 @@ class Packer:
             - Handles oversized products
             - Manages box transitions
             - Tracks packing success/failure
+            - Orders of a single product skip the fragment search when the grid
+              capacity of the box covers all units, and skip the boxes whose grid
+              capacity and volume are too small
+            - Orders with a product that exceeds the largest box fail before
+              the largest box is packed
         """
+        Tracer.set_order(order.order_number)
         self.orderResults.append(OrderResult(order))
         self.order = order
         self.available_boxes = available_boxes
-        self.sorted_boxes = sorted(self.available_boxes, 
-                                 key=lambda box: box.max_volume(), 
-                                 reverse=False)
+
+        if self.box_catalog is None or self.box_catalog.source != tuple(available_boxes):
+            self.sorted_boxes = available_boxes
 
         isSuccesfull = False
         shouldUseNextBox = True
         lastBox = None
+        previousResult = None
         packed_items = 0
 
+        # Orders of a single product can use the closed-form grid capacity
+        lines = self.order.get_lines()
+        single_product = lines[0][0] if len(lines) == 1 else None
+
 # region calling of the algorithm
         while isSuccesfull == False:
             shouldUseNextBox = True
@@ -142,9 +223,11 @@ class Packer:
 
             lastBox = fittingBox
 
-            boxResult = BoxResult(fittingBox)
-            boxResult.pack_products_by_order(self.order)
-            # boxResult.pack_products(self.order.get_items())
+            if not shouldUseNextBox and not self.box_catalog.order_mask(self.order.pending_counts.keys()) >> self.box_catalog.indices[id(fittingBox)] & 1:
+                # An item exceeds the largest box's dimensions, no need to try packing it
+                raise Exception("Some products do not fit in any of the available boxes.")
+
+            boxResult = self.pack_box(fittingBox, single_product, not shouldUseNextBox, previousResult)
 
             if not shouldUseNextBox and len(boxResult.get_oversized_products()) > 0:
                 # Should only happen if an item exceeds the largest box's dimensions
@@ -157,16 +240,113 @@ class Packer:
                 self.order.reset_rejected_items()
                 self.orderResults[-1].add_box(boxResult)
                 order_items = len(order.packed_items)
-                logging.debug(f"{boxResult.box.description} {order_items - packed_items}")
+                if tracer.active:
+                    tracer.log(f"{boxResult.box.description} {order_items - packed_items}")
                 packed_items = order_items
                 shouldUseNextBox = True
                 lastBox = None
+                previousResult = None
             else:
                 self.order.reset_all_items()
+                previousResult = boxResult if self.reuse_layouts else None
 # endregion
 
         return self.get_packer_csv_result()
     
+    def pack_box(self, box, single_product=None, is_largest_box=False, previous=None):
+        """
+        Packs the pending items of the current order into one box.
+
+        For orders of a single product, the closed-form grid capacity is used first:
+        if the grid holds all pending units, they are placed as a grid, otherwise
+        the layer-based packing is used. Boxes that cannot hold the units by grid
+        or by volume are already skipped by initial_box_selection.
+
+        If a previous box of the order left products over and its layout fits this
+        box, the layout is taken over and only the remaining products are packed.
+
+        Args:
+            box (BoxDefinition): Box to pack
+            single_product (ProductDefinition, optional): The only product of the order,
+                or None for orders with several products
+            is_largest_box (bool): Whether no larger box is available
+            previous (BoxResult, optional): Smaller box of the order that could not
+                hold all pending items
+
+        Returns:
+            BoxResult: Packing result
+
+        Note:
+            - XXS boxes always use the layer-based packing, which does not place
+              products in a grid
+            - The largest box also uses the grid when it holds all pending units;
+              otherwise it is filled as far as possible by the layer-based packing
+            - The packing time is added to the engine report of the box's engine
+            - If the largest box cannot hold the order on top of a previous layout,
+              it is packed again from scratch, since products left over in the
+              largest box go to another box
+        """
+        boxResult = BoxResult(box, self.box_catalog, self.kernel, self.engine)
+        start_time = time.perf_counter()
+
+        if single_product is not None and box.container_type != "XXS":
+            capacity, rotation, counts = self.get_grid_capacity(single_product, box)
+            units = self.order.pending_counts.get(single_product, 0)
+
+            if capacity >= units:
+                boxResult.pack_products_in_grid(self.order, rotation, counts)
+                self.report_engine_time(boxResult.engine, start_time)
+                return boxResult
+
+        if previous is not None and boxResult.can_seed(previous):
+            for product in boxResult.seed_layout(previous):
+                self.order.take_specific_item(product)
+
+            boxResult.pack_products_by_order(self.order)
+
+            if not is_largest_box or not boxResult.get_leftover_products():
+                self.report_engine_time(boxResult.engine, start_time)
+                return boxResult
+
+            self.order.reset_all_items()
+            boxResult = BoxResult(box, self.box_catalog, self.kernel, self.engine)
+
+        boxResult.pack_products_by_order(self.order)
+        self.report_engine_time(boxResult.engine, start_time)
+        return boxResult
+
+    def report_engine_time(self, engine, start_time):
+        """
+        Adds a packed box to the engine report.
+
+        Args:
+            engine (str): Name of the layer engine that packed the box
+            start_time (float): time.perf_counter() value when packing started
+        """
+        report = self.engine_report.setdefault(engine, {'boxes': 0, 'seconds': 0.0})
+        report['boxes'] += 1
+        report['seconds'] += time.perf_counter() - start_time
+
+    def get_grid_capacity(self, definition, box):
+        """
+        Returns the grid capacity of a box for a product, computing it on first use.
+
+        Args:
+            definition (ProductDefinition): Product to place
+            box (BoxDefinition): Box to place it in
+
+        Returns:
+            tuple: (capacity, rotation, counts) as returned by BoxDefinition.grid_capacity
+        """
+        key = (definition, box)
+        capacity = self.grid_capacities.get(key)
+
+        if capacity is None:
+            capacity = box.grid_capacity((definition.width, definition.height, definition.length))
+            self.grid_capacities[key] = capacity
+
+        return capacity
+
     def get_packer_csv_result(self):
         """
         Generates a CSV-formatted string containing the packing results.
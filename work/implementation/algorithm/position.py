@@ -1,6 +1,7 @@
-import logging
-
 from .rotation_type import RotationType
+from .tracing import get_tracer
+
+tracer = get_tracer('position')
 
 class Position:
     """
@@ -31,6 +32,11 @@ class Position:
     - BoxResult: For final placement validation
     """
 
+    __slots__ = (
+        'product', 'location_x', 'location_y', 'location_z', 'rotation',
+        'rotated_width', 'rotated_height', 'rotated_length', 'coordinates'
+    )
+
     def __init__(self, product, location_x, location_y, location_z, rotation):
         """
         Initializes a Position object with specific coordinates and rotation.
@@ -59,7 +65,8 @@ class Position:
 
         # Set initial coordinates
         self.coordinates = (location_x, location_y, location_z)
-        logging.debug(f"[DEBUG] Initializing Position with product: {product}, location_x: 0, location_y: 0, location_z: 0")
+        if tracer.active:
+            tracer.log(f"[DEBUG] Initializing Position with product: {product}, location_x: 0, location_y: 0, location_z: 0")
 
     def calculate_extending_point(self):
         """
@@ -73,7 +80,9 @@ class Position:
             The extending point represents the maximum extent of the product
             in each dimension after applying the current rotation.
         """
-        return tuple(a + b for a, b in zip(self.get_coordinates(), self.get_dimensions()))
+        x, y, z = self.get_coordinates()
+        width, height, length = self.get_dimensions()
+        return x + width, y + height, z + length
 
     def copy(self):
         """
@@ -150,9 +159,9 @@ class Position:
 
         Note:
             Critical for space calculations and collision detection.
-            Uses the RotationType to calculate the actual dimensions.
+            Returns the rotated dimensions cached when the rotation was set.
         """
-        return self.rotation.adjust_dimensions(*(self.product.get_dimensions()))
+        return self.rotated_width, self.rotated_height, self.rotated_length
 
 
     def set_orientation(self, rotation):
@@ -176,8 +185,9 @@ class Position:
         )
 
         # Log the new orientation and rotated dimensions
-        logging.debug(f"Set new orientation for product {self.product.item}. Rotation: {rotation.name}, "
-                      f"New rotated dimensions: {self.rotated_width}x{self.rotated_height}x{self.rotated_length}")
+        if tracer.active:
+            tracer.log(f"Set new orientation for product {self.product.item}. Rotation: {rotation.name}, "
+                       f"New rotated dimensions: {self.rotated_width}x{self.rotated_height}x{self.rotated_length}")
 
     def set_coordinates(self, x, y, z):
         """
@@ -202,5 +212,6 @@ class Position:
         self.coordinates = (x, y, z)
 
         # Log the updated coordinates
-        logging.debug(f"Updated coordinates for product {self.product.item}: "
-                      f"({x}, {y}, {z})")
+        if tracer.active:
+            tracer.log(f"Updated coordinates for product {self.product.item}: "
+                       f"({x}, {y}, {z})")
@@ -1,6 +1,66 @@
 from .rotation_type import RotationType
 
 
+class ProductDefinition:
+    """
+    The immutable, shared record of a product type (SKU).
+    All units of the same SKU point to one definition, so the physical
+    properties are stored once per SKU instead of once per unit.
+
+    Attributes:
+        width (float): Product width in centimeters
+        height (float): Product height in centimeters
+        length (float): Product length in centimeters
+        weight (float): Product weight in grams
+        fit_ratio (float): Volume utilization factor (0-100%)
+        item (str): Unique product identifier
+        sort_key (tuple): Packing order key (sum of dimensions, effective volume,
+            weight); products are packed from the largest key down
+
+    Key Features:
+        - Slots-based, without a per-instance dictionary
+        - Read-only after creation
+        - Sort key computed once per SKU, so units sort on a plain tuple key
+        - Pickled as its constructor arguments, so shared definitions stay
+          shared within one pickle
+    """
+
+    __slots__ = ('width', 'height', 'length', 'weight', 'fit_ratio', 'item', 'sort_key')
+
+    def __init__(self, width: float, height: float, length: float, weight: float,
+                 fit_ratio: float, item: str):
+        """
+        Initializes a product definition.
+
+        Args:
+            width (float): Product width in cm
+            height (float): Product height in cm
+            length (float): Product length in cm
+            weight (float): Product weight in grams
+            fit_ratio (float): Volume utilization percentage (0-100)
+            item (str): Product identifier
+        """
+        object.__setattr__(self, 'width', width)
+        object.__setattr__(self, 'height', height)
+        object.__setattr__(self, 'length', length)
+        object.__setattr__(self, 'weight', weight)
+        object.__setattr__(self, 'fit_ratio', fit_ratio)
+        object.__setattr__(self, 'item', item)
+        object.__setattr__(self, 'sort_key', (width + height + length, width * height * length * (fit_ratio / 100), weight))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return ProductDefinition, (self.width, self.height, self.length, self.weight, self.fit_ratio, self.item)
+
+    def __repr__(self):
+        return f"ProductDefinition({self.item!r}, {self.width}x{self.height}x{self.length}, {self.weight}g)"
+
+
 class Product:
     """
     Represents a physical product to be packed, with its dimensions and properties.
@@ -14,7 +74,12 @@ class Product:
     - Location tracking for picking
     - Unique item identification
 
+    Every Product is a lightweight handle for one unit. The physical properties
+    live in a ProductDefinition shared by all units of the same SKU; the handle
+    itself only stores what differs per unit.
+
     Attributes:
+        definition (ProductDefinition): Shared record of the product type
         width (float): Product width in centimeters
         height (float): Product height in centimeters
         length (float): Product length in centimeters
@@ -29,8 +94,11 @@ class Product:
         - Product identification
         - Location tracking
         - Weight management
+        - Slots-based, sharing one definition per SKU
     """
 
+    __slots__ = ('definition', 'location')
+
     def __init__(self, width: float, height: float, length: float, weight: float, 
                  fit_ratio: float, item: str, location: str):
         """
@@ -49,15 +117,57 @@ class Product:
             - All dimensions must be positive
             - Fit ratio affects volume calculations
             - Location used for picking optimization
+            - Creates a definition of its own; use from_definition to share one
         """
-        self.width = width
-        self.height = height
-        self.length = length
-        self.weight = weight
-        self.fit_ratio = fit_ratio
-        self.item = item
+        self.definition = ProductDefinition(width, height, length, weight, fit_ratio, item)
         self.location = location
 
+    @classmethod
+    def from_definition(cls, definition, location):
+        """
+        Creates a unit of an existing product definition.
+
+        Args:
+            definition (ProductDefinition): Shared record of the product type
+            location (str): Picking location reference
+
+        Returns:
+            Product: New unit handle pointing to the shared definition
+        """
+        product = cls.__new__(cls)
+        product.definition = definition
+        product.location = location
+
+        return product
+
+    @property
+    def width(self):
+        return self.definition.width
+
+    @property
+    def height(self):
+        return self.definition.height
+
+    @property
+    def length(self):
+        return self.definition.length
+
+    @property
+    def weight(self):
+        return self.definition.weight
+
+    @property
+    def fit_ratio(self):
+        return self.definition.fit_ratio
+
+    @property
+    def item(self):
+        return self.definition.item
+
+    @property
+    def sort_key(self):
+        return self.definition.sort_key
+
     
     def volume(self):
         """
@@ -72,7 +182,8 @@ class Product:
             - Used for packing optimization
             - Critical for box selection
         """
-        return self.width * self.height * self.length * (self.fit_ratio / 100)
+        definition = self.definition
+        return definition.width * definition.height * definition.length * (definition.fit_ratio / 100)
 
 
     def __lt__(self, other):
@@ -91,24 +202,13 @@ class Product:
             - Factors in volume
             - Uses weight as tiebreaker
             - Critical for packing efficiency
+            - Compares the precomputed sort keys; sorting with key=sort_key gives
+              the same order without calling this method
         """
-        if self.item == other.item:
+        if self.definition is other.definition or self.item == other.item:
             return False
 
-        self_value = sum(self.get_dimensions())
-        other_value = sum(other.get_dimensions())
-        if self_value != other_value:
-            return self_value < other_value
-
-        if self.volume() != other.volume():
-            return self.volume() < other.volume()
-        
-        # Compare by weight
-        if self.weight != other.weight:
-            return self.weight < other.weight
-
-        # If all checks fail, the products are considered equal
-        return False
+        return self.definition.sort_key < other.definition.sort_key
 
     def get_product_name(self):
         """
@@ -0,0 +1,110 @@
+import logging
+import math
+
+from .product import ProductDefinition
+
+class ProductCatalog:
+    """
+    An in-memory index of product definitions keyed by product ID.
+    This class replaces the linear product lookup that was previously done
+    for every order line when orders were created.
+
+    The catalog is built once from the rows returned by the ProductInputReader
+    and stores one shared ProductDefinition per product, with the numeric fields
+    already converted to floats. Resolving the product of an order line is a
+    single dictionary lookup, and all units of a product share its definition.
+
+    Key Features:
+        - O(1) product lookup by ID
+        - Numeric fields parsed once per product instead of once per unit
+        - One immutable definition per product, shared by all of its units
+        - Picklable, so it can be handed to worker processes as a whole
+        - Invalid product rows are skipped with a warning
+
+    Attributes:
+        products (Dict[str, ProductDefinition]): Product definition per product ID
+
+    Usage:
+        catalog = ProductCatalog(product_input_reader.get_data())
+        width, height, length, weight, fit_ratio = catalog.get('5234')
+        product = Product.from_definition(catalog.get_definition('5234'), location)
+    """
+
+    def __init__(self, products=None):
+        """
+        Builds the catalog from raw product definition rows.
+
+        Args:
+            products (List[Dict], optional): Product rows as read from the product CSV
+
+        Note:
+            - Rows with missing or non-numeric fields are skipped
+            - Later rows overwrite earlier rows with the same ID
+        """
+        self.products = {}
+
+        for product in products or []:
+            self.add_product(product)
+
+    def add_product(self, product):
+        """
+        Parses a single product row and adds it to the catalog.
+
+        Args:
+            product (Dict): Product row containing ID, Width, Height, Length, Weight and Fit ratio
+
+        Returns:
+            bool: True if the product was added, False if the row could not be parsed
+        """
+        try:
+            values = (
+                float(product['Width']),
+                float(product['Height']),
+                float(product['Length']),
+                float(product['Weight']),
+                float(product['Fit ratio'])
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logging.warning(f"Skipping invalid product definition {product}: {e}")
+            return False
+
+        if any(math.isnan(value) for value in values):
+            logging.warning(f"Skipping invalid product definition {product}: missing numeric value")
+            return False
+
+        self.products[product['ID']] = ProductDefinition(*values, product['ID'])
+        return True
+
+    def get(self, product_id):
+        """
+        Looks up the parsed fields of a product.
+
+        Args:
+            product_id (str): Product identifier
+
+        Returns:
+            tuple: (width, height, length, weight, fit_ratio), or None if the product is unknown
+        """
+        definition = self.products.get(product_id)
+        if definition is None:
+            return None
+
+        return definition.width, definition.height, definition.length, definition.weight, definition.fit_ratio
+
+    def get_definition(self, product_id):
+        """
+        Looks up the shared definition of a product.
+
+        Args:
+            product_id (str): Product identifier
+
+        Returns:
+            ProductDefinition: Shared product record, or None if the product is unknown
+        """
+        return self.products.get(product_id)
+
+    def __contains__(self, product_id):
+        return product_id in self.products
+
+    def __len__(self):
+        return len(self.products)
@@ -1,6 +1,7 @@
-import csv
 import os
 
+from .snapshot_cache import SnapshotCache
+
 class ProductInputReader:
     """
     A singleton class responsible for loading and managing product definitions from CSV files.
@@ -17,6 +18,7 @@ class ProductInputReader:
         - Singleton pattern implementation
         - File modification tracking
         - Cached data management
+        - Persistent binary snapshot of the parsed, typed table
         - CSV parsing with headers
         - UTF-8 encoding support
 
@@ -28,8 +30,11 @@ class ProductInputReader:
 
     Attributes:
         _instance (ProductInputReader): Singleton instance
-        loaded_products (list): Cached product definitions
+        loaded_products (list): Rows of the loaded data, or None until get_data builds them
         last_loaded_time (float): Last file modification timestamp
+        loaded_columns (dict): Cached typed columns of the loaded data
+        column_types (dict): Columns parsed as numbers, all others are text
+        snapshot_cache (SnapshotCache): Persistent cache of parsed tables
 
     Usage:
         reader = ProductInputReader()
@@ -39,7 +44,10 @@ class ProductInputReader:
 
     _instance = None
     loaded_products = []
+    loaded_columns = {}
     last_loaded_time = None
+    column_types = {'Weight': float, 'Length': float, 'Width': float, 'Height': float, 'Fit ratio': float}
+    snapshot_cache = SnapshotCache()
 
     def __new__(cls, *args, **kwargs):
         """
@@ -58,13 +66,15 @@ class ProductInputReader:
             cls._instance = super(ProductInputReader, cls).__new__(cls, *args, **kwargs)
         return cls._instance
     
-    def read_csv(self, file_path):
+    def read_csv(self, file_path, snapshot_cache=None):
         """
         Reads and parses product definitions from a CSV file.
         Only reloads if file has been modified since last read.
 
         Args:
             file_path (str): Path to the CSV file containing product definitions
+            snapshot_cache (SnapshotCache, optional): Cache for the parsed table,
+                the shared snapshot_cache by default
 
         Returns:
             bool: True if new data was loaded, False if using cached data
@@ -72,26 +82,25 @@ class ProductInputReader:
         Note:
             - Checks file modification time
             - Uses UTF-8 with BOM support
-            - Caches loaded data
+            - Reads the binary snapshot instead of the CSV when it is up to date
+            - Numeric columns are typed (see column_types)
+            - Caches the typed columns only; the rows are built by get_data
             - Maintains last loaded timestamp
             - Skips reload if file unchanged
             - Critical for product initialization
         """
         last_loaded_time = os.path.getmtime(file_path)
 
-        if self.loaded_products:
+        if self.loaded_columns:
             if hasattr(self, 'last_loaded_time') and self.last_loaded_time == last_loaded_time:
                 return False
 
         self.last_loaded_time = last_loaded_time
-        data = []
-
-        with open(file_path, mode='r', newline='', encoding='utf-8-sig') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                data.append(row)
+        if snapshot_cache is None:
+            snapshot_cache = self.snapshot_cache
 
-        self.loaded_products = data
+        self.loaded_columns = snapshot_cache.read_csv(file_path, self.column_types)
+        self.loaded_products = None
 
         return True
     
@@ -108,5 +117,22 @@ class ProductInputReader:
             - Contains complete product specifications
             - Used by OrderManager for product creation
             - Essential for packing algorithm
+            - Rows are built from the columns on the first call after a read
         """
+        if self.loaded_products is None:
+            self.loaded_products = SnapshotCache.to_rows(self.loaded_columns)
+
         return self.loaded_products
+
+    def get_columns(self):
+        """
+        Retrieves the cached product definitions as typed columns.
+
+        Returns:
+            Dict[str, np.ndarray]: One read-only array per CSV column
+
+        Note:
+            - Returns the columns loaded by the last read_csv call
+            - Arrays are memory-mapped when they come from a snapshot
+        """
+        return self.loaded_columns
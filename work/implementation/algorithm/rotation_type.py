@@ -1,4 +1,5 @@
 from enum import Enum, auto
+from functools import lru_cache
 
 class RotationType(Enum):
     """
@@ -19,6 +20,8 @@ class RotationType(Enum):
         - Rotations maintain right-handed coordinate system
         - Dimensions are adjusted according to rotation type
         - Rotations can be cycled through sequentially
+        - Initial rotations and rotation tables are computed once per set of
+          product dimensions
 
     Usage:
         Used by the packing algorithm to:
@@ -36,6 +39,7 @@ class RotationType(Enum):
     RT6 = auto()  # w, l, h - Width as depth
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def initial_rotation(w, h, l):
         """
         Determines the optimal initial rotation for given dimensions.
@@ -54,6 +58,7 @@ class RotationType(Enum):
             - Prioritizes larger base area for stability
             - Considers natural product orientation
             - Helps optimize subsequent rotation attempts
+            - Cached per set of dimensions
         """
         dimensions = [(w, h, l), (l, h, w), (h, w, l), (l, w, h), (h, l, w), (w, l, h)]
         sorted_dimensions = sorted([w, h, l])
@@ -78,18 +83,46 @@ class RotationType(Enum):
             - Critical for space calculations
             - Used in collision detection
         """
-        if self == RotationType.RT1:
-            return w, h, l  # Original orientation
-        elif self == RotationType.RT2:
-            return l, h, w  # 90° Y rotation
-        elif self == RotationType.RT3:
-            return h, w, l  # Width as height
-        elif self == RotationType.RT4:
-            return l, w, h  # 90° Y + height swap
-        elif self == RotationType.RT5:
-            return h, l, w  # Height as depth
-        elif self == RotationType.RT6:
-            return w, l, h  # Width as depth
+        dimensions = (w, h, l)
+        first, second, third = PERMUTATIONS[self]
+        return dimensions[first], dimensions[second], dimensions[third]
+
+    @staticmethod
+    @lru_cache(maxsize=None, typed=True)
+    def rotation_table(w, h, l, start=None, count=6):
+        """
+        Returns the distinct orientations of a product, in the order they are tried.
+
+        Args:
+            w (float): Original width in cm
+            h (float): Original height in cm
+            l (float): Original length in cm
+            start (RotationType, optional): First rotation; the initial rotation
+                of the dimensions if not given
+            count (int): Number of rotations to cycle through from the first one
+
+        Returns:
+            tuple: (RotationType, (width, height, length)) per orientation
+
+        Note:
+            - Rotations giving the same dimensions as an earlier rotation are left
+              out, so a cube has 1 orientation and a product with two equal sides 3
+            - Computed once per set of dimensions
+        """
+        rotation = start if start is not None else RotationType.initial_rotation(w, h, l)
+        table = []
+        seen = set()
+
+        for _ in range(count):
+            dimensions = rotation.adjust_dimensions(w, h, l)
+
+            if dimensions not in seen:
+                seen.add(dimensions)
+                table.append((rotation, dimensions))
+
+            rotation = rotation.next_rotation()
+
+        return tuple(table)
 
     def next_rotation(self):
         """
@@ -134,4 +167,15 @@ class RotationType(Enum):
         Returns:
             (int): The maximum value of the RotationType enumeration.
         """
-        return RotationType.RT6.value
\ No newline at end of file
+        return RotationType.RT6.value
+
+
+# Index of the original width, height and length per rotated dimension
+PERMUTATIONS = {
+    RotationType.RT1: (0, 1, 2),  # w, h, l
+    RotationType.RT2: (2, 1, 0),  # l, h, w
+    RotationType.RT3: (1, 0, 2),  # h, w, l
+    RotationType.RT4: (2, 0, 1),  # l, w, h
+    RotationType.RT5: (1, 2, 0),  # h, l, w
+    RotationType.RT6: (0, 2, 1),  # w, l, h
+}
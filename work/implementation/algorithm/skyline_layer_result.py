@@ -0,0 +1,291 @@
+from bisect import bisect_left
+
+import numpy as np
+
+from .layer_result import LayerResult
+from .position import Position
+from .tracing import get_tracer
+
+tracer = get_tracer('layer')
+
+class SkylineLayerResult(LayerResult):
+    """
+    A layer that tracks the box floor as a heightmap (skyline) instead of fragments.
+    This class suits rigid cartons that stack cleanly: a product is always placed
+    on top of everything below its footprint, so the only free space is the space
+    above the skyline.
+
+    The heightmap is stored on compressed coordinates: the floor is cut into cells
+    at the x and z edges of the box and of every placed product, and each cell
+    keeps the height of its highest product. Placing a product is a lookup of the
+    footprint position whose highest cell is lowest:
+    1. For every cell corner and rotation, the base height is the maximum height
+       of the cells under the footprint
+    2. The placement with the lowest top (base + product height) wins, then the
+       lowest z and x, then the earliest rotation
+    3. The cells under the footprint are raised to the top of the product
+
+    Attributes:
+        stacks_layers (bool): False, since the heightmap covers the whole box
+        min_support (float): Minimum part of the footprint that must rest on the
+            base height; 0 accepts overhanging placements
+        xs (List[float]): Cell edges along x, from 0 to the box width
+        zs (List[float]): Cell edges along z, from 0 to the box length
+        heights (numpy.ndarray): Height per cell, of shape (len(xs) - 1, len(zs) - 1)
+        supports (List[float]): Supported part of the footprint per placed product
+
+    Key Features:
+        - Placements need no collision check and no fragment bookkeeping
+        - All footprint positions of a rotation are evaluated in one vectorized pass
+        - Support of every placement is read from the heightmap
+    """
+
+    stacks_layers = False
+    min_support = 0.0
+
+    def __init__(self, box, base_height=0, kernel='python'):
+        """
+        Initializes the layer with a flat heightmap at its base.
+
+        Args:
+            box (BoxDefinition): The box containing this layer
+            base_height (float): Starting height of this layer from box bottom in cm
+            kernel (str): Name of the kernel, kept for the LayerResult interface
+        """
+        super().__init__(box, base_height, kernel)
+        self.remaining_spaces = []
+        self.xs = [0, box.width]
+        self.zs = [0, box.length]
+        self.heights = np.full((1, 1), base_height, dtype=float)
+        self.supports = []
+
+    def add_product(self, position, existing_coordinates, use_reverse_y=False):
+        """
+        Places a product at the lowest footprint position of the heightmap.
+
+        Args:
+            position (Position): Product and its initial rotation
+            existing_coordinates (List[tuple] | SpatialGrid): Coordinates of already
+                placed products; not needed, the heightmap holds all placements
+            use_reverse_y (bool): Not used, products are always placed bottom up
+
+        Returns:
+            bool: True if product was successfully placed, False otherwise
+        """
+        if self.box.container_type == "XXS":
+            self.positions.append(position)
+            return True
+
+        product = position.get_product()
+        best = None
+
+        for index, (rotation, (width, height, length)) in enumerate(self.candidate_rotations(product.get_dimensions())):
+            placement = self.lowest_placement(width, height, length)
+
+            if placement is None:
+                continue
+
+            y, z, x, support = placement
+            key = (y + height, z, x, index)
+            if best is None or key < best[0]:
+                best = (key, x, y, z, rotation, width, length, support)
+
+        if best is None:
+            return False
+
+        _, x, y, z, rotation, width, length, support = best
+        best_position = Position(product, x, y, z, rotation)
+        self.positions.append(best_position)
+        self.supports.append(support)
+        self.last_product = product.item
+        self.raise_skyline(x, z, width, length, best_position.calculate_extending_point()[1])
+
+        if tracer.active:
+            tracer.log(f"Product {product.item} placed on the skyline at {(x, y, z)} with support {support:.2f}.")
+
+        return True
+
+    def seed_position(self, position):
+        """
+        Adds a product at a known position, taken over from the layout of another box.
+
+        Args:
+            position (Position): Position of the product, on the skyline of the
+                box it was placed in
+
+        Note:
+            - The support is read from the heightmap before it is raised
+        """
+        x, y, z = position.get_coordinates()
+        end_x, end_y, end_z = position.calculate_extending_point()
+        x_start, x_end = self.insert_edge(0, x), self.insert_edge(0, end_x)
+        z_start, z_end = self.insert_edge(1, z), self.insert_edge(1, end_z)
+
+        self.positions.append(position)
+        self.supports.append(self.support(x_start, x_end, z_start, z_end, y, end_x - x, end_z - z))
+        self.heights[x_start:x_end, z_start:z_end] = end_y
+
+    def lowest_placement(self, width, height, length):
+        """
+        Finds the lowest footprint position for one rotation of a product.
+
+        Args:
+            width (float): Product width after rotation
+            height (float): Product height after rotation
+            length (float): Product length after rotation
+
+        Returns:
+            tuple | None: (y, z, x, support) of the lowest position that fits below
+            the box lid and has at least min_support, lowest z and x first;
+            None if there is no such position
+        """
+        x_starts, x_ends = self.footprint_cells(self.xs, width)
+        z_starts, z_ends = self.footprint_cells(self.zs, length)
+
+        if not len(x_starts) or not len(z_starts):
+            return None
+
+        bases = self.window_maxima(self.heights, x_starts, x_ends, z_starts, z_ends)
+        fits = np.nonzero(bases + height <= self.box.height)
+
+        if not len(fits[0]):
+            return None
+
+        # Lowest base first, then z and x
+        order = np.lexsort((x_starts[fits[0]], z_starts[fits[1]], bases[fits]))
+
+        for candidate in order:
+            i, j = fits[0][candidate], fits[1][candidate]
+            y = bases[i, j].item()
+            support = self.support(x_starts[i], x_ends[i], z_starts[j], z_ends[j], y, width, length)
+
+            if support >= self.min_support:
+                return y, self.zs[z_starts[j]], self.xs[x_starts[i]], support
+
+        return None
+
+    @staticmethod
+    def footprint_cells(edges, size):
+        """
+        Returns the cell ranges covered by a footprint side starting at each edge.
+
+        Args:
+            edges (List[float]): Cell edges along one axis
+            size (float): Footprint size along the axis
+
+        Returns:
+            tuple: Arrays of the first and one-past-last covered cell per start
+            edge that leaves room for the footprint before the wall
+        """
+        edge_array = np.asarray(edges, dtype=float)
+        starts = np.nonzero(edge_array[:-1] + size <= edge_array[-1])[0]
+        ends = np.searchsorted(edge_array, edge_array[starts] + size, side='left')
+        return starts, ends
+
+    @staticmethod
+    def window_maxima(heights, x_starts, x_ends, z_starts, z_ends):
+        """
+        Returns the maximum cell height under every footprint position.
+
+        Args:
+            heights (numpy.ndarray): Height per cell
+            x_starts (numpy.ndarray): First covered cell along x per position
+            x_ends (numpy.ndarray): One-past-last covered cell along x per position
+            z_starts (numpy.ndarray): First covered cell along z per position
+            z_ends (numpy.ndarray): One-past-last covered cell along z per position
+
+        Returns:
+            numpy.ndarray: Base height of shape (len(x_starts), len(z_starts))
+
+        Note:
+            - Each axis is reduced with one maximum.reduceat over interleaved
+              (start, end) indices; a padding row and column keep the end
+              indices in range
+        """
+        padded = np.pad(heights, ((0, 1), (0, 1)))
+        rows = np.maximum.reduceat(padded, np.column_stack((x_starts, x_ends)).ravel(), axis=0)[::2]
+        return np.maximum.reduceat(rows, np.column_stack((z_starts, z_ends)).ravel(), axis=1)[:, ::2]
+
+    def support(self, x_start, x_end, z_start, z_end, base, width, length):
+        """
+        Returns the part of a footprint that rests on the base height.
+
+        Args:
+            x_start (int): First covered cell along x
+            x_end (int): One-past-last covered cell along x
+            z_start (int): First covered cell along z
+            z_end (int): One-past-last covered cell along z
+            base (float): Base height of the placement
+            width (float): Footprint width
+            length (float): Footprint length
+
+        Returns:
+            float: Supported area divided by the footprint area, between 0 and 1
+
+        Note:
+            - The last covered cell along each axis can extend past the
+              footprint and is clipped to it
+        """
+        widths = np.diff(self.xs[x_start:x_end + 1])
+        lengths = np.diff(self.zs[z_start:z_end + 1])
+        widths[-1] = self.xs[x_start] + width - self.xs[x_end - 1]
+        lengths[-1] = self.zs[z_start] + length - self.zs[z_end - 1]
+
+        supported = self.heights[x_start:x_end, z_start:z_end] == base
+        return float(np.outer(widths, lengths)[supported].sum() / (width * length))
+
+    def raise_skyline(self, x, z, width, length, top):
+        """
+        Raises the cells under a placed product to its top.
+
+        Args:
+            x (float): x coordinate of the product
+            z (float): z coordinate of the product
+            width (float): Product width after rotation
+            length (float): Product length after rotation
+            top (float): Top of the product
+        """
+        x_start, x_end = self.insert_edge(0, x), self.insert_edge(0, x + width)
+        z_start, z_end = self.insert_edge(1, z), self.insert_edge(1, z + length)
+        self.heights[x_start:x_end, z_start:z_end] = top
+
+    def insert_edge(self, axis, value):
+        """
+        Adds a cell edge, splitting the cell it falls in.
+
+        Args:
+            axis (int): 0 for the x edges, 1 for the z edges
+            value (float): Edge coordinate
+
+        Returns:
+            int: Index of the edge
+        """
+        edges = self.xs if axis == 0 else self.zs
+        index = bisect_left(edges, value)
+
+        if index < len(edges) and edges[index] == value:
+            return index
+
+        edges.insert(index, value)
+        self.heights = np.insert(self.heights, index, np.take(self.heights, index - 1, axis=axis), axis=axis)
+        return index
+
+    def collides(self, product, x, y, z, width, height, length, existing_coordinates):
+        """
+        Checks if a candidate placement overlaps a placed product.
+
+        Args:
+            product (Product): Candidate product
+            x (float): Candidate x coordinate
+            y (float): Candidate y coordinate
+            z (float): Candidate z coordinate
+            width (float): Candidate width after rotation
+            height (float): Candidate height after rotation
+            length (float): Candidate length after rotation
+            existing_coordinates (List[tuple] | SpatialGrid | ExtentArray): Coordinates of the placed products
+
+        Returns:
+            bool: Always False, a product on the skyline is above every product
+            under its footprint
+        """
+        return False
@@ -0,0 +1,250 @@
+import csv
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+class SnapshotCache:
+    """
+    A persistent on-disk cache of parsed CSV tables in a binary columnar format.
+    This class lets repeated runs, forked workers and restarted services skip CSV
+    parsing of input files that did not change.
+
+    Every cached table is stored in its own directory containing:
+    - One NumPy .npy file per column, typed as configured (float, int or text)
+    - A meta.json file with the column names and the size and modification time
+      of the source file
+
+    Snapshots are loaded memory-mapped, so opening one is cheap and the pages are
+    shared between processes reading the same snapshot.
+
+    Key Features:
+        - Invalidation by source file size and modification time
+        - Memory-mapped, read-only column arrays
+        - Atomic publication of new snapshots
+        - Failures to write the cache never break reading the CSV
+
+    Attributes:
+        cache_dir (str): Directory holding one sub-directory per cached source file
+        INVALID_INT (int): Value stored for int values that cannot be converted
+
+    Usage:
+        cache = SnapshotCache()
+        columns = cache.read_csv('./data/product_definitions.csv', {'Weight': float})
+        weights = columns['Weight']
+    """
+
+    FORMAT_VERSION = 1
+    INVALID_INT = -1
+    default_cache_dir = os.path.join(tempfile.gettempdir(), 'packing_snapshots')
+
+    def __init__(self, cache_dir=None):
+        """
+        Initializes the cache.
+
+        Args:
+            cache_dir (str, optional): Directory for the snapshots. Defaults to a
+                'packing_snapshots' directory in the system temp directory.
+        """
+        self.cache_dir = cache_dir or self.default_cache_dir
+
+    def read_csv(self, file_path, column_types=None):
+        """
+        Returns the typed columns of a CSV file, from the snapshot when it is up to date.
+        Parses the CSV and writes a new snapshot otherwise.
+
+        Args:
+            file_path (str): Path to the CSV file
+            column_types (Dict[str, type], optional): Columns to convert to float or int.
+                All other columns are kept as text.
+
+        Returns:
+            Dict[str, np.ndarray]: One array per column, in file order
+        """
+        column_types = column_types or {}
+        columns = self.load(file_path, column_types)
+
+        if columns is None:
+            columns = self.parse_csv(file_path, column_types)
+            self.save(file_path, column_types, columns)
+
+        return columns
+
+    def snapshot_path(self, file_path):
+        """
+        Returns the snapshot directory used for a source file.
+
+        Args:
+            file_path (str): Path to the source file
+
+        Returns:
+            str: Snapshot directory path
+        """
+        key = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key)
+
+    def load(self, file_path, column_types):
+        """
+        Loads the snapshot of a source file if it is still valid.
+
+        Args:
+            file_path (str): Path to the source file
+            column_types (Dict[str, type]): Expected column typing
+
+        Returns:
+            Dict[str, np.ndarray]: Memory-mapped columns, or None if there is no
+            valid snapshot
+        """
+        snapshot_path = self.snapshot_path(file_path)
+
+        try:
+            with open(os.path.join(snapshot_path, 'meta.json'), 'r') as file:
+                meta = json.load(file)
+
+            for key, value in self.source_meta(file_path, column_types).items():
+                if meta.get(key) != value:
+                    return None
+
+            return {
+                name: np.load(os.path.join(snapshot_path, f'column_{index}.npy'), mmap_mode='r')
+                for index, name in enumerate(meta['columns'])
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, file_path, column_types, columns):
+        """
+        Writes a snapshot for a source file, replacing any previous one.
+
+        Args:
+            file_path (str): Path to the source file
+            column_types (Dict[str, type]): Column typing used for the columns
+            columns (Dict[str, np.ndarray]): Parsed columns
+
+        Returns:
+            bool: True if the snapshot was written, False otherwise
+
+        Note:
+            - The snapshot is written to a temporary directory first and then renamed
+            - Errors are logged and otherwise ignored
+        """
+        snapshot_path = self.snapshot_path(file_path)
+        temp_path = None
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = tempfile.mkdtemp(dir=self.cache_dir)
+
+            for index, column in enumerate(columns.values()):
+                np.save(os.path.join(temp_path, f'column_{index}.npy'), column)
+
+            meta = self.source_meta(file_path, column_types)
+            meta['columns'] = list(columns)
+            with open(os.path.join(temp_path, 'meta.json'), 'w') as file:
+                json.dump(meta, file)
+
+            shutil.rmtree(snapshot_path, ignore_errors=True)
+            os.rename(temp_path, snapshot_path)
+            return True
+        except OSError as e:
+            logging.warning(f"Could not write snapshot for {file_path}: {e}")
+            if temp_path:
+                shutil.rmtree(temp_path, ignore_errors=True)
+            return False
+
+    def source_meta(self, file_path, column_types):
+        """
+        Describes the current state of a source file for snapshot validation.
+
+        Args:
+            file_path (str): Path to the source file
+            column_types (Dict[str, type]): Column typing
+
+        Returns:
+            dict: Format version, source size, modification time and column typing
+        """
+        stat = os.stat(file_path)
+
+        return {
+            'version': self.FORMAT_VERSION,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'column_types': {name: column_type.__name__ for name, column_type in column_types.items()}
+        }
+
+    @staticmethod
+    def parse_csv(file_path, column_types):
+        """
+        Parses a CSV file into typed columns.
+
+        Args:
+            file_path (str): Path to the CSV file
+            column_types (Dict[str, type]): Columns to convert to float or int
+
+        Returns:
+            Dict[str, np.ndarray]: One array per column, in file order
+
+        Note:
+            - Uses UTF-8 with BOM support
+            - Values that cannot be converted become NaN for float columns and
+              INVALID_INT for int columns, and are logged; int columns hold counts,
+              so consumers reject the negative sentinel instead of reading zero
+        """
+        with open(file_path, mode='r', newline='', encoding='utf-8-sig') as file:
+            reader = csv.reader(file)
+            header = next(reader, [])
+            rows = [row for row in reader if row]
+
+        columns = {}
+        for index, name in enumerate(header):
+            values = [row[index] if index < len(row) else '' for row in rows]
+            column_type = column_types.get(name)
+
+            if column_type is float:
+                columns[name] = np.array([SnapshotCache.convert(value, float, float('nan'), name) for value in values], dtype=np.float64)
+            elif column_type is int:
+                columns[name] = np.array([SnapshotCache.convert(value, int, SnapshotCache.INVALID_INT, name) for value in values], dtype=np.int64)
+            else:
+                columns[name] = np.array(values, dtype=str)
+
+        return columns
+
+    @staticmethod
+    def to_rows(columns):
+        """
+        Converts columns back into one dictionary per row.
+
+        Args:
+            columns (Dict[str, np.ndarray]): Columns as returned by read_csv
+
+        Returns:
+            List[dict]: Rows with plain Python values
+        """
+        names = list(columns)
+        values = [columns[name].tolist() for name in names]
+
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    @staticmethod
+    def convert(value, column_type, default, name):
+        """
+        Converts a single CSV value, falling back to a default for invalid input.
+
+        Args:
+            value (str): Raw CSV value
+            column_type (type): float or int
+            default: Value used when the conversion fails
+            name (str): Column name, for logging
+
+        Returns:
+            The converted value or the default
+        """
+        try:
+            return column_type(value)
+        except ValueError:
+            logging.warning(f"Invalid value {value!r} in column {name}, using {default}.")
+            return default
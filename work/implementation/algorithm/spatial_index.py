@@ -0,0 +1,127 @@
+class SpatialGrid:
+    """
+    A uniform grid over the inside of a box that indexes placed products by location.
+    This class lets collision checks look only at products near the candidate
+    position, instead of at every product in the box.
+
+    The box is divided into cells_per_axis cells along each axis. Every placed
+    product is registered in all cells its extent touches, and a query collects
+    the products registered in the cells touched by the candidate before running
+    the exact overlap test on them.
+
+    Attributes:
+        cell_size (tuple): Cell size along x, y and z in cm
+        cell_counts (tuple): Number of cells along x, y and z
+        entries (List[tuple]): Indexed coordinates as (product_id, x, y, z, width, height, length)
+        cells (Dict[tuple, List[int]]): Entry indices per occupied cell
+
+    Key Features:
+        - Same overlap semantics as check_collision on a coordinate list
+        - Coordinates outside the box are clamped to the border cells
+        - Can be iterated and appended to like a coordinate list
+
+    Usage:
+        grid = SpatialGrid(box)
+        grid.append(('5234', 0, 0, 0, 10, 20, 30))
+        product_id = grid.find_collision(5, 5, 5, 10, 10, 10)
+    """
+
+    cells_per_axis = 8
+
+    def __init__(self, box, coordinates=()):
+        """
+        Initializes an empty grid for a box.
+
+        Args:
+            box (BoxDefinition): Box whose inside is indexed
+            coordinates (Iterable[tuple], optional): Coordinates to index right away
+        """
+        self.cell_counts = (self.cells_per_axis,) * 3
+        self.cell_size = tuple(
+            max(dimension, 1) / count
+            for dimension, count in zip(box.get_box_dimensions(), self.cell_counts)
+        )
+        self.entries = []
+        self.cells = {}
+
+        for coordinate in coordinates:
+            self.append(coordinate)
+
+    def cell_range(self, start, size, axis):
+        """
+        Returns the range of cell indices touched by an interval along one axis.
+
+        Args:
+            start (float): Start of the interval
+            size (float): Length of the interval
+            axis (int): 0 for x, 1 for y, 2 for z
+
+        Returns:
+            range: Cell indices, clamped to the grid
+        """
+        last_cell = self.cell_counts[axis] - 1
+        first = min(max(int(start // self.cell_size[axis]), 0), last_cell)
+        last = min(max(int((start + size) // self.cell_size[axis]), 0), last_cell)
+
+        return range(first, last + 1)
+
+    def append(self, coordinate):
+        """
+        Adds a placed product to the grid.
+
+        Args:
+            coordinate (tuple): (product_id, x, y, z, width, height, length)
+        """
+        _, x, y, z, width, height, length = coordinate
+        index = len(self.entries)
+        self.entries.append(coordinate)
+
+        for cell_x in self.cell_range(x, width, 0):
+            for cell_y in self.cell_range(y, height, 1):
+                for cell_z in self.cell_range(z, length, 2):
+                    self.cells.setdefault((cell_x, cell_y, cell_z), []).append(index)
+
+    def find_collision(self, x, y, z, width, height, length):
+        """
+        Finds a placed product that overlaps a candidate position.
+
+        Args:
+            x (float): Candidate x coordinate
+            y (float): Candidate y coordinate
+            z (float): Candidate z coordinate
+            width (float): Candidate width
+            height (float): Candidate height
+            length (float): Candidate length
+
+        Returns:
+            tuple: Coordinates of an overlapping product, or None if there is none
+
+        Note:
+            - Products that only touch the candidate do not overlap it
+        """
+        checked = set()
+
+        for cell_x in self.cell_range(x, width, 0):
+            for cell_y in self.cell_range(y, height, 1):
+                for cell_z in self.cell_range(z, length, 2):
+                    for index in self.cells.get((cell_x, cell_y, cell_z), ()):
+                        if index in checked:
+                            continue
+                        checked.add(index)
+
+                        coordinate = self.entries[index]
+                        _, other_x, other_y, other_z, other_width, other_height, other_length = coordinate
+                        if (
+                            x < other_x + other_width and x + width > other_x and
+                            y < other_y + other_height and y + height > other_y and
+                            z < other_z + other_length and z + length > other_z
+                        ):
+                            return coordinate
+
+        return None
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
@@ -1,6 +1,8 @@
+from collections import deque
 from multiprocessing import Lock, Pool, Manager
 import os
 import csv
+from itertools import islice
 from math import ceil
 import time
 from .packer import Packer
@@ -23,29 +25,49 @@ class System:
 
     Key Features:
         - Parallel order processing
+        - Streaming mode that packs orders while the input is still being read
         - Progress monitoring
         - CSV result generation
         - Resource management
         - Performance optimization
         - Error handling
+
+    Attributes:
+        streaming_batch_size (int): Orders handed to a worker at once in streaming mode
+        kernel (str): Name of the kernel for the collision and fit tests, 'python' or 'numpy'
+        engine (str | Dict[str, str]): Name of the layer engine, 'layers', 'maximal_space',
+            'extreme_point' or 'skyline', or the engine name per box type
     """
 
-    def __init__(self, output_file='./data/output_temp.csv'):
+    streaming_batch_size = 100
+
+    def __init__(self, output_file='./data/output_temp.csv', kernel='python', engine='layers', snapshot_dir=None):
         """
         Initializes the packing system with output configuration.
 
         Args:
             output_file (str): Path for results CSV file
+            kernel (str): Name of the kernel for the collision and fit tests,
+                'python' for the scalar loops or 'numpy' for the vectorized ones;
+                both give the same packing results
+            engine (str | Dict[str, str]): Name of the layer engine, 'layers' for
+                the stacked layers, 'maximal_space' for maximal empty spaces,
+                'extreme_point' for extreme points or 'skyline' for a heightmap;
+                or the engine name per box type, e.g. {'S': 'skyline', 'default': 'layers'}
+            snapshot_dir (str, optional): Directory for the snapshots of the parsed
+                input tables, by default a directory in the system temp directory
 
         Note:
             - Creates OrderManager instance
             - Prepares output handling
             - Sets up system state
         """
-        self.order_manager = OrderManager()
+        self.order_manager = OrderManager(snapshot_dir=snapshot_dir)
         self.output_file = output_file
+        self.kernel = kernel
+        self.engine = engine
 
-    def start_processing(self, orderline_file_path, product_file_path):
+    def start_processing(self, orderline_file_path, product_file_path, streaming=False):
         """
         Initiates the packing process with specified input files.
         Manages the complete packing workflow from data loading to result export.
@@ -53,6 +75,9 @@ class System:
         Args:
             orderline_file_path (str): Path to order data CSV
             product_file_path (str): Path to product definitions CSV
+            streaming (bool): Read the order lines one order at a time and pack
+                them in batches while the file is still being read. Files that are
+                not grouped by order number are grouped through on-disk partitions.
 
         Note:
             - Adjusts paths for module location
@@ -69,6 +94,11 @@ class System:
 
         self.order_manager.reset(adjusted_orderline_file_path, adjusted_product_file_path)
 
+        if streaming:
+            self.boxes = BoxInputReader.load_boxes(box_file_path)
+            self.process_streaming()
+            return
+
         # Process all orders
         start_time = time.time()
         processed_orders = self.order_manager.process_orders()
@@ -96,7 +126,7 @@ class System:
             progress_counter = manager.Value('i', 0)  # Shared counter initialized to 0
             lock = manager.Lock()  # Use Manager's Lock for multiprocessing
 
-            args = [(chunk, self.boxes, progress_counter, self.order_count, lock) for chunk in chunked_orders]
+            args = [(chunk, self.boxes, progress_counter, self.order_count, lock, self.kernel, self.engine) for chunk in chunked_orders]
 
             with Pool(processes=min(num_processes, self.order_count)) as pool:
                 results = pool.starmap(self.pack_orders_in_chunk, args)
@@ -107,11 +137,113 @@ class System:
             self.packers = packers
         
             print(f"Total working time: {sum(times)} seconds")
+            self.print_engine_report()
 
         self.export_packed_box()
 
+    def process_streaming(self):
+        """
+        Packs orders in batches while they are streamed from the order lines file.
+        Batches are handed to the worker pool as soon as they are read, and the
+        results of each batch are written to the output file as soon as they
+        arrive, so neither the orders nor the packed boxes are held in memory
+        as a whole.
+
+        Note:
+            - Orders are packed in streaming order, without the size sorting of the batch mode
+            - The total order count is unknown up front, so progress shows a count only
+            - At most two batches per worker are in flight, so reading does not
+              run ahead of packing
+            - Only counters are kept for the final report: self.order_count and
+              self.streamed_engine_report; self.packers stays empty
+        """
+        num_cores = os.cpu_count()
+        num_processes = max(1, num_cores - 1)  # Leave one core free
+
+        self.packers = []
+        self.order_count = 0
+        self.streamed_engine_report = {}
+        total_time = 0
+
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        self.file_path = os.path.join(current_dir, self.output_file)
+
+        with Manager() as manager:
+            progress_counter = manager.Value('i', 0)
+            lock = manager.Lock()
+            orders = self.order_manager.iter_orders()
+            pending = deque()
+
+            with open(self.file_path, mode='w', newline='', encoding='utf-8') as file, \
+                    Pool(processes=num_processes) as pool:
+                writer = csv.writer(file, quoting=csv.QUOTE_MINIMAL)
+                self.write_header(writer)
+
+                while True:
+                    batch = list(islice(orders, self.streaming_batch_size))
+
+                    if batch:
+                        self.order_count += len(batch)
+                        args = (batch, self.boxes, progress_counter, None, lock, self.kernel, self.engine)
+                        pending.append(pool.apply_async(System.pack_orders_in_chunk, args))
+
+                    if not pending:
+                        break
+
+                    if not batch or len(pending) >= num_processes * 2:
+                        packer, working_time = pending.popleft().get()
+                        self.write_packer(writer, packer)
+                        self.add_engine_report(self.streamed_engine_report, packer.engine_report)
+                        total_time += working_time
+
+            print(f"\nStreamed {self.order_count} orders, total working time: {total_time} seconds")
+            self.print_engine_report(self.streamed_engine_report)
+
+    def engine_report(self):
+        """
+        Combines the engine reports of all packers.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Per engine name, the number of packed boxes
+            ('boxes') and the time spent packing them ('seconds')
+        """
+        report = {}
+
+        for packer in self.packers:
+            self.add_engine_report(report, packer.engine_report)
+
+        return report
+
+    @staticmethod
+    def add_engine_report(report, engine_report):
+        """
+        Adds the engine report of one packer to a combined report.
+
+        Args:
+            report (Dict[str, Dict[str, float]]): Combined report, updated in place
+            engine_report (Dict[str, Dict[str, float]]): Engine report of a packer
+        """
+        for engine, packer_report in engine_report.items():
+            combined = report.setdefault(engine, {'boxes': 0, 'seconds': 0.0})
+            combined['boxes'] += packer_report['boxes']
+            combined['seconds'] += packer_report['seconds']
+
+    def print_engine_report(self, report=None):
+        """
+        Prints the packed boxes and packing time per layer engine.
+
+        Args:
+            report (Dict[str, Dict[str, float]], optional): Combined report to print,
+                by default the report of all packers
+        """
+        if report is None:
+            report = self.engine_report()
+
+        for engine, engine_report in sorted(report.items()):
+            print(f"Engine {engine}: {engine_report['boxes']} boxes packed in {engine_report['seconds']:.2f} seconds")
+
     @staticmethod
-    def pack_orders_in_chunk(orders, boxes, progress_counter, total_orders, lock):
+    def pack_orders_in_chunk(orders, boxes, progress_counter, total_orders, lock, kernel='python', engine='layers'):
         """
         Processes a subset of orders in parallel.
         Part of the multi-threading optimization strategy.
@@ -120,8 +252,10 @@ class System:
             orders (list): Orders to process
             boxes (list): Available box definitions
             progress_counter (Value): Shared progress tracking
-            total_orders (int): Total order count
+            total_orders (int): Total order count, or None when unknown (streaming)
             lock (Lock): Thread synchronization lock
+            kernel (str): Name of the kernel for the collision and fit tests
+            engine (str | Dict[str, str]): Name of the layer engine, or engine name per box type
 
         Note:
             - Thread-safe progress updates
@@ -130,7 +264,7 @@ class System:
             - Resource management
         """
         start_time = time.time()
-        packer = Packer()
+        packer = Packer(kernel, engine)
 
         for order in orders:
             packer.pack_order(order, boxes)
@@ -138,6 +272,10 @@ class System:
             with lock:  # Ensure thread-safe updates
                 progress_counter.value += 1
 
+            if not total_orders:
+                print(f"\rProcessing order {progress_counter.value}...", end='')
+                continue
+
             progress = progress_counter.value / total_orders
             bar_length = 40
             block = int(round(bar_length * progress))
@@ -170,26 +308,45 @@ class System:
         # Writing the data to a CSV file
         with open(self.file_path, mode='w', newline='', encoding='utf-8') as file:
             writer = csv.writer(file, quoting=csv.QUOTE_MINIMAL)
+            self.write_header(writer)
 
-            writer.writerow([
-                "Order ID",
-                "Box ID",
-                "Box Type",
-                "Box Width",
-                "Box Height",
-                "Box Depth",
-                "Item Name",
-                "Item Width",
-                "Item Height",
-                "Item Depth",
-                "Item Position X",
-                "Item Position Y",
-                "Item Position Z"
-            ])
-
-            # Write each row of data
             for packer in self.packers:
-                for entry in packer.get_packer_csv_result().split('\n'):
-                    if entry.strip():
-                        fields = entry.split(',')
-                        writer.writerow(fields)
+                self.write_packer(writer, packer)
+
+    @staticmethod
+    def write_header(writer):
+        """
+        Writes the header row of the results CSV.
+
+        Args:
+            writer (csv.writer): Writer of the output file
+        """
+        writer.writerow([
+            "Order ID",
+            "Box ID",
+            "Box Type",
+            "Box Width",
+            "Box Height",
+            "Box Depth",
+            "Item Name",
+            "Item Width",
+            "Item Height",
+            "Item Depth",
+            "Item Position X",
+            "Item Position Y",
+            "Item Position Z"
+        ])
+
+    @staticmethod
+    def write_packer(writer, packer):
+        """
+        Writes the placement rows of all orders packed by one packer.
+
+        Args:
+            writer (csv.writer): Writer of the output file
+            packer (Packer): Packer whose order results are written
+        """
+        for entry in packer.get_packer_csv_result().split('\n'):
+            if entry.strip():
+                fields = entry.split(',')
+                writer.writerow(fields)
@@ -0,0 +1,154 @@
+import logging
+import os
+
+class Tracer:
+    """
+    Debug tracing for the hot paths of the packing algorithm.
+    This class replaces logging.debug calls whose messages are formatted even when
+    debug logging is off, which costs time on every product, fragment and rotation.
+
+    Every subsystem has one tracer with an active flag. Call sites check the flag
+    before building a message, so a disabled tracer costs one attribute lookup:
+
+        if tracer.active:
+            tracer.log(f"Split space {space} ...")
+
+    Tracing is configured per subsystem and optionally per order:
+    - PACKING_TRACE: comma-separated subsystems to trace, or "all"
+    - PACKING_TRACE_ORDERS: comma-separated order numbers; if set, tracers are
+      only active while one of these orders is packed
+
+    Attributes:
+        subsystem (str): Name of the traced subsystem
+        logger (logging.Logger): Logger receiving the messages, named
+            algorithm.trace.<subsystem>
+        active (bool): Whether messages of this tracer should be built and logged
+        tracers (Dict[str, Tracer]): Tracer per subsystem, shared by all modules
+        subsystems (Set[str]): Traced subsystems
+        orders (Set[str]): Traced order numbers; empty to trace all orders
+        order (str): Order number currently being packed
+
+    Key Features:
+        - No message formatting while a tracer is inactive
+        - Trace messages are logged at debug level on their own logger, so they
+          show up even if the root logger is set to a higher level
+        - Per-order tracing to keep the traces of problem orders only
+
+    Usage:
+        tracer = get_tracer('layer')
+        Tracer.configure({'layer'}, {'1001'})
+        Tracer.set_order('1001')
+    """
+
+    tracers = {}
+    subsystems = set()
+    orders = set()
+    order = None
+
+    def __init__(self, subsystem):
+        """
+        Creates the tracer of a subsystem. Use get_tracer to share tracers.
+
+        Args:
+            subsystem (str): Name of the traced subsystem
+        """
+        self.subsystem = subsystem
+        self.logger = logging.getLogger(f"algorithm.trace.{subsystem}")
+        self.active = False
+        self.update()
+
+    def update(self):
+        """
+        Recomputes the active flag from the configuration and the current order.
+        """
+        enabled = self.subsystem in Tracer.subsystems or 'all' in Tracer.subsystems
+        self.active = enabled and (not Tracer.orders or Tracer.order in Tracer.orders)
+
+        if self.active:
+            self.logger.setLevel(logging.DEBUG)
+
+    def log(self, message):
+        """
+        Logs a trace message.
+
+        Args:
+            message (str): Message to log
+
+        Note:
+            - Callers check active first, so the message is only built when traced
+        """
+        self.logger.debug(message)
+
+    @staticmethod
+    def configure(subsystems=None, orders=None):
+        """
+        Sets the traced subsystems and orders.
+
+        Args:
+            subsystems (Iterable[str], optional): Subsystems to trace, or "all";
+                read from PACKING_TRACE if not given
+            orders (Iterable[str], optional): Order numbers to trace; read from
+                PACKING_TRACE_ORDERS if not given, all orders if empty
+        """
+        if subsystems is None:
+            subsystems = Tracer.parse_list(os.environ.get('PACKING_TRACE', ''))
+        if orders is None:
+            orders = Tracer.parse_list(os.environ.get('PACKING_TRACE_ORDERS', ''))
+
+        Tracer.subsystems = set(subsystems)
+        Tracer.orders = {str(order) for order in orders}
+
+        for tracer in Tracer.tracers.values():
+            tracer.update()
+
+    @staticmethod
+    def set_order(order_number):
+        """
+        Sets the order currently being packed.
+
+        Args:
+            order_number (str): Order number
+
+        Note:
+            - Only updates the tracers if tracing is limited to some orders
+        """
+        Tracer.order = str(order_number)
+
+        if Tracer.orders:
+            for tracer in Tracer.tracers.values():
+                tracer.update()
+
+    @staticmethod
+    def parse_list(value):
+        """
+        Splits a comma-separated setting.
+
+        Args:
+            value (str): Setting value
+
+        Returns:
+            List[str]: Non-empty, stripped entries
+        """
+        return [entry.strip() for entry in value.split(',') if entry.strip()]
+
+
+def get_tracer(subsystem):
+    """
+    Returns the tracer of a subsystem, creating it on first use.
+
+    Args:
+        subsystem (str): Name of the subsystem, e.g. 'layer', 'box' or 'collision'
+
+    Returns:
+        Tracer: The tracer of the subsystem
+    """
+    tracer = Tracer.tracers.get(subsystem)
+
+    if tracer is None:
+        tracer = Tracer(subsystem)
+        Tracer.tracers[subsystem] = tracer
+
+    return tracer
+
+
+Tracer.configure()
@@ -34,16 +34,16 @@ class Main:
 
         self.algorithm_output_file = '.' + self.output_file.split('algorithm')[1]
 
-    def start(self, algorithm, visualization, demo):
+    def start(self, algorithm, visualization, demo, engine='layers'):
         if (algorithm):
             startTime = time.time()
-            system = System(self.demo_output_file if demo else self.algorithm_output_file)
+            system = System(self.demo_output_file if demo else self.algorithm_output_file, engine=engine)
             system.start_processing(self.demo_orders_file if demo else self.orders_file, self.demo_product_file if demo else self.product_file)
             endTime = time.time()
 
             total_boxes = sum(len(orderResult.boxes) for packer in system.packers for orderResult in packer.orderResults)
             orderlines = sum(len(orderResult.order.packed_items) for packer in system.packers for orderResult in packer.orderResults)
-            print(f"\nProcessing time: {endTime - startTime} seconds for {len(system.orders)} orders, {total_boxes} boxes with {orderlines} orderlines")
+            print(f"\nProcessing time: {endTime - startTime} seconds for {len(system.orders)} orders, {total_boxes} boxes with {orderlines} orderlines using the {engine} engine")
 
         if visualization:
             os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"  
@@ -56,12 +56,17 @@ class Main:
 if __name__ == '__main__':
     # Default to demo mode if no arguments are provided
     mode = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    # Layer engine to compare runs: layers, maximal_space, extreme_point or skyline,
+    # or an engine per box type such as S=skyline,default=layers
+    engine = sys.argv[2] if len(sys.argv) > 2 else 'layers'
+    if '=' in engine:
+        engine = dict(entry.split('=', 1) for entry in engine.split(','))
 
     if mode == 0:
-        Main().start(True, False, False)
+        Main().start(True, False, False, engine)
     elif mode == 1:
         Main().start(False, True, False)
     elif mode == 2:
-        Main().start(True, True, False)
+        Main().start(True, True, False, engine)
     elif mode == 3:
-        Main().start(True, True, True)
\ No newline at end of file
+        Main().start(True, True, True, engine)
\ No newline at end of file
@@ -0,0 +1,88 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import BoxCatalog, BoxInputReader, BoxResult, Order, Packer, Product
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+class TestBoxCatalog(unittest.TestCase):
+    def setUp(self):
+        self.boxes = BoxInputReader.load_boxes(os.path.join(current_dir, 'test_files/dummy_box_definition.json'))
+        self.catalog = BoxCatalog(self.boxes)
+
+    def test_boxes_sorted_by_volume(self):
+        self.assertEqual(self.catalog.boxes, sorted(self.boxes, key=lambda box: box.max_volume()))
+        self.assertEqual(self.catalog.max_volumes, [box.max_volume() for box in self.catalog.boxes])
+        self.assertEqual(len(self.catalog), len(self.boxes))
+
+    def test_eligibility(self):
+        for box, eligible in zip(self.catalog.boxes, self.catalog.eligible):
+            self.assertEqual(eligible, box.container_type not in ("XXS", "MXS"))
+
+        self.assertEqual(self.catalog.fallback_box.container_type, "L")
+
+    def test_select_smallest_fitting_box(self):
+        box = self.catalog.select(100 * 100 * 100, 50, [100, 100, 100])
+
+        self.assertEqual(box.container_type, "XSD")
+
+    def test_select_after_last_box(self):
+        first = self.catalog.select(100 * 100 * 100, 50, [100, 100, 100])
+        box = self.catalog.select(100 * 100 * 100, 50, [100, 100, 100], first)
+
+        self.assertGreater(box.max_volume(), first.max_volume())
+
+    def test_select_without_fit(self):
+        self.assertIsNone(self.catalog.select(1000 ** 3, 50, [1000, 1000, 1000]))
+
+    def test_select_below_minimum_fill(self):
+        self.assertIs(self.catalog.select(10, 50, [1, 1, 1]), self.catalog.boxes[0])
+
+    def test_feasible_mask(self):
+        product = Product(100, 100, 100, 50, 100, "Coca cola", "Fontys")
+        mask = self.catalog.feasible_mask(product.definition)
+
+        for index, box in enumerate(self.catalog.boxes):
+            self.assertEqual(bool(mask >> index & 1), box.fits_with_dimensions(product.get_dimensions()))
+            self.assertEqual(self.catalog.can_hold(product.definition, box), bool(mask >> index & 1))
+
+        self.assertIs(self.catalog.masks[product.definition], mask)
+
+    def test_order_mask(self):
+        small = Product(100, 100, 100, 50, 100, "Coca cola", "Fontys")
+        large = Product(400, 400, 100, 50, 100, "Pepsi", "Fontys")
+        mask = self.catalog.order_mask(Order("Order", "0", [small, small, large]).pending_counts.keys())
+
+        self.assertEqual(mask, self.catalog.feasible_mask(small.definition) & self.catalog.feasible_mask(large.definition))
+        self.assertEqual(self.catalog.order_mask([]), (1 << len(self.catalog)) - 1)
+
+    def test_select_skips_infeasible_boxes(self):
+        product = Product(1000, 1000, 1000, 50, 100, "Too big", "Fontys")
+        mask = self.catalog.order_mask([product.definition])
+
+        self.assertEqual(mask, 0)
+        self.assertIsNone(self.catalog.select(product.volume(), 50, product.get_dimensions(), None, mask))
+
+    def test_box_result_uses_mask(self):
+        large = Product(400, 400, 100, 50, 100, "Pepsi", "Fontys")
+        box = self.catalog.boxes[-1]
+        small_box = self.catalog.boxes[1]
+
+        self.assertFalse(BoxResult(box, self.catalog).product_is_oversized(large))
+        self.assertEqual(
+            BoxResult(small_box, self.catalog).product_is_oversized(large),
+            BoxResult(small_box).product_is_oversized(large)
+        )
+
+    def test_packer_reuses_catalog(self):
+        packer = Packer()
+        product = Product(100, 100, 100, 50, 100, "Coca cola", "Fontys")
+
+        packer.pack_order(Order("NMR230201", "1990-01-01", [product]), self.boxes)
+        catalog = packer.box_catalog
+        packer.pack_order(Order("NMR230202", "1990-01-01", [Product(100, 100, 100, 50, 100, "Coca cola", "Fontys")]), self.boxes)
+
+        self.assertIs(packer.box_catalog, catalog)
@@ -29,6 +29,8 @@ class TestBoxDefinition(unittest.TestCase):
         test_fits_within_fail: Tests the fits_within method for a failed fit.
         test_fits_with_dimensions_success: Tests the fits_with_dimensions method for a successful fit.
         test_fits_with_dimensions_fail: Tests the fits_with_dimensions method for a failed fit.
+        test_grid_capacity: Tests the grid_capacity method for a product that fits.
+        test_grid_capacity_oversized: Tests the grid_capacity method for a product that does not fit.
     """
 
     def setUp(self):
@@ -155,4 +157,24 @@ class TestBoxDefinition(unittest.TestCase):
         box = BoxDefinition(40, 20, 10, 1000, 5000, "Test Box", "T", "Test Remark", 80.0, 5.0)
         self.assertEqual(box.height, 40)
         self.assertEqual(box.width, 20)
-        self.assertEqual(box.length, 10)
\ No newline at end of file
+        self.assertEqual(box.length, 10)
+
+    def test_grid_capacity(self):
+        """
+        Tests the grid_capacity method for a product that fits.
+        """
+        box = BoxDefinition(30, 50, 20, 1000, 5000, "Test Box", "T", "Test Remark", 80.0, 5.0)
+        capacity, rotation, counts = box.grid_capacity((10, 20, 30))
+
+        self.assertEqual(capacity, 5)
+        self.assertEqual(counts, (1, 5, 1))
+        self.assertEqual(rotation.adjust_dimensions(10, 20, 30), (30, 10, 20))
+
+    def test_grid_capacity_oversized(self):
+        """
+        Tests the grid_capacity method for a product that does not fit.
+        """
+        box = BoxDefinition(30, 50, 20, 1000, 5000, "Test Box", "T", "Test Remark", 80.0, 5.0)
+
+        self.assertEqual(box.grid_capacity((60, 20, 30))[0], 0)
+        self.assertEqual(box.grid_capacity((0, 20, 30))[0], 0)
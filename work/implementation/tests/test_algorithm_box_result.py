@@ -115,3 +115,59 @@ class TestBoxResult(unittest.TestCase):
         
         # Check if no products are packed
         self.assertEqual(len(self.box_result.get_products_positions()), 0)
+
+    def test_add_products_to_box(self):
+        products = [Product.from_definition(self.product1.definition, 1) for _ in range(5)]
+
+        self.assertEqual(self.box_result.add_products_to_box(products), 5)
+        self.assertEqual(len(self.box_result.get_all_coordinates()), 5)
+        self.assertEqual(len(self.box_result.collect_existing_coordinates()), 5)
+
+    def test_add_products_to_box_stops_at_first_failure(self):
+        box_definition = BoxDefinition(20, 30, 10, 0, 1000, "Tiny", "T", "Tiny", 100.0, 0.0)
+        box_result = BoxResult(box_definition)
+        products = [Product.from_definition(self.product1.definition, 1) for _ in range(3)]
+
+        self.assertEqual(box_result.add_products_to_box(products), 1)
+        self.assertEqual(box_result.get_leftover_products(), products[1:])
+
+    def test_pack_products_by_order_matches_single_units(self):
+        products = [Product.from_definition(self.product2.definition, 1) for _ in range(40)]
+        single_units = [Product(15, 25, 35, 600, 100, "Product2", 1) for _ in range(40)]
+
+        self.box_result.pack_products_by_order(Order("OrderNumber", "0", products))
+        box_result = BoxResult(self.box_definition)
+        box_result.pack_products_by_order(Order("OrderNumber", "0", single_units))
+
+        self.assertEqual(
+            [position['starting_point'] for position in self.box_result.get_products_positions()],
+            [position['starting_point'] for position in box_result.get_products_positions()]
+        )
+
+    def test_pack_products_in_grid(self):
+        products = [Product.from_definition(self.product1.definition, 1) for _ in range(5)]
+        order = Order("OrderNumber", "0", products)
+        capacity, rotation, counts = self.box_definition.grid_capacity(self.product1.get_dimensions())
+
+        self.box_result.pack_products_in_grid(order, rotation, counts)
+        coordinates = [position.get_coordinates() for position in self.box_result.get_all_coordinates()]
+
+        self.assertEqual(order.taken_items, products)
+        self.assertEqual(coordinates[0], (0, 0, 0))
+        self.assertEqual(len(set(coordinates)), 5)
+        self.assertEqual(self.box_result.grid_offsets(10, 3), [0, 10, 20])
+
+    def test_seed_layout(self):
+        products = [Product.from_definition(self.product2.definition, 1) for _ in range(10)]
+        self.box_result.pack_products_by_order(Order("OrderNumber", "0", products))
+        larger = BoxDefinition(500, 400, 300, 900, 19570, "Carton large", "L", "Large cartons", 80.0, 5.0)
+        smaller = BoxDefinition(100, 100, 100, 100, 19570, "Carton tiny", "T", "Tiny cartons", 80.0, 5.0)
+
+        box_result = BoxResult(larger)
+
+        self.assertFalse(BoxResult(smaller).can_seed(self.box_result))
+        self.assertFalse(BoxResult(larger, engine='skyline').can_seed(self.box_result))
+        self.assertTrue(box_result.can_seed(self.box_result))
+        self.assertEqual(box_result.seed_layout(self.box_result), products)
+        self.assertEqual(list(box_result.coordinate_store), list(self.box_result.coordinate_store))
+        self.assertTrue(box_result.add_product_to_box(self.product1))
@@ -0,0 +1,71 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import BoxDefinition, BoxResult, CoordinateStore, LayerResult, Order, OrderResult, Position, Product, RotationType
+
+class TestCoordinateStore(unittest.TestCase):
+    def setUp(self):
+        self.product = Product(10, 20, 30, 500, 100, "Product1", 1)
+        self.store = CoordinateStore()
+
+    def position(self, x, y, z):
+        return Position(self.product, x, y, z, RotationType.initial_rotation(*self.product.get_dimensions()))
+
+    def test_append(self):
+        position = self.position(0, 5, 0)
+
+        row = self.store.append(position, 0)
+
+        self.assertEqual(row, LayerResult.get_position_coordinates(position))
+        self.assertEqual(self.store.row(0), row)
+        self.assertEqual(list(self.store), [row])
+        self.assertEqual(len(self.store), 1)
+
+    def test_layer_order(self):
+        first = self.position(0, 0, 0)
+        second = self.position(0, 20, 0)
+        third = self.position(20, 0, 0)
+        self.store.append(first, 0)
+        self.store.append(second, 1)
+        self.store.append(third, 0)
+
+        self.assertEqual(self.store.layer_order(), [0, 2, 1])
+        self.assertEqual(self.store.get_positions(), [first, third, second])
+
+    def test_box_result_matches_layers(self):
+        box = BoxDefinition(410, 300, 240, 430, 19570, "Carton small", "S", "Small cartons", 80.0, 5.0)
+        box_result = BoxResult(box)
+        products = [Product(15, 25, 35, 600, 100, "Product2", 1) for _ in range(30)]
+        products += [Product(40, 10, 60, 600, 100, "Product3", 1) for _ in range(30)]
+        order = Order("OrderNumber", "0", products)
+        box_result.pack_products_by_order(order)
+
+        self.assertEqual(box_result.coordinate_store.get_positions(), box_result.get_all_coordinates())
+        self.assertEqual(
+            sorted(box_result.collect_existing_coordinates()),
+            sorted(coordinate for layer in box_result.get_layers() for coordinate in layer.get_product_coordinates())
+        )
+
+    def test_csv_result_reads_store(self):
+        box = BoxDefinition(410, 300, 240, 430, 19570, "Carton small", "S", "Small cartons", 80.0, 5.0)
+        box_result = BoxResult(box)
+        order = Order("OrderNumber", "0", [Product(15, 25, 35, 600, 100, "Product2", 1) for _ in range(3)])
+        box_result.pack_products_by_order(order)
+        order_result = OrderResult(order)
+        order_result.add_box(box_result)
+
+        rows = order_result.get_csv_result().split("\n")
+        expected = [
+            f"{position.get_product().item},{','.join(map(str, position.get_dimensions()))},"
+            f"{','.join(map(str, position.get_coordinates()))}"
+            for position in box_result.get_all_coordinates()
+        ]
+
+        self.assertEqual([row.split(",", 6)[6] for row in rows], expected)
+        self.assertIs(order_result.get_csv_result(), order_result.get_csv_result())
+
+        box_result.add_products_to_box([Product(15, 25, 35, 600, 100, "Product2", 1)])
+        self.assertEqual(len(order_result.get_csv_result().split("\n")), 4)
@@ -0,0 +1,73 @@
+import unittest
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import BoxDefinition, BoxResult, ExtremePointLayerResult, Fragment, Order, Position, Product, RotationType
+
+class TestExtremePointLayerResult(unittest.TestCase):
+    def setUp(self):
+        self.box = BoxDefinition(410, 300, 240, 430, 19570, "Carton small", "S", "Small cartons", 80.0, 5.0)
+        self.layer = ExtremePointLayerResult(self.box)
+        self.product = Product(10, 20, 30, 500, 100, "Product1", 1)
+
+    def test_first_placement_points(self):
+        position = Position(self.product, 0, 0, 0, RotationType.initial_rotation(*self.product.get_dimensions()))
+        self.assertTrue(self.layer.add_product(position, []))
+        width, height, length = self.layer.get_positions()[0].calculate_extending_point()
+
+        points = [(space.x, space.y, space.z) for space in self.layer.remaining_spaces]
+
+        self.assertEqual(points, [(width, 0, 0), (0, height, 0), (0, 0, length)])
+        self.assertEqual(self.layer.remaining_spaces[0],
+                         Fragment(width, 0, 0, self.box.width - width, self.box.height, self.box.length))
+
+    def test_project(self):
+        self.layer.extents = [((0, 0, 0), (10, 10, 10)), ((20, 0, 0), (30, 5, 10))]
+
+        self.assertEqual(self.layer.project((25, 8, 5), 1), (25, 5, 5))
+        self.assertEqual(self.layer.project((25, 12, 5), 0), (0, 12, 5))
+        self.assertEqual(self.layer.project((25, 3, 15), 2), (25, 3, 10))
+        self.assertEqual(self.layer.project((15, 5, 5), 0), (10, 5, 5))
+
+    def test_shorten_space(self):
+        space = Fragment(0, 0, 0, 100, 100, 100)
+
+        shortened = ExtremePointLayerResult.shorten_space(space, (40, 0, 0), (60, 10, 10))
+
+        self.assertEqual(shortened, Fragment(0, 0, 0, 40, 100, 100))
+        self.assertIs(ExtremePointLayerResult.shorten_space(space, (40, 5, 0), (60, 10, 10)), space)
+
+    def test_residual_space_inside_product(self):
+        self.layer.extents = [((0, 0, 0), (10, 10, 10))]
+
+        self.assertIsNone(self.layer.residual_space((5, 5, 5)))
+        self.assertEqual(self.layer.residual_space((0, 0, 10)),
+                         Fragment(0, 0, 10, self.box.width, self.box.height, self.box.length - 10))
+
+    def test_box_result_engine(self):
+        random.seed(5)
+        definitions = [(15, 25, 35), (40, 10, 60), (22, 22, 22), (5, 70, 30)]
+        products = [Product(*random.choice(definitions), 500, 100, "Product", 1) for _ in range(80)]
+        box_result = BoxResult(self.box, engine='extreme_point')
+
+        box_result.pack_products_by_order(Order("OrderNumber", "0", products))
+        coordinates = box_result.collect_existing_coordinates()
+
+        self.assertEqual(len(box_result.get_layers()), 1)
+        self.assertEqual(len(coordinates) + len(box_result.get_leftover_products()), 80)
+        for index, (_, x, y, z, width, height, length) in enumerate(coordinates):
+            self.assertLessEqual(x + width, self.box.width)
+            self.assertLessEqual(y + height, self.box.height)
+            self.assertLessEqual(z + length, self.box.length)
+            for _, other_x, other_y, other_z, other_width, other_height, other_length in coordinates[index + 1:]:
+                self.assertFalse(
+                    x < other_x + other_width and x + width > other_x and
+                    y < other_y + other_height and y + height > other_y and
+                    z < other_z + other_length and z + length > other_z
+                )
+
+if __name__ == '__main__':
+    unittest.main()
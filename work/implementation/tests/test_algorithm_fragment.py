@@ -0,0 +1,33 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import Fragment
+
+class TestFragment(unittest.TestCase):
+    def setUp(self):
+        self.fragment = Fragment(0, 0, 0, 10, 20, 30)
+
+    def test_merge(self):
+        """Test that fragments are only merged when their union is a box."""
+        self.assertEqual(self.fragment.merge(Fragment(10, 0, 0, 5, 20, 30)), Fragment(0, 0, 0, 15, 20, 30))
+        self.assertEqual(self.fragment.merge(Fragment(0, 20, 0, 10, 5, 30)), Fragment(0, 0, 0, 10, 25, 30))
+        self.assertEqual(self.fragment.merge(Fragment(0, 0, 5, 10, 20, 40)), Fragment(0, 0, 0, 10, 20, 45))
+        self.assertIsNone(self.fragment.merge(Fragment(10, 0, 0, 5, 21, 30)))
+        self.assertIsNone(self.fragment.merge(Fragment(11, 0, 0, 5, 20, 30)))
+
+    def test_merge_keeps_new_flag(self):
+        """Test that a merged fragment is new if either fragment is new."""
+        self.fragment.new = False
+        other = Fragment(10, 0, 0, 5, 20, 30)
+
+        other.new = False
+        self.assertFalse(self.fragment.merge(other).new)
+
+        other.new = True
+        self.assertTrue(self.fragment.merge(other).new)
+
+if __name__ == '__main__':
+    unittest.main()
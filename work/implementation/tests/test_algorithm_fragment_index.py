@@ -0,0 +1,75 @@
+import unittest
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import BoxDefinition, Fragment, FragmentIndex, LayerResult, Product
+
+class TestFragmentIndex(unittest.TestCase):
+    def setUp(self):
+        self.fragments = [
+            Fragment(0, 0, 0, 10, 20, 30),
+            Fragment(0, 0, 0, 5, 50, 50),
+            Fragment(0, 0, 0, 40, 40, 40),
+        ]
+        self.index = FragmentIndex(self.fragments)
+
+    def test_dominating(self):
+        self.assertEqual(self.index.dominating((30, 20, 10)), [0, 2])
+        self.assertEqual(self.index.dominating((30, 20, 10), [2, 0]), [2, 0])
+        self.assertEqual(self.index.dominating((45, 1, 1)), [1])
+
+    def test_with_volume(self):
+        self.assertEqual(self.index.with_volume(12500), [1, 2])
+
+    def test_layer_rebuilds_index(self):
+        box = BoxDefinition(410, 300, 240, 430, 19570, "Carton small", "S", "Small cartons", 80.0, 5.0)
+        layer = LayerResult(box)
+
+        layer.remaining_spaces = self.fragments
+
+        self.assertIs(layer.fragment_index.fragments, self.fragments)
+        self.assertEqual(list(layer.remaining_spaces), self.fragments)
+
+    def test_candidate_spaces_match_repeated_sorts(self):
+        box = BoxDefinition(410, 300, 240, 430, 19570, "Carton small", "S", "Small cartons", 80.0, 5.0)
+        product = Product(12, 18, 25, 500, 80, "Product1", 1)
+        random.seed(3)
+
+        for _ in range(50):
+            spaces = [
+                Fragment(random.choice([0, 10, 20]), random.choice([0, 10, 20]), random.choice([0, 10, 20]),
+                         random.choice([5, 15, 30, 60]), random.choice([5, 20, 40]), random.choice([10, 30, 50]))
+                for _ in range(20)
+            ]
+            for space in spaces:
+                space.new = random.random() < 0.5
+            last_space = random.choice(spaces + [None])
+            last_product = random.choice(["Product1", "Product2", None])
+            new_flags = [space.new for space in spaces]
+
+            layer = LayerResult(box)
+            layer.remaining_spaces = spaces
+            layer.last_space, layer.last_product = last_space, last_product
+            candidates = layer.candidate_spaces(product)
+
+            # Reference: the sorts of the original placement search
+            for space, new in zip(spaces, new_flags):
+                space.new = new
+            expected = sorted(spaces, key=lambda individual: not individual.new)
+            if not last_space or not last_product or product.item != last_product:
+                for space in expected:
+                    space.new = False
+                expected = sorted([space for space in expected if space.volume() >= product.volume()], key=lambda individual: (individual.z, individual.x))
+                if last_space and last_product and expected.count(last_space) > 0:
+                    expected.remove(last_space)
+            expected = sorted(expected, key=lambda individual: individual.y)
+            product_dimensions = sorted(product.get_dimensions())
+            expected = [
+                space for space in expected
+                if all(a <= b for a, b in zip(product_dimensions, sorted((space.width, space.height, space.length))))
+            ]
+
+            self.assertEqual([id(space) for space in candidates], [id(space) for space in expected])
@@ -0,0 +1,71 @@
+import unittest
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import BoxDefinition, BoxResult, Fragment, LayerResult, Order, Position, Product, RotationType
+from implementation.algorithm.kernels import ExtentArray, get_kernel
+from implementation.algorithm.layer_result import check_collision
+
+class TestKernels(unittest.TestCase):
+    def setUp(self):
+        self.box = BoxDefinition(410, 300, 240, 430, 19570, "Carton small", "S", "Small cartons", 80.0, 5.0)
+        random.seed(11)
+
+    def test_extent_array_collision(self):
+        extents = ExtentArray([('Product1', 0, 0, 0, 10, 20, 30)])
+
+        self.assertEqual(extents.find_collision(5, 5, 5, 10, 10, 10)[0], 'Product1')
+        self.assertIsNone(extents.find_collision(10, 0, 0, 10, 20, 30))
+        self.assertIsNone(ExtentArray().find_collision(0, 0, 0, 1, 1, 1))
+
+    def test_extent_array_grows(self):
+        coordinates = [(f'Product{i}', i * 10, 0, 0, 10, 10, 10) for i in range(40)]
+        extents = ExtentArray(coordinates)
+
+        self.assertEqual(list(extents), coordinates)
+        self.assertEqual(extents.find_collision(395, 5, 5, 1, 1, 1)[0], 'Product39')
+
+    def test_check_collision_matches_list(self):
+        coordinates = [
+            (f'Product{i}', random.uniform(0, 200), random.uniform(0, 250), random.uniform(0, 380),
+             random.uniform(1, 60), random.uniform(1, 60), random.uniform(1, 60))
+            for i in range(60)
+        ]
+        extents = ExtentArray(coordinates)
+        product = Product(10, 20, 30, 500, 100, "Product1", 1)
+
+        for _ in range(200):
+            position = Position(product, random.uniform(0, 220), random.uniform(0, 280), random.uniform(0, 400), random.choice(list(RotationType)))
+            self.assertEqual(check_collision(position, extents), check_collision(position, coordinates))
+
+    def test_fitting_rotations_match(self):
+        spaces = [
+            Fragment(random.uniform(0, 200), random.uniform(0, 250), random.uniform(0, 380),
+                     random.uniform(1, 240), random.uniform(1, 300), random.uniform(1, 410))
+            for _ in range(50)
+        ]
+        rotations = LayerResult.candidate_rotations((35, 80, 120))
+
+        self.assertEqual(
+            list(get_kernel('python').fitting_rotations(spaces, rotations, self.box)),
+            get_kernel('numpy').fitting_rotations(spaces, rotations, self.box)
+        )
+
+    def test_packing_matches(self):
+        definitions = [(15, 25, 35), (40, 10, 60), (22, 22, 22), (5, 70, 30)]
+        products = [Product(*random.choice(definitions), 500, 100, "Product", 1) for _ in range(60)]
+        placements = []
+
+        for kernel in ('python', 'numpy'):
+            box_result = BoxResult(self.box, kernel=kernel)
+            box_result.pack_products_by_order(Order("OrderNumber", "0", list(products)))
+            placements.append([position['starting_point'] for position in box_result.get_products_positions()])
+
+        self.assertEqual(placements[0], placements[1])
+
+    def test_unknown_kernel(self):
+        with self.assertRaises(ValueError):
+            get_kernel('fortran')
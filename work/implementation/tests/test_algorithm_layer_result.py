@@ -600,4 +600,71 @@ class TestLayerAndBoxResult(unittest.TestCase):
     
         # Check that the remaining spaces were not modified
         self.assertEqual(len(layer.remaining_spaces), 1, "Remaining spaces should not be modified.")
-        self.assertEqual(layer.remaining_spaces[0].volume(), 50 * 50 * 50, "Remaining space volume should be unchanged.")
\ No newline at end of file
+        self.assertEqual(layer.remaining_spaces[0].volume(), 50 * 50 * 50, "Remaining space volume should be unchanged.")
+
+    def test_merge_fragments(self):
+        """Test that slivers are merged into one fragment once the threshold is passed."""
+        box = BoxDefinition(width=100, height=100, length=100, weight=805,
+                            max_weight=19195,
+                            description="Carton medium",
+                            container_type="M",
+                            remark="Medium 6006380V1-00",
+                            max_fill_percentage=80.0,
+                            min_fill_percentage=5.0)
+        slivers = [Fragment(x, 0, 50, 1, 100, 50) for x in range(100)]
+
+        self.assertEqual(LayerResult.merge_fragments(list(slivers)), [Fragment(0, 0, 50, 100, 100, 50)])
+
+        layer = LayerResult(box)
+        layer.remaining_spaces = slivers + [Fragment(0, 0, 0, 100, 100, 50)]
+        product = Product(width=10, height=10, length=10, weight=5, fit_ratio=100, item="NewProduct", location="06C01")
+        layer.update_remaining_spaces(Position(product, 0, 0, 0, RotationType.RT1))
+
+        self.assertLessEqual(len(layer.remaining_spaces), LayerResult.merge_threshold)
+        self.assertIn(Fragment(0, 0, 10, 100, 100, 90), layer.remaining_spaces)
+
+    def test_add_product_creates_single_position(self):
+        """Test that the search leaves the given position unchanged and stores a new one."""
+        box = self.box_lookup['M']
+        layer = LayerResult(box)
+        product = Product(width=10, height=20, length=30, weight=5, fit_ratio=100, item="NewProduct", location="06C01")
+        rotation = RotationType.initial_rotation(*product.get_dimensions())
+        position = Position(product, 0, 0, 0, rotation)
+        layer.add_product(Position(product, 0, 0, 0, rotation), [])
+
+        self.assertTrue(layer.add_product(position, layer.get_product_coordinates()))
+        self.assertEqual(position.get_coordinates(), (0, 0, 0))
+        self.assertEqual(position.get_rotation(), rotation)
+        self.assertIsNot(layer.get_positions()[-1], position)
+        self.assertFalse(check_collision(layer.get_positions()[-1], layer.get_product_coordinates()[:-1]))
+
+    def test_add_product_skips_rejected_spaces(self):
+        """Test that spaces rejected for a unit are skipped for the next one without changing the placements."""
+        box = self.box_lookup['M']
+        product = Product(width=17, height=23, length=29, weight=5, fit_ratio=100, item="NewProduct", location="06C01")
+        rotation = RotationType.initial_rotation(*product.get_dimensions())
+        layers = [LayerResult(box), LayerResult(box)]
+        skipped = False
+
+        for _ in range(40):
+            for index, layer in enumerate(layers):
+                if index:
+                    layer.rejected_dimensions = None
+                rejected = [space for space in layer.rejected_spaces.values() if space in layer.remaining_spaces]
+                skipped = skipped or (index == 0 and bool(rejected))
+                layer.add_product(Position(product, 0, 0, 0, rotation), layer.get_product_coordinates())
+
+        self.assertTrue(skipped)
+        self.assertEqual(
+            [(position.get_coordinates(), position.get_rotation()) for position in layers[0].get_positions()],
+            [(position.get_coordinates(), position.get_rotation()) for position in layers[1].get_positions()]
+        )
+
+    def test_slots(self):
+        """Test that positions and fragments do not carry an attribute dictionary."""
+        product = Product(width=10, height=20, length=30, weight=5, fit_ratio=100, item="NewProduct", location="06C01")
+        position = Position(product, 1, 2, 3, RotationType.RT1)
+
+        self.assertFalse(hasattr(position, '__dict__'))
+        self.assertFalse(hasattr(Fragment(0, 0, 0, 1, 1, 1), '__dict__'))
+        self.assertEqual(position.calculate_extending_point(), (11, 22, 33))
@@ -0,0 +1,78 @@
+import unittest
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import BoxDefinition, BoxResult, Fragment, MaximalSpaceLayerResult, Order, Position, Product, RotationType
+
+class TestMaximalSpaceLayerResult(unittest.TestCase):
+    def setUp(self):
+        self.box = BoxDefinition(410, 300, 240, 430, 19570, "Carton small", "S", "Small cartons", 80.0, 5.0)
+        self.layer = MaximalSpaceLayerResult(self.box)
+        self.product = Product(10, 20, 30, 500, 100, "Product1", 1)
+
+    def test_fragment_contains(self):
+        outer = Fragment(0, 0, 0, 10, 10, 10)
+
+        self.assertTrue(outer.contains(Fragment(2, 2, 2, 8, 8, 8)))
+        self.assertTrue(outer.contains(outer))
+        self.assertFalse(outer.contains(Fragment(5, 5, 5, 10, 1, 1)))
+
+    def test_clip_space(self):
+        space = Fragment(0, 0, 0, 100, 100, 100)
+
+        fragments = MaximalSpaceLayerResult.clip_space(space, (10, 0, 20), (30, 40, 50))
+
+        self.assertEqual(fragments, [
+            Fragment(0, 0, 0, 10, 100, 100),
+            Fragment(30, 0, 0, 70, 100, 100),
+            Fragment(0, 40, 0, 100, 60, 100),
+            Fragment(0, 0, 0, 100, 100, 20),
+            Fragment(0, 0, 50, 100, 100, 50),
+        ])
+
+    def test_remove_contained_spaces(self):
+        spaces = [Fragment(0, 0, 0, 10, 10, 10), Fragment(0, 0, 0, 5, 5, 5), Fragment(0, 0, 0, 10, 10, 10)]
+
+        kept = MaximalSpaceLayerResult.remove_contained_spaces(spaces)
+
+        self.assertEqual(len(kept), 1)
+        self.assertIs(kept[0], spaces[0])
+
+    def test_fragments_are_free(self):
+        position = Position(self.product, 0, 0, 0, RotationType.initial_rotation(*self.product.get_dimensions()))
+        self.assertTrue(self.layer.add_product(position, []))
+        placed = self.layer.get_positions()[0]
+
+        for space in self.layer.remaining_spaces:
+            self.assertFalse(MaximalSpaceLayerResult.intersects(space, placed.get_coordinates(), placed.calculate_extending_point()))
+
+        self.assertEqual(len(self.layer.remaining_spaces), 3)
+
+    def test_box_result_engine(self):
+        random.seed(5)
+        definitions = [(15, 25, 35), (40, 10, 60), (22, 22, 22), (5, 70, 30)]
+        products = [Product(*random.choice(definitions), 500, 100, "Product", 1) for _ in range(80)]
+        box_result = BoxResult(self.box, engine='maximal_space')
+
+        box_result.pack_products_by_order(Order("OrderNumber", "0", products))
+        coordinates = box_result.collect_existing_coordinates()
+
+        self.assertEqual(len(box_result.get_layers()), 1)
+        self.assertEqual(len(coordinates) + len(box_result.get_leftover_products()), 80)
+        for index, (_, x, y, z, width, height, length) in enumerate(coordinates):
+            self.assertLessEqual(x + width, self.box.width)
+            self.assertLessEqual(y + height, self.box.height)
+            self.assertLessEqual(z + length, self.box.length)
+            for _, other_x, other_y, other_z, other_width, other_height, other_length in coordinates[index + 1:]:
+                self.assertFalse(
+                    x < other_x + other_width and x + width > other_x and
+                    y < other_y + other_height and y + height > other_y and
+                    z < other_z + other_length and z + length > other_z
+                )
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            BoxResult(self.box, engine='unknown')
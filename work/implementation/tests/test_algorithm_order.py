@@ -1,11 +1,13 @@
 import unittest
 import csv
+import pickle
+import random
 import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from implementation.algorithm import Order
-from implementation.algorithm import Product
+from implementation.algorithm import Product, ProductDefinition
 
 # IMPORT FILE USING REFLECTION
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -33,6 +35,13 @@ class TestOrder(unittest.TestCase):
         test_get_total_volume: Test that the total volume of the order is the sum of the volumes of the products in the order.
         test_get_total_weight: Test that the total weight of the order is the sum of the weights of the products in the order.
         test_get_dimensions: Test that the dimensions of the order are the maximum dimensions of the products in the order.
+        test_take_run: Test that the take_run method removes the leading units of the same product from the order.
+        test_get_lines: Test that the get_lines method counts the pending units per product.
+        test_add_rejected_items: Test that the add_rejected_items method rejects several taken items at once.
+        test_reset_keeps_packing_order: Test that reset items are pending again at their sorted position.
+        test_item_states: Test that the state flags follow the items through the packing states.
+        test_running_aggregates: Test that the pending totals and maxima match a full pass over the pending items.
+        test_pickle_keeps_states: Test that an order sent to another process keeps the states of its items.
     """
 
     def setUp(self):
@@ -219,4 +228,143 @@ class TestOrder(unittest.TestCase):
         taken_item = self.order.take_item()
         self.assertIn(taken_item, self.order.taken_items)
         self.order.add_rejected_item(taken_item)
-        self.assertNotIn(taken_item, self.order.taken_items)
\ No newline at end of file
+        self.assertNotIn(taken_item, self.order.taken_items)
+
+    def test_take_run(self):
+        """
+        Test that the take_run method removes the leading units of the same product from the order.
+        """
+        definition = ProductDefinition(10, 20, 30, 500, 100, "Shake")
+        units = [Product.from_definition(definition, "06C01") for _ in range(3)]
+        order = Order("Order1", "2024-09-02", units + [self.products[0]])
+
+        run = order.take_run()
+
+        self.assertEqual(run, units)
+        self.assertEqual(order.items, [self.products[0]])
+        self.assertEqual(order.taken_items, units)
+        self.assertEqual(order.take_run(), [self.products[0]])
+        self.assertEqual(order.take_run(), [])
+
+    def test_get_lines(self):
+        """
+        Test that the get_lines method counts the pending units per product.
+        """
+        definition = ProductDefinition(10, 20, 30, 500, 100, "Shake")
+        units = [Product.from_definition(definition, "06C01") for _ in range(3)]
+        order = Order("Order1", "2024-09-02", units + [self.products[0]])
+
+        self.assertEqual(order.get_lines(), [(definition, 3), (self.products[0].definition, 1)])
+
+    def test_add_rejected_items(self):
+        """
+        Test that the add_rejected_items method rejects several taken items at once.
+        """
+        order = Order("Order1", "2024-09-02", list(self.products))
+        taken = [order.take_item(), order.take_item()]
+
+        order.add_rejected_items(taken)
+
+        self.assertEqual(order.rejected_items, taken)
+        self.assertEqual(order.taken_items, [])
+        self.assertEqual(len(order.items), len(self.products) - 2)
+
+    def test_reset_keeps_packing_order(self):
+        """
+        Test that reset items are pending again at their sorted position.
+        """
+        order = Order("Order1", "2024-09-02", list(self.products))
+        order.order_items()
+        expected = order.items
+
+        first = order.take_item()
+        run = order.take_run()
+        order.add_rejected_item(first)
+        order.reset_rejected_items()
+
+        self.assertEqual(order.items[0], first)
+        self.assertEqual(order.taken_items, run)
+
+        order.reset_all_items()
+
+        self.assertEqual(order.items, expected)
+        self.assertTrue(order.is_sorted)
+
+    def test_item_states(self):
+        """
+        Test that the state flags follow the items through the packing states.
+        """
+        order = Order("Order1", "2024-09-02", list(self.products[:3]))
+        first = order.take_item()
+        second = order.take_item()
+        order.add_rejected_item(second)
+        order.secure_packed_items()
+
+        self.assertEqual(order.states[order.positions[id(first)]], Order.PACKED)
+        self.assertEqual(order.states[order.positions[id(second)]], Order.REJECTED)
+        self.assertEqual(order.packed_items, [first])
+        self.assertEqual(order.rejected_items, [second])
+        self.assertEqual(order.items, [self.products[2]])
+        self.assertIsNone(order.take_specific_item(first))
+
+        order.reset_all_items()
+
+        self.assertEqual(order.items, [second, self.products[2]])
+        self.assertEqual(order.packed_items, [first])
+
+    def test_running_aggregates(self):
+        """
+        Test that the pending totals and maxima match a full pass over the pending items.
+        """
+        random.seed(7)
+        definitions = [ProductDefinition(random.randint(1, 50), random.randint(1, 50), random.randint(1, 50), random.randint(1, 900), 100, f"P{index}") for index in range(5)]
+        order = Order("Order1", "2024-09-02", [Product.from_definition(random.choice(definitions), "06C01") for _ in range(40)])
+        order.order_items()
+
+        for _ in range(60):
+            action = random.choice(["run", "reject", "secure", "reset", "reset_all"])
+            if action == "run":
+                order.take_run()
+            elif action == "reject" and order.taken_items:
+                order.add_rejected_item(random.choice(order.taken_items))
+            elif action == "secure":
+                order.secure_packed_items()
+            elif action == "reset":
+                order.reset_rejected_items()
+            elif action == "reset_all":
+                order.reset_all_items()
+
+            items = order.items
+            self.assertAlmostEqual(order.get_total_volume(), sum(item.volume() for item in items))
+            self.assertAlmostEqual(order.get_total_weight(), sum(item.weight for item in items))
+            if items:
+                self.assertEqual(order.get_dimensions(), [
+                    max(item.width for item in items),
+                    max(item.height for item in items),
+                    max(item.length for item in items)
+                ])
+
+    def test_pickle_keeps_states(self):
+        """
+        Test that an order sent to another process keeps the states of its items.
+        """
+        order = Order("Order1", "2024-09-02", list(self.products[:4]))
+        order.order_items()
+        first = order.take_item()
+        second = order.take_item()
+        order.add_rejected_item(second)
+        order.secure_packed_items()
+        third = order.take_item()
+
+        copy = pickle.loads(pickle.dumps(order))
+
+        self.assertEqual([item.item for item in copy.packed_items], [first.item])
+        self.assertEqual([item.item for item in copy.rejected_items], [second.item])
+        self.assertEqual([item.item for item in copy.taken_items], [third.item])
+        self.assertEqual([item.item for item in copy.items], [item.item for item in order.items])
+
+        copy.secure_packed_items()
+        copy.reset_all_items()
+
+        self.assertEqual([item.item for item in copy.packed_items], [first.item, third.item])
+        self.assertEqual([item.item for item in copy.items], [second.item] + [item.item for item in order.items])
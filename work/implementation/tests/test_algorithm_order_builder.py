@@ -0,0 +1,99 @@
+import unittest
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import OrderBuilder, OrderManager, ProductCatalog, SnapshotCache
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+class TestOrderBuilder(unittest.TestCase):
+    def setUp(self):
+        self.catalog = ProductCatalog([
+            {"ID": "Product_5252", "Width": 113, "Height": 208, "Length": 113, "Weight": 900.0, "Fit ratio": 100},
+            {"ID": "Product_2037", "Width": 45, "Height": 243, "Length": 113, "Weight": 560.0, "Fit ratio": 100},
+        ])
+        self.builder = OrderBuilder(self.catalog)
+
+    def build_columns(self, rows):
+        return {
+            'Date': np.array([row[0] for row in rows], dtype=str),
+            'Ordernr': np.array([row[1] for row in rows], dtype=str),
+            'ID': np.array([row[2] for row in rows], dtype=str),
+            'Picked': np.array([row[3] for row in rows], dtype=np.int64),
+            'Location': np.array([row[4] for row in rows], dtype=str),
+        }
+
+    def test_build_orders(self):
+        columns = self.build_columns([
+            ("5-12-2024 14:00", "B", "Product_2037", 1, "06C01"),
+            ("5-12-2024 15:00", "A", "Product_5252", 2, "06C02"),
+            ("5-12-2024 14:00", "B", "Product_5252", 1, "06C03"),
+        ])
+
+        orders = self.builder.build_orders(columns)
+
+        self.assertEqual([order.order_number for order in orders], ["B", "A"])
+        self.assertEqual(orders[0].date_time, "5-12-2024 14:00")
+        self.assertEqual(len(orders[0].items), 2)
+        self.assertEqual(len(orders[1].items), 2)
+        self.assertEqual({product.location for product in orders[1].items}, {"06C02"})
+        self.assertEqual(orders[1].items[0].width, 113.0)
+        self.assertIn(orders[1].items[0].definition, [product.definition for product in orders[0].items])
+
+    def test_unknown_product_is_skipped(self):
+        columns = self.build_columns([
+            ("5-12-2024 14:00", "A", "Unknown", 3, "06C01"),
+            ("5-12-2024 14:00", "A", "Product_2037", 1, "06C02"),
+        ])
+
+        orders = self.builder.build_orders(columns)
+
+        self.assertEqual(len(orders), 1)
+        self.assertEqual([product.item for product in orders[0].items], ["Product_2037"])
+
+    def test_invalid_picked_is_reported(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'orders.csv')
+            with open(file_path, 'w') as file:
+                file.write("Date,Ordernr,Picked,Location,ID\n")
+                file.write("5-12-2024 14:00,A,two,06C01,Product_5252\n")
+                file.write("5-12-2024 14:00,A,1,06C02,Product_2037\n")
+            columns = SnapshotCache(os.path.join(temp_dir, 'cache')).read_csv(file_path, {'Picked': int})
+
+            output = StringIO()
+            with redirect_stdout(output):
+                orders = self.builder.build_orders(columns)
+
+        self.assertEqual([product.item for product in orders[0].items], ["Product_2037"])
+        self.assertIn("Invalid picked quantity", output.getvalue())
+
+    def test_empty_columns(self):
+        self.assertEqual(self.builder.build_orders(self.build_columns([])), [])
+
+    def test_matches_create_order(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        order_manager = OrderManager(
+            orderline_file_path=os.path.join(current_dir, './test_files/order_with_few_items.csv'),
+            product_file_path=os.path.join(current_dir, './test_files/product_definitions.csv'),
+            snapshot_dir=temp_dir.name
+        )
+
+        orders = order_manager.process_orders()
+        grouped_orders = order_manager.group_by_order(order_manager.load_orders())
+        expected_orders = [order_manager.create_order(order) for order in grouped_orders.values()]
+
+        self.assertEqual(len(orders), len(expected_orders))
+        for order, expected_order in zip(orders, expected_orders):
+            self.assertEqual(order.order_number, expected_order.order_number)
+            self.assertEqual(
+                [(product.item, product.location) for product in order.items],
+                [(product.item, product.location) for product in expected_order.items]
+            )
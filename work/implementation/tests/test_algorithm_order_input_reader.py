@@ -1,9 +1,11 @@
 import unittest
 import os
 import sys
+import tempfile
+from unittest.mock import patch
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from implementation.algorithm import OrderInputReader
+from implementation.algorithm import OrderInputReader, SnapshotCache
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -11,25 +13,134 @@ class TestOrderInputReader(unittest.TestCase):
     def setUp(self):
         self.file_path = os.path.join(current_dir, './test_files/order_with_few_items.csv')
         self.reader = OrderInputReader()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.snapshot_cache = SnapshotCache(temp_dir.name)
 
     def test_read_csv(self):
-        self.reader.read_csv(self.file_path)
+        self.reader.read_csv(self.file_path, self.snapshot_cache)
         
         self.assertEqual(len(self.reader.get_data()), 32)
 
     def test_read_csv_no_reload(self):
-        self.reader.read_csv(self.file_path)
-        result = self.reader.read_csv(self.file_path)
+        self.reader.read_csv(self.file_path, self.snapshot_cache)
+        result = self.reader.read_csv(self.file_path, self.snapshot_cache)
         self.assertFalse(result)
 
     def test_get_data(self):
-        self.reader.read_csv(self.file_path)
+        self.reader.read_csv(self.file_path, self.snapshot_cache)
         data = self.reader.get_data()
         self.assertEqual(len(data), 32)
         self.assertEqual(data[0]['Ordernr'], '5R02891084')
         self.assertEqual(data[10]['Ordernr'], '4G01018426')
 
+    def test_rows_built_on_demand(self):
+        self.reader.last_loaded_time = None
+        self.reader.read_csv(self.file_path, self.snapshot_cache)
+
+        self.assertIsNone(self.reader.loaded_orders)
+        self.assertEqual(len(self.reader.get_columns()['Ordernr']), 32)
+        self.assertIs(self.reader.get_data(), self.reader.get_data())
+
     def test_singleton(self):
         reader1 = OrderInputReader()
         reader2 = OrderInputReader()
         self.assertIs(reader1, reader2)
+
+    def test_iter_orders(self):
+        orders = list(self.reader.iter_orders(self.file_path))
+
+        self.assertEqual(len(orders), 5)
+        self.assertEqual(sum(len(order) for order in orders), 32)
+        self.assertTrue(all(row['Ordernr'] == order[0]['Ordernr'] for order in orders for row in order))
+        self.assertEqual(orders[0][0]['Ordernr'], '5R02891084')
+
+    def write_unsorted_orders(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as file:
+            file.write("Date,Ordernr,Boxnr,Picked,Location,Box Name,Weight,ID\n")
+            file.write("9/2/2024 0:00:00,A,1,1,01A01,M,100,3359\n")
+            file.write("9/2/2024 0:00:00,B,2,1,01A01,M,100,3359\n")
+            file.write("9/2/2024 0:00:00,A,1,1,01A01,M,100,3372\n")
+
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def test_iter_orders_not_grouped(self):
+        with self.assertRaises(ValueError):
+            list(self.reader.iter_orders(self.write_unsorted_orders(), check_grouped=True))
+
+    def test_iter_orders_unchecked_splits_runs(self):
+        orders = list(self.reader.iter_orders(self.write_unsorted_orders()))
+
+        self.assertEqual([order[0]['Ordernr'] for order in orders], ['A', 'B', 'A'])
+
+    def test_iter_orders_auto_grouped(self):
+        with patch.object(OrderInputReader, 'partition_order_lines') as partition_order_lines:
+            orders = list(self.reader.iter_orders_auto(self.file_path))
+
+        partition_order_lines.assert_not_called()
+        self.assertEqual(orders, list(self.reader.iter_orders(self.file_path)))
+
+    def test_iter_orders_auto_not_grouped(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as file:
+            file.write("Date,Ordernr,Boxnr,Picked,Location,Box Name,Weight,ID\n")
+            for order_id in ['A', 'B', 'B', 'C', 'D', 'C', 'E', 'F', 'E', 'F']:
+                file.write(f"9/2/2024 0:00:00,{order_id},1,1,01A01,M,100,3359\n")
+        self.addCleanup(os.remove, file.name)
+
+        orders = list(self.reader.iter_orders_auto(file.name, partition_count=2))
+        orders_by_number = {}
+        for order in orders:
+            orders_by_number.setdefault(order[0]['Ordernr'], []).append(len(order))
+
+        # Every order is yielded once, with all of its lines
+        self.assertEqual(orders_by_number, {'A': [1], 'B': [2], 'C': [2], 'D': [1], 'E': [2], 'F': [2]})
+
+    def test_is_grouped(self):
+        self.assertTrue(self.reader.is_grouped(self.file_path))
+        self.assertFalse(self.reader.is_grouped(self.write_unsorted_orders()))
+
+    def test_partition_count_from_budget(self):
+        file_size = os.path.getsize(self.file_path)
+
+        with patch.object(OrderInputReader, 'partition_memory_budget', file_size * OrderInputReader.partition_row_overhead / 2.5):
+            self.assertEqual(self.reader.get_partition_count(self.file_path), 3)
+
+        with patch.object(OrderInputReader, 'partition_memory_budget', 1):
+            self.assertEqual(self.reader.get_partition_count(self.file_path), OrderInputReader.max_partition_count)
+
+        self.assertEqual(self.reader.get_partition_count(self.file_path), 1)
+
+    def test_partition_count_below_one(self):
+        with self.assertRaises(ValueError):
+            self.reader.partition_order_lines(self.file_path, partition_count=0)
+
+    def test_iter_orders_partitioned_splits_oversized_partitions(self):
+        with patch.object(OrderInputReader, 'partition_memory_budget', 3000), \
+                patch.object(OrderInputReader, 'read_partition', wraps=OrderInputReader.read_partition) as read_partition:
+            orders = list(self.reader.iter_orders_partitioned(self.file_path, partition_count=2))
+
+        self.assertGreater(read_partition.call_count, 2)
+        self.assertEqual(sorted(len(order) for order in orders), sorted(len(order) for order in self.reader.iter_orders(self.file_path)))
+
+    def test_iter_orders_partitioned(self):
+        orders = list(self.reader.iter_orders_partitioned(self.write_unsorted_orders(), partition_count=4))
+        orders_by_number = {order[0]['Ordernr']: order for order in orders}
+
+        self.assertEqual(len(orders), 2)
+        self.assertEqual([row['ID'] for row in orders_by_number['A']], ['3359', '3372'])
+        self.assertEqual([row['ID'] for row in orders_by_number['B']], ['3359'])
+
+    def test_iter_orders_partitioned_removes_partitions(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            list(self.reader.iter_orders_partitioned(self.file_path, partition_count=4, temp_dir=temp_dir))
+            self.assertEqual(os.listdir(temp_dir), [])
+
+    def test_read_partition(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            partitions = self.reader.partition_order_lines(self.file_path, partition_count=3, temp_dir=temp_dir)
+            grouped = [OrderInputReader.read_partition(partition) for partition in partitions]
+
+        self.assertEqual(len(partitions), 3)
+        self.assertEqual(sum(len(orders) for orders in grouped), 5)
+        self.assertEqual(sum(len(lines) for orders in grouped for lines in orders.values()), 32)
@@ -1,6 +1,7 @@
 import unittest
 import os
 import sys
+import tempfile
 from unittest.mock import MagicMock
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -14,9 +15,12 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 class TestOrderManager(unittest.TestCase):
 
     def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
         self.order_manager = OrderManager(
             orderline_file_path=os.path.join(current_dir, './test_files/order_with_few_items.csv'),
-            product_file_path=os.path.join(current_dir, './test_files/product_definitions.csv')
+            product_file_path=os.path.join(current_dir, './test_files/product_definitions.csv'),
+            snapshot_dir=temp_dir.name
         )
 
     def test_load_products(self):
@@ -33,6 +37,20 @@ class TestOrderManager(unittest.TestCase):
         self.assertEqual(len(grouped_orders), 5)
 
 
+    def test_iter_orders(self):
+        orders = list(self.order_manager.iter_orders())
+
+        self.assertEqual(len(orders), 5)
+        self.assertEqual(orders[0].order_number, '5R02891084')
+        self.assertEqual(len(orders[0].items), 9)
+
+    def test_iter_orders_partitioned(self):
+        orders = list(self.order_manager.iter_orders(grouped=False, partition_count=3))
+        orders_by_number = {order.order_number: order for order in orders}
+
+        self.assertEqual(len(orders), 5)
+        self.assertEqual(len(orders_by_number['5R02891084'].items), 9)
+
     def test_create_order1(self):
         orders = self.order_manager.load_orders()
         grouped_orders = self.order_manager.group_by_order(orders)
@@ -1,10 +1,11 @@
 import unittest
 import os
 import sys
+from unittest.mock import patch
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from implementation.algorithm import BoxInputReader, BoxResult, Order, Packer, Product
+from implementation.algorithm import BoxInputReader, BoxResult, Order, Packer, Product, ProductDefinition
 
 # IMPORT FILE USING REFLECTION
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -95,3 +96,101 @@ class TestPacker(unittest.TestCase):
 
         packer.pack_order(order, self.boxes)
         self.assertEqual(len(order.packed_items), 2)
+
+    def test_single_product_order_uses_grid(self):
+        definition = ProductDefinition(50, 50, 50, 50, 100, "Shake")
+        products = [Product.from_definition(definition, "Fontys") for _ in range(8)]
+        order = Order("NMR230202", "1990-01-01", products)
+
+        self.packer.pack_order(order, self.boxes)
+        box_result = self.packer.orderResults[-1].boxes[0]
+
+        self.assertEqual(len(order.packed_items), 8)
+        self.assertEqual(len(box_result.get_layers()), 1)
+        self.assertEqual(box_result.get_layers()[0].remaining_spaces, [])
+        self.assertEqual(
+            len({position.get_coordinates() for position in box_result.get_all_coordinates()}), 8
+        )
+
+    def test_grid_capacity_is_cached(self):
+        definition = ProductDefinition(50, 50, 50, 50, 100, "Shake")
+
+        capacity = self.packer.get_grid_capacity(definition, self.boxes[1])
+
+        self.assertIs(self.packer.get_grid_capacity(definition, self.boxes[1]), capacity)
+        self.assertEqual(capacity[0], 8 * 8 * 10)
+
+    def test_grid_box_selection_skips_small_boxes(self):
+        # A low fit ratio lets the XS box pass the volume check, but 20 cubes exceed its volume
+        definition = ProductDefinition(100, 100, 100, 50, 40, "Shake")
+        packer = Packer()
+        packer.sorted_boxes = self.boxes
+        packer.order = Order("NMR230204", "1990-01-01", [Product.from_definition(definition, "Fontys") for _ in range(20)])
+
+        box = packer.initial_box_selection()
+
+        self.assertEqual(box.container_type, "S")
+        self.assertLess(packer.grid_capacities[(definition, packer.sorted_boxes[4])][0], 20)
+        self.assertGreaterEqual(packer.grid_capacities[(definition, box)][0], 20)
+
+        packer.pack_order(packer.order, self.boxes)
+        self.assertEqual([box_result.box.container_type for box_result in packer.orderResults[-1].boxes], ["S"])
+
+    def test_single_product_order_skips_small_boxes(self):
+        definition = ProductDefinition(100, 100, 100, 50, 100, "Shake")
+        products = [Product.from_definition(definition, "Fontys") for _ in range(20)]
+        order = Order("NMR230203", "1990-01-01", products)
+
+        self.packer.pack_order(order, self.boxes)
+
+        self.assertEqual(len(order.packed_items), 20)
+        for box_result in self.packer.orderResults[-1].boxes:
+            self.assertGreaterEqual(
+                box_result.box.width * box_result.box.height * box_result.box.length,
+                len(box_result.get_all_coordinates()) * 100 ** 3
+            )
+
+    def test_engine_report_per_box_type(self):
+        definition = ProductDefinition(100, 100, 100, 50, 100, "Shake")
+        products = [Product.from_definition(definition, "Fontys") for _ in range(3)] + [Product(50, 60, 70, 50, 100, "Tea", "Fontys")]
+        order = Order("NMR230204", "1990-01-01", products)
+        packer = Packer(engine={'L': 'skyline', 'default': 'layers'})
+
+        packer.pack_order(order, self.boxes)
+
+        self.assertEqual(len(order.packed_items), 4)
+        for box_result in packer.orderResults[-1].boxes:
+            self.assertEqual(box_result.engine, 'skyline' if box_result.box.container_type == 'L' else 'layers')
+        self.assertEqual(sum(report['boxes'] for report in packer.engine_report.values()), len(packer.orderResults[-1].boxes))
+        self.assertTrue(all(report['seconds'] >= 0 for report in packer.engine_report.values()))
+
+    def test_box_upgrade_reuses_layout(self):
+        definitions = [ProductDefinition(110, 70, 50, 50, 100, "Shake"), ProductDefinition(90, 80, 35, 50, 100, "Tea")]
+        results = []
+
+        for reuse_layouts in (False, True):
+            products = [Product.from_definition(definitions[index % 2], "Fontys") for index in range(20)]
+            order = Order("NMR230205", "1990-01-01", products)
+            packer = Packer()
+            packer.reuse_layouts = reuse_layouts
+
+            with patch.object(BoxResult, 'seed_layout', autospec=True, side_effect=BoxResult.seed_layout) as seed_layout:
+                packer.pack_order(order, self.boxes)
+
+            self.assertEqual(seed_layout.called, reuse_layouts)
+            self.assertEqual(len(order.packed_items), 20)
+            self.assertEqual(order.items, [])
+            results.append(packer.orderResults[-1].boxes)
+
+        for box_result in results[1]:
+            coordinates = box_result.collect_existing_coordinates()
+            for index, (_, x, y, z, width, height, length) in enumerate(coordinates):
+                self.assertLessEqual(x + width, box_result.box.width)
+                self.assertLessEqual(y + height, box_result.box.height)
+                self.assertLessEqual(z + length, box_result.box.length)
+                for _, other_x, other_y, other_z, other_width, other_height, other_length in coordinates[index + 1:]:
+                    self.assertFalse(
+                        x < other_x + other_width and x + width > other_x and
+                        y < other_y + other_height and y + height > other_y and
+                        z < other_z + other_length and z + length > other_z
+                    )
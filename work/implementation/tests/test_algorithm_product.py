@@ -1,9 +1,10 @@
 import unittest
 import os
+import pickle
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from implementation.algorithm import Product
+from implementation.algorithm import Product, ProductDefinition
 
 class TestProduct(unittest.TestCase):
     def setUp(self):
@@ -38,3 +39,42 @@ class TestProduct(unittest.TestCase):
         product8 = Product(100, 1, 10, 500, 100, "Product8", 1)
 
         self.assertEqual(product7.__lt__(product8), True)  # Compare by individual dimensions
+
+    def test_shared_definition(self):
+        definition = ProductDefinition(10, 20, 30, 500, 100, "Product9")
+        unit1 = Product.from_definition(definition, "06C01")
+        unit2 = Product.from_definition(definition, "06C02")
+
+        self.assertIs(unit1.definition, unit2.definition)
+        self.assertEqual(unit1.get_dimensions(), (10, 20, 30))
+        self.assertEqual(unit2.location, "06C02")
+        self.assertEqual(unit1.__lt__(unit2), False)
+
+    def test_definition_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.product1.definition.width = 5
+        with self.assertRaises(AttributeError):
+            self.product1.width = 5
+
+    def test_pickle_keeps_shared_definition(self):
+        definition = ProductDefinition(10, 20, 30, 500, 100, "Product9")
+        units = pickle.loads(pickle.dumps([Product.from_definition(definition, location) for location in range(3)]))
+
+        self.assertIs(units[0].definition, units[2].definition)
+        self.assertEqual(units[1].location, 1)
+        self.assertEqual(units[1].item, "Product9")
+
+    def test_sort_key_matches_compare(self):
+        long_product = Product(1, 1, 100, 50, 100, "Product7", 7)  # Largest sum of dimensions, smallest volume
+        products = [self.product5, self.product4, long_product, self.product6, self.product2, self.product1]
+
+        # Packing order of the former comparison: sum of dimensions, then effective volume, then weight
+        expected = sorted(products, key=lambda item: (sum(item.get_dimensions()), item.volume(), item.weight), reverse=True)
+        by_key = sorted(products, key=lambda item: item.sort_key, reverse=True)
+        by_compare = sorted(products, reverse=True)
+
+        self.assertEqual(by_key, expected)
+        self.assertEqual(by_compare, expected)
+        self.assertEqual(expected, [long_product, self.product2, self.product1, self.product4, self.product6, self.product5])
+        self.assertEqual(self.product1.sort_key, (60, 6000, 500))
+        self.assertEqual(pickle.loads(pickle.dumps(self.product6)).sort_key, self.product6.sort_key)
@@ -0,0 +1,59 @@
+import unittest
+import os
+import sys
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import OrderManager, ProductCatalog, ProductInputReader, SnapshotCache
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+class TestProductCatalog(unittest.TestCase):
+    def setUp(self):
+        self.file_path = os.path.join(current_dir, './test_files/product_definitions.csv')
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.snapshot_dir = temp_dir.name
+        reader = ProductInputReader()
+        reader.read_csv(self.file_path, SnapshotCache(self.snapshot_dir))
+        self.catalog = ProductCatalog(reader.get_data())
+
+    def test_len(self):
+        self.assertEqual(len(self.catalog), 5)
+
+    def test_get(self):
+        self.assertEqual(self.catalog.get('3359'), (200.0, 10.0, 300.0, 462.0, 100.0))
+
+    def test_get_definition(self):
+        definition = self.catalog.get_definition('3359')
+
+        self.assertEqual(definition.item, '3359')
+        self.assertEqual(definition.width, 200.0)
+        self.assertIs(self.catalog.get_definition('3359'), definition)
+
+    def test_get_unknown_product(self):
+        self.assertIsNone(self.catalog.get('999999'))
+        self.assertIsNone(self.catalog.get_definition('999999'))
+        self.assertNotIn('999999', self.catalog)
+
+    def test_skips_invalid_product(self):
+        catalog = ProductCatalog([
+            {"ID": "Valid", "Width": 1, "Height": 2, "Length": 3, "Weight": 4, "Fit ratio": 100},
+            {"ID": "Invalid", "Width": "abc", "Height": 2, "Length": 3, "Weight": 4, "Fit ratio": 100},
+        ])
+
+        self.assertIn("Valid", catalog)
+        self.assertNotIn("Invalid", catalog)
+
+    def test_order_manager_builds_catalog_once(self):
+        order_manager = OrderManager(
+            orderline_file_path=os.path.join(current_dir, './test_files/order_with_few_items.csv'),
+            product_file_path=self.file_path,
+            snapshot_dir=self.snapshot_dir
+        )
+
+        catalog = order_manager.load_catalog()
+        self.assertIs(order_manager.load_catalog(), catalog)
+
+        order_manager.reset(order_manager.orderline_file_path, order_manager.product_file_path)
+        self.assertIsNot(order_manager.load_catalog(), catalog)
@@ -1,9 +1,10 @@
 import unittest
 import os
 import sys
+import tempfile
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from implementation.algorithm import ProductInputReader
+from implementation.algorithm import ProductInputReader, SnapshotCache
 
 # IMPORT FILE USING REFLECTION
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,19 +13,22 @@ class TestProductInputReader(unittest.TestCase):
     def setUp(self):
         self.file_path = os.path.join(current_dir, './test_files/product_definitions.csv')
         self.reader = ProductInputReader()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.snapshot_cache = SnapshotCache(temp_dir.name)
 
     def test_read_csv(self):
-        self.reader.read_csv(self.file_path)
+        self.reader.read_csv(self.file_path, self.snapshot_cache)
         
         self.assertEqual(len(self.reader.get_data()), 5)
 
     def test_read_csv_no_reload(self):
-        self.reader.read_csv(self.file_path)
-        result = self.reader.read_csv(self.file_path)
+        self.reader.read_csv(self.file_path, self.snapshot_cache)
+        result = self.reader.read_csv(self.file_path, self.snapshot_cache)
         self.assertFalse(result)
 
     def test_get_data(self):
-        self.reader.read_csv(self.file_path)
+        self.reader.read_csv(self.file_path, self.snapshot_cache)
         data = self.reader.get_data()
         self.assertEqual(len(data), 5)
         self.assertEqual(data[0]['ID'], '3359')
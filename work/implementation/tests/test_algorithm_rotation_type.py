@@ -128,3 +128,19 @@ class TestRotationType(unittest.TestCase):
         self.assertEqual(self.rotation.adjust_dimensions(0, 0, 0), (0, 0, 0))
         self.rotation = self.rotation.next_rotation()
         self.assertEqual(self.rotation.adjust_dimensions(0, 0, 0), (0, 0, 0))
+
+    def test_adjust_dimensions(self):
+        self.assertEqual(
+            [rotation.adjust_dimensions(1, 2, 3) for rotation in RotationType],
+            [(1, 2, 3), (3, 2, 1), (2, 1, 3), (3, 1, 2), (2, 3, 1), (1, 3, 2)]
+        )
+
+    def test_rotation_table(self):
+        self.assertEqual(len(RotationType.rotation_table(10, 10, 10)), 1)
+        self.assertEqual(len(RotationType.rotation_table(10, 20, 10)), 3)
+        self.assertEqual(len(RotationType.rotation_table(10, 20, 30)), 6)
+        self.assertEqual(len(RotationType.rotation_table(10, 20, 30, count=5)), 5)
+
+        table = RotationType.rotation_table(10, 20, 30, RotationType.RT1)
+        self.assertEqual([rotation for rotation, _ in table], list(RotationType))
+        self.assertEqual(RotationType.rotation_table(10, 20, 30)[0][0], RotationType.initial_rotation(10, 20, 30))
@@ -0,0 +1,92 @@
+import unittest
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import BoxDefinition, BoxResult, Order, Position, Product, RotationType, SkylineLayerResult
+
+class TestSkylineLayerResult(unittest.TestCase):
+    def setUp(self):
+        self.box = BoxDefinition(410, 300, 240, 430, 19570, "Carton small", "S", "Small cartons", 80.0, 5.0)
+        self.layer = SkylineLayerResult(self.box)
+        self.product = Product(10, 20, 30, 500, 100, "Product1", 1)
+
+    def add(self, product):
+        position = Position(product, 0, 0, 0, RotationType.initial_rotation(*product.get_dimensions()))
+        return self.layer.add_product(position, [])
+
+    def test_first_placement_raises_footprint(self):
+        self.assertTrue(self.add(self.product))
+        placed = self.layer.get_positions()[0]
+        x, y, z = placed.get_coordinates()
+        end_x, end_y, end_z = placed.calculate_extending_point()
+
+        self.assertEqual((x, y, z), (0, 0, 0))
+        self.assertEqual(self.layer.xs, [0, end_x, self.box.width])
+        self.assertEqual(self.layer.zs, [0, end_z, self.box.length])
+        self.assertEqual(self.layer.heights[0, 0], end_y)
+        self.assertEqual(self.layer.heights[1, 1], 0)
+        self.assertEqual(self.layer.supports, [1.0])
+
+    def test_window_maxima(self):
+        heights = np.array([[1.0, 5.0, 2.0], [3.0, 0.0, 4.0]])
+
+        bases = SkylineLayerResult.window_maxima(heights, np.array([0, 1]), np.array([2, 2]), np.array([0, 1, 2]), np.array([1, 3, 3]))
+
+        np.testing.assert_array_equal(bases, [[3.0, 5.0, 4.0], [3.0, 4.0, 4.0]])
+
+    def test_support(self):
+        self.layer.raise_skyline(0, 0, 10, self.box.length, 20)
+        self.layer.raise_skyline(20, 0, self.box.width - 20, self.box.length, self.box.height - 1)
+
+        placement = self.layer.lowest_placement(20, 10, self.box.length)
+
+        self.assertEqual(placement, (20, 0, 0, 0.5))
+
+    def test_min_support(self):
+        self.layer.raise_skyline(0, 0, 10, self.box.length, 20)
+        self.layer.raise_skyline(10, 0, 10, self.box.length, self.box.height - 5)
+        self.layer.raise_skyline(20, 0, self.box.width - 20, self.box.length, self.box.height)
+
+        self.assertEqual(self.layer.lowest_placement(20, 5, self.box.length)[3], 0.5)
+
+        self.layer.min_support = 0.6
+
+        self.assertIsNone(self.layer.lowest_placement(20, 5, self.box.length))
+
+    def test_box_result_engine(self):
+        random.seed(5)
+        definitions = [(15, 25, 35), (40, 10, 60), (22, 22, 22), (5, 70, 30)]
+        products = [Product(*random.choice(definitions), 500, 100, "Product", 1) for _ in range(80)]
+        box_result = BoxResult(self.box, engine='skyline')
+
+        box_result.pack_products_by_order(Order("OrderNumber", "0", products))
+        coordinates = box_result.collect_existing_coordinates()
+
+        self.assertEqual(len(box_result.get_layers()), 1)
+        self.assertEqual(len(coordinates) + len(box_result.get_leftover_products()), 80)
+        for index, (_, x, y, z, width, height, length) in enumerate(coordinates):
+            self.assertLessEqual(x + width, self.box.width)
+            self.assertLessEqual(y + height, self.box.height)
+            self.assertLessEqual(z + length, self.box.length)
+            for _, other_x, other_y, other_z, other_width, other_height, other_length in coordinates[index + 1:]:
+                self.assertFalse(
+                    x < other_x + other_width and x + width > other_x and
+                    y < other_y + other_height and y + height > other_y and
+                    z < other_z + other_length and z + length > other_z
+                )
+
+    def test_select_engine_per_box_type(self):
+        engines = {'S': 'skyline', 'default': 'extreme_point'}
+        other = BoxDefinition(410, 300, 240, 430, 19570, "Carton large", "L", "Large cartons", 80.0, 5.0)
+
+        self.assertEqual(BoxResult(self.box, engine=engines).layer_class, SkylineLayerResult)
+        self.assertEqual(BoxResult(other, engine=engines).engine, 'extreme_point')
+        self.assertEqual(BoxResult.select_engine({'S': 'skyline'}, other), 'layers')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import SnapshotCache
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+class TestSnapshotCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+        self.cache = SnapshotCache(os.path.join(self.temp_dir, 'cache'))
+        self.file_path = os.path.join(self.temp_dir, 'products.csv')
+        shutil.copy(os.path.join(current_dir, './test_files/product_definitions.csv'), self.file_path)
+        self.column_types = {'Weight': float, 'Width': float}
+
+    def test_read_csv_types(self):
+        columns = self.cache.read_csv(self.file_path, self.column_types)
+
+        self.assertEqual(columns['Weight'].dtype, np.float64)
+        self.assertEqual(columns['ID'].tolist()[0], '3359')
+        self.assertEqual(columns['Weight'].tolist()[0], 462.0)
+        self.assertEqual(len(columns['ID']), 5)
+
+    def test_snapshot_is_reused(self):
+        self.cache.read_csv(self.file_path, self.column_types)
+        columns = self.cache.load(self.file_path, self.column_types)
+
+        self.assertIsNotNone(columns)
+        self.assertIsInstance(columns['Weight'], np.memmap)
+        self.assertEqual(columns['Width'].tolist(), [200.0, 200.0, 245.0, 60.0, 55.0])
+
+    def test_snapshot_invalidated_by_change(self):
+        self.cache.read_csv(self.file_path, self.column_types)
+
+        with open(self.file_path, 'a') as file:
+            file.write("\n9999,1,2,3,4,EA,100,1\n")
+
+        self.assertIsNone(self.cache.load(self.file_path, self.column_types))
+        self.assertEqual(len(self.cache.read_csv(self.file_path, self.column_types)['ID']), 6)
+
+    def test_snapshot_invalidated_by_column_types(self):
+        self.cache.read_csv(self.file_path, self.column_types)
+
+        self.assertIsNone(self.cache.load(self.file_path, {'Weight': int}))
+
+    def test_invalid_values(self):
+        with open(self.file_path, 'a') as file:
+            file.write("\n9999,heavy,2,wide,4,EA,100,1\n")
+
+        columns = self.cache.read_csv(self.file_path, {'Weight': float, 'Width': int})
+
+        self.assertTrue(np.isnan(columns['Weight'][-1]))
+        self.assertEqual(columns['Width'][-1], SnapshotCache.INVALID_INT)
+
+    def test_to_rows(self):
+        rows = SnapshotCache.to_rows(self.cache.read_csv(self.file_path, self.column_types))
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['ID'], '3359')
+        self.assertEqual(rows[0]['Weight'], 462.0)
+        self.assertIsInstance(rows[0]['Weight'], float)
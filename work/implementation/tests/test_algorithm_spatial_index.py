@@ -0,0 +1,46 @@
+import unittest
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import BoxDefinition, Position, Product, RotationType, SpatialGrid
+from implementation.algorithm.layer_result import check_collision
+
+class TestSpatialGrid(unittest.TestCase):
+    def setUp(self):
+        self.box = BoxDefinition(410, 300, 240, 430, 19570, "Carton small", "S", "Small cartons", 80.0, 5.0)
+        self.grid = SpatialGrid(self.box)
+        self.grid.append(('Product1', 0, 0, 0, 10, 20, 30))
+
+    def test_find_collision(self):
+        self.assertEqual(self.grid.find_collision(5, 5, 5, 10, 10, 10)[0], 'Product1')
+
+    def test_touching_is_no_collision(self):
+        self.assertIsNone(self.grid.find_collision(10, 0, 0, 10, 20, 30))
+        self.assertIsNone(self.grid.find_collision(0, 20, 0, 10, 20, 30))
+
+    def test_outside_box_is_clamped(self):
+        self.grid.append(('Product2', -50, 500, 0, 20, 20, 20))
+
+        self.assertEqual(self.grid.find_collision(-45, 505, 5, 5, 5, 5)[0], 'Product2')
+
+    def test_iteration(self):
+        self.assertEqual(list(self.grid), [('Product1', 0, 0, 0, 10, 20, 30)])
+        self.assertEqual(len(self.grid), 1)
+
+    def test_check_collision_matches_list(self):
+        random.seed(7)
+        coordinates = [
+            (f'Product{i}', random.uniform(0, 200), random.uniform(0, 250), random.uniform(0, 380),
+             random.uniform(1, 60), random.uniform(1, 60), random.uniform(1, 60))
+            for i in range(60)
+        ]
+        grid = SpatialGrid(self.box, coordinates)
+
+        for _ in range(200):
+            product = Product(random.uniform(1, 60), random.uniform(1, 60), random.uniform(1, 60), 10, 100, "Probe", 1)
+            position = Position(product, random.uniform(0, 240), random.uniform(0, 300), random.uniform(0, 410), RotationType.RT1)
+
+            self.assertEqual(check_collision(position, grid), check_collision(position, coordinates))
@@ -2,6 +2,7 @@ from multiprocessing import Manager
 import unittest
 import os
 import sys
+import tempfile
 
 from implementation.algorithm import BoxInputReader, Order, Product
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -13,6 +14,9 @@ class TestSystem(unittest.TestCase):
         self.orderline_file_path = './data/demo_order.csv'
         self.product_file_path = './data/demo_products.csv'
         self.output_file_path = './data/demo_output.csv'
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.snapshot_dir = temp_dir.name
       
     def test_static_method(self):
         # Arrange
@@ -38,7 +42,7 @@ class TestSystem(unittest.TestCase):
 
     def test_process_success(self):
         # Arrange
-        system = System(self.output_file_path)
+        system = System(self.output_file_path, snapshot_dir=self.snapshot_dir)
         output = None
         current_dir = os.path.dirname(os.path.abspath(__file__))
         combined_path = os.path.join(current_dir, '../algorithm', self.output_file_path)
@@ -53,4 +57,29 @@ class TestSystem(unittest.TestCase):
         self.assertTrue(len(system.packers) > 0)
         self.assertEqual(len(output), 8)
         self.assertEqual(output[0].strip(), 'Order ID,Box ID,Box Type,Box Width,Box Height,Box Depth,Item Name,Item Width,Item Height,Item Depth,Item Position X,Item Position Y,Item Position Z')
-      
\ No newline at end of file
+      
+    def test_process_streaming(self):
+        # Arrange
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        orderline_file_path = os.path.join(current_dir, './test_files/order_with_few_items.csv')
+        product_file_path = os.path.join(current_dir, './test_files/product_definitions.csv')
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        output_file_path = os.path.join(temp_dir.name, 'streaming_output.csv')
+        system = System(output_file_path, snapshot_dir=self.snapshot_dir)
+        system.streaming_batch_size = 2
+
+        # Act
+        system.start_processing(orderline_file_path, product_file_path, streaming=True)
+
+        with open(output_file_path, 'r') as file:
+            output = file.readlines()
+
+        # Assert
+        self.assertEqual(system.order_count, 5)
+        self.assertEqual(system.packers, [])
+        self.assertEqual(len(output), 41)  # Header and one row per picked unit
+        self.assertTrue(output[0].startswith('Order ID,Box ID,Box Type'))
+        # The engine report also counts the boxes that were tried before a larger box
+        self.assertGreaterEqual(sum(report['boxes'] for report in system.streamed_engine_report.values()),
+                                len({tuple(line.split(',')[:2]) for line in output[1:]}))
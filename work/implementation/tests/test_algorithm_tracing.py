@@ -0,0 +1,60 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from implementation.algorithm import BoxDefinition, LayerResult, Position, Product, RotationType, Tracer
+from implementation.algorithm.tracing import get_tracer
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        Tracer.configure(set(), set())
+
+    def tearDown(self):
+        Tracer.order = None
+        Tracer.configure()
+
+    def test_inactive_by_default(self):
+        tracer = get_tracer('layer')
+
+        self.assertFalse(tracer.active)
+        self.assertIs(get_tracer('layer'), tracer)
+
+    def test_configure_subsystems(self):
+        Tracer.configure({'layer'}, set())
+
+        self.assertTrue(get_tracer('layer').active)
+        self.assertFalse(get_tracer('collision').active)
+
+        Tracer.configure({'all'}, set())
+
+        self.assertTrue(get_tracer('collision').active)
+
+    def test_order_filter(self):
+        tracer = get_tracer('layer')
+        Tracer.configure({'layer'}, {'1001'})
+
+        Tracer.set_order('1002')
+        self.assertFalse(tracer.active)
+
+        Tracer.set_order(1001)
+        self.assertTrue(tracer.active)
+
+    def test_parse_list(self):
+        self.assertEqual(Tracer.parse_list(" layer, box ,,"), ['layer', 'box'])
+        self.assertEqual(Tracer.parse_list(""), [])
+
+    def test_layer_messages(self):
+        box = BoxDefinition(410, 300, 240, 430, 19570, "Carton small", "S", "Small cartons", 80.0, 5.0)
+        product = Product(12, 18, 25, 500, 80, "Product1", 1)
+        position = Position(product, 0, 0, 0, RotationType.RT1)
+        Tracer.configure({'layer'}, set())
+
+        with self.assertLogs('algorithm.trace.layer', level='DEBUG') as logs:
+            self.assertTrue(LayerResult(box).add_product(position, []))
+
+        self.assertTrue(any("Product1" in message for message in logs.output))
+
+if __name__ == '__main__':
+    unittest.main()